@@ -0,0 +1,274 @@
+import argparse
+import json
+import logging
+import os
+from datetime import datetime
+
+from get_cfl_game_stats import (
+    get_cfl_player_game_stats,
+    get_cfl_team_game_stats
+)
+from get_cfl_pbp import get_cfl_season_pbp_data
+from get_schedules import get_cfl_schedules
+from get_transactions import get_cfl_transactions
+from parquet_io import write_parquet
+from schemas import SCHEDULE_ARROW_SCHEMA, TRANSACTIONS_ARROW_SCHEMA
+
+# Every data product `run_backfill()` can rebuild, in the order they run.
+BACKFILL_PRODUCTS = (
+    "schedule",
+    "pbp",
+    "player_stats",
+    "team_stats",
+    "transactions",
+)
+BACKFILL_CHECKPOINT = "cache/backfill/checkpoint.json"
+
+
+def get_current_season() -> int:
+    """
+    Return the CFL season that is currently being played
+    (or the last one, before May).
+    """
+    now = datetime.now()
+    season = now.year
+
+    if now.month < 5:
+        season -= 1
+    return season
+
+
+def load_backfill_checkpoint() -> dict:
+    """
+    Load the backfill checkpoint.
+
+    Returns
+    ----------
+    A `dict` keyed by season (as a string),
+    then by data product, with when that product
+    was completed for that season, and how many rows it had.
+    """
+    try:
+        with open(BACKFILL_CHECKPOINT, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except ValueError as e:
+        logging.warning(f"Ignoring the unreadable backfill checkpoint: {e}")
+        return {}
+
+
+def save_backfill_checkpoint(checkpoint: dict):
+    """
+    Save the backfill checkpoint.
+    """
+    os.makedirs(os.path.dirname(BACKFILL_CHECKPOINT), exist_ok=True)
+    with open(f"{BACKFILL_CHECKPOINT}.tmp", "w") as f:
+        json.dump(checkpoint, f, indent=4, sort_keys=True)
+    os.replace(f"{BACKFILL_CHECKPOINT}.tmp", BACKFILL_CHECKPOINT)
+
+
+def backfill_schedule(season: int, workers: int = None) -> int:
+    """ """
+    schedule_df = get_cfl_schedules(season)
+    schedule_df.to_csv(f"schedule/{season}_cfl_schedule.csv", index=False)
+    write_parquet(
+        schedule_df,
+        f"schedule/{season}_cfl_schedule.parquet",
+        SCHEDULE_ARROW_SCHEMA
+    )
+    return len(schedule_df)
+
+
+def backfill_pbp(season: int, workers: int = None) -> int:
+    """ """
+    # Every parsed game is checkpointed in the pbp manifest
+    # (see `get_cfl_pbp.get_incremental_cfl_pbp_games()`),
+    # so an interrupted season picks up from the last kept game.
+    pbp_df = get_cfl_season_pbp_data(
+        season,
+        incremental=True,
+        workers=workers
+    )
+    return len(pbp_df)
+
+
+def backfill_player_stats(season: int, workers: int = None) -> int:
+    """ """
+    return len(get_cfl_player_game_stats(season))
+
+
+def backfill_team_stats(season: int, workers: int = None) -> int:
+    """ """
+    return len(get_cfl_team_game_stats(season))
+
+
+def backfill_transactions(season: int, workers: int = None) -> int:
+    """ """
+    transactions_df = get_cfl_transactions(season)
+    if len(transactions_df) > 0:
+        transactions_df.to_csv(
+            f"transactions/{season}_cfl_transactions.csv",
+            index=False
+        )
+        write_parquet(
+            transactions_df,
+            f"transactions/{season}_cfl_transactions.parquet",
+            TRANSACTIONS_ARROW_SCHEMA
+        )
+    return len(transactions_df)
+
+
+BACKFILL_STEPS = {
+    "schedule": backfill_schedule,
+    "pbp": backfill_pbp,
+    "player_stats": backfill_player_stats,
+    "team_stats": backfill_team_stats,
+    "transactions": backfill_transactions,
+}
+
+# The directories each data product is saved in.
+BACKFILL_DIRS = {
+    "schedule": ("schedule",),
+    "pbp": ("pbp",),
+    "player_stats": ("player_stats", "player_stats/game_stats"),
+    "team_stats": ("team_stats", "team_stats/game_stats"),
+    "transactions": ("transactions",),
+}
+
+
+def run_backfill(
+    first_season: int,
+    last_season: int,
+    products: tuple = BACKFILL_PRODUCTS,
+    workers: int = None,
+    restart: bool = False
+) -> list:
+    """
+    Rebuild every data product in `products`,
+    for every season from `first_season` to `last_season` (inclusive),
+    resuming from the backfill checkpoint of an earlier run.
+
+    A product is checkpointed once it is complete for a season,
+    and skipped by every later run.
+    Products of the current season are never checkpointed,
+    since that data can still change.
+    Within a season, every downloaded game is kept in the response cache,
+    and every parsed play-by-play game is kept in the pbp manifest,
+    so an interrupted season does not start from scratch either.
+
+    Parameters
+    ----------
+    `first_season` (int, mandatory):
+        The first season to rebuild.
+
+    `last_season` (int, mandatory):
+        The last season to rebuild.
+
+    `products` (tuple, optional):
+        The data products to rebuild
+        (any of `BACKFILL_PRODUCTS`).
+
+    `workers` (int, optional):
+        How many worker processes to parse play-by-play data with.
+
+    `restart` (bool, optional):
+        If `True`, ignore the backfill checkpoint,
+        and rebuild every product of every season again.
+
+    Returns
+    ----------
+    A `list` of every `(season, product)` that failed.
+    """
+    for product in products:
+        if product not in BACKFILL_STEPS:
+            raise ValueError(
+                f"Unknown data product `{product}`. " +
+                f"Expected one of {', '.join(BACKFILL_PRODUCTS)}."
+            )
+
+    for product in products:
+        for directory in BACKFILL_DIRS[product]:
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                logging.info(f"`./{directory}` already exists.")
+
+    checkpoint = {} if restart else load_backfill_checkpoint()
+    current_season = get_current_season()
+    failed_arr = []
+
+    for season in range(first_season, last_season + 1):
+        completed = checkpoint.setdefault(str(season), {})
+
+        for product in BACKFILL_PRODUCTS:
+            if product not in products:
+                continue
+            elif product in completed:
+                logging.info(
+                    f"Skipping the {season} {product} data, " +
+                    f"completed at {completed[product]['completed_at']}."
+                )
+                continue
+
+            print(f"Getting the {season} {product} data.")
+            try:
+                rows = BACKFILL_STEPS[product](season, workers=workers)
+            except Exception as e:
+                logging.warning(
+                    f"\nUnhandled exception when getting the {season} " +
+                    f"{product} data `{e}`"
+                )
+                failed_arr.append((season, product))
+                continue
+
+            if season < current_season:
+                completed[product] = {
+                    "completed_at": datetime.now().isoformat(),
+                    "rows": rows,
+                }
+                save_backfill_checkpoint(checkpoint)
+
+    return failed_arr
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(
+        description=(
+            "Rebuild CFL data over a range of seasons, " +
+            "resuming from the last checkpoint."
+        )
+    )
+    arg_parser.add_argument("first_season", type=int)
+    arg_parser.add_argument("last_season", type=int, nargs="?")
+    arg_parser.add_argument(
+        "--products",
+        nargs="+",
+        choices=BACKFILL_PRODUCTS,
+        default=list(BACKFILL_PRODUCTS)
+    )
+    arg_parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="How many worker processes to parse play-by-play data with."
+    )
+    arg_parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore the checkpoint, and rebuild everything again."
+    )
+    args = arg_parser.parse_args()
+
+    failed_arr = run_backfill(
+        first_season=args.first_season,
+        last_season=args.last_season or args.first_season,
+        products=tuple(args.products),
+        workers=args.workers,
+        restart=args.restart
+    )
+    if len(failed_arr) > 0:
+        raise SystemExit(
+            "Failed to get: " +
+            ", ".join(f"{season} {product}" for season, product in failed_arr)
+        )
@@ -0,0 +1,183 @@
+import asyncio
+import logging
+
+from tqdm.asyncio import tqdm_asyncio
+
+from http_client import get_host, http_get
+from rate_limiter import get_rate_limiter
+from response_cache import (
+    DEFAULT_TTL,
+    CachedResponse,
+    cache_response,
+    get_cached_response,
+    get_response_encoding,
+)
+
+# How many requests each host may have in flight at once.
+# Hosts that are not listed here get `DEFAULT_CONCURRENCY`.
+# How many requests per second each host may be sent
+# is set in `rate_limiter.HOST_RATE_LIMITS`.
+HOST_CONCURRENCY = {
+    "cfl.ca": 2,
+    "gsm-widgets.betstream.betgenius.com": 4,
+    "statscrew.com": 1,
+}
+DEFAULT_CONCURRENCY = 1
+
+
+class FetchEngine:
+    """
+    Downloads many URLs concurrently,
+    without going over the concurrency limit of any one host,
+    or the request budget of its shared rate limiter.
+
+    Requests are sent through the shared sessions in `http_client`,
+    on worker threads, so the event loop is never blocked by a download.
+    Responses are read from and written to the response cache,
+    unless `use_cache` is `False`.
+
+    Parameters
+    ----------
+    `host_concurrency` (dict, optional):
+        Overrides `HOST_CONCURRENCY` for the given hosts.
+
+    `use_cache` (bool, optional):
+        If `False`, never use or update the response cache.
+    """
+
+    def __init__(self, host_concurrency: dict = None, use_cache: bool = True):
+        self.host_concurrency = {
+            **HOST_CONCURRENCY,
+            **(host_concurrency or {})
+        }
+        self.use_cache = use_cache
+        self._semaphores = {}
+
+    def _get_semaphore(self, host: str) -> asyncio.Semaphore:
+        """ """
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(
+                self.host_concurrency.get(host, DEFAULT_CONCURRENCY)
+            )
+        return self._semaphores[host]
+
+    async def get(
+        self,
+        url: str,
+        final: bool = False,
+        ttl: float = DEFAULT_TTL,
+        refresh: bool = False
+    ) -> CachedResponse:
+        """
+        Download `url`, once its host has room for another request,
+        unless the response cache already has a usable response for it.
+
+        Parameters
+        ----------
+        `url` (str, mandatory):
+            The URL you want to download.
+
+        `final` (bool, optional):
+            If `True`, the data behind `url` will never change again
+            (for example, the game is final),
+            so the response is cached forever.
+
+        `ttl` (float, optional):
+            How old (in seconds) a cached response that is not final
+            can be before `url` is downloaded again.
+
+        `refresh` (bool, optional):
+            If `True`, ignore any cached response and download `url` again.
+
+        Returns
+        ----------
+        A `CachedResponse` for `url`.
+        """
+        if self.use_cache and not refresh:
+            response = await asyncio.to_thread(
+                get_cached_response,
+                url,
+                ttl
+            )
+            if response is not None:
+                return response
+
+        host = get_host(url)
+
+        async with self._get_semaphore(host):
+            await get_rate_limiter(host).acquire_async()
+            logging.debug(f"Downloading `{url}`.")
+            response = await asyncio.to_thread(
+                http_get,
+                url,
+                rate_limited=False
+            )
+
+        if self.use_cache and response.status_code == 200:
+            await asyncio.to_thread(cache_response, url, response, final)
+
+        return CachedResponse(
+            url=url,
+            status_code=response.status_code,
+            content=response.content,
+            encoding=get_response_encoding(response)
+        )
+
+
+async def _fetch_all(items: list, fetch_item, engine: FetchEngine) -> list:
+    """ """
+    # Semaphores belong to the event loop they were first used in,
+    # and every call to `fetch_all()` runs in a new event loop.
+    engine._semaphores = {}
+    return await tqdm_asyncio.gather(
+        *[
+            fetch_item(engine, *item)
+            if isinstance(item, tuple)
+            else fetch_item(engine, item)
+            for item in items
+        ],
+        disable=len(items) < 2
+    )
+
+
+def fetch_all(items: list, fetch_item, engine: FetchEngine = None) -> list:
+    """
+    Run `fetch_item(engine, item)` for every item in `items` concurrently,
+    and wait for all of them to finish.
+
+    Parameters
+    ----------
+    `items` (list, mandatory):
+        The things to download (URLs, fixture IDs, etc.).
+        If an item is a `tuple`, it is unpacked,
+        and `fetch_item(engine, *item)` is run instead.
+
+    `fetch_item` (coroutine function, mandatory):
+        An `async` function that takes a `FetchEngine` and one item,
+        downloads everything that item needs through `engine.get()`,
+        and returns the result.
+
+    `engine` (FetchEngine, optional):
+        The engine to download with.
+        If not set, a `FetchEngine` with the default budget is used.
+
+    Returns
+    ----------
+    A `list` with the result of `fetch_item()` for each item,
+    in the same order as `items`.
+    """
+    if engine is None:
+        engine = FetchEngine()
+    return asyncio.run(_fetch_all(items, fetch_item, engine))
+
+
+async def fetch_url(
+    engine: FetchEngine,
+    url: str,
+    final: bool = False
+) -> CachedResponse:
+    """
+    `fetch_item()` for `fetch_all()`, when each item is a plain URL,
+    or a `(url, final)` tuple.
+    """
+    return await engine.get(url, final=final)
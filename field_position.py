@@ -0,0 +1,156 @@
+import functools
+
+import numpy as np
+
+from pbp_regex import PBP_PATTERNS, add_pattern_hits
+
+# A CFL field is 110 yards long, from goal line to goal line.
+FIELD_LENGTH = 110
+
+
+def _get_yardline_number(yardline: str) -> float:
+    """ """
+    try:
+        return float(
+            int(PBP_PATTERNS["yardline_number"].search(yardline).group(1))
+        )
+    except (AttributeError, TypeError, ValueError):
+        return np.nan
+
+
+def get_yardline_110(yardlines, posteams) -> np.ndarray:
+    """
+    Given many CFL yardlines, and the team with the ball on each of them,
+    return how far each yardline is from the end zone
+    that team is going towards (`yardline_110`), in one pass.
+
+    Parameters
+    ----------
+    `yardlines` (list-like, mandatory):
+        Yardlines as they are written in the play-by-play data
+        (`WPG 35`, `BC end zone`).
+
+    `posteams` (list-like, mandatory):
+        The team with the ball (`WPG`) at each yardline in `yardlines`.
+
+    Returns
+    ----------
+    A `numpy` array of floats, with the `yardline_110` of each yardline:
+    `110 - 35 = 75` for `WPG 35` if `WPG` has the ball,
+    `35` if the other team has the ball,
+    `110` for the end zone of the team with the ball,
+    and `0` for the other end zone.
+    Yardlines without a yard number are `NaN`.
+    """
+    yardlines_arr = [x if isinstance(x, str) else "" for x in yardlines]
+    posteams_arr = [x if isinstance(x, str) else None for x in posteams]
+
+    yardline_numbers = np.fromiter(
+        (_get_yardline_number(x) for x in yardlines_arr),
+        dtype=float,
+        count=len(yardlines_arr)
+    )
+    add_pattern_hits(
+        {"yardline_number": int(np.isfinite(yardline_numbers).sum())}
+    )
+    is_end_zone = np.fromiter(
+        ("end zone" in x.lower() for x in yardlines_arr),
+        dtype=bool,
+        count=len(yardlines_arr)
+    )
+    # The yardline is on the side of the team with the ball
+    # if it has the abbreviation of that team in it.
+    is_own_side = np.fromiter(
+        (
+            posteam is not None and posteam in yardline
+            for yardline, posteam in zip(yardlines_arr, posteams_arr)
+        ),
+        dtype=bool,
+        count=len(yardlines_arr)
+    )
+
+    yardline_110 = np.where(
+        is_own_side,
+        FIELD_LENGTH - yardline_numbers,
+        yardline_numbers
+    )
+    return np.where(
+        is_end_zone,
+        np.where(is_own_side, FIELD_LENGTH, 0),
+        yardline_110
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def get_yardline(yardline: str, posteam: str) -> int:
+    """
+    Given one CFL yardline (`WPG 35`) and the team with the ball,
+    return its `yardline_110` (see `get_yardline_110()`).
+
+    Raises a `ValueError` if the yardline has no yard number.
+    """
+    yardline_110 = get_yardline_110([yardline], [posteam])[0]
+    if np.isnan(yardline_110):
+        raise ValueError(f"Cannot get a yardline number with {yardline}.")
+    return int(yardline_110)
+
+
+def get_play_start_positions(start_positions, posteams) -> list:
+    """
+    Given the starting position of many plays (`1st & 10 at WPG 35`),
+    and the team with the ball on each of them,
+    parse every one of them in one pass.
+
+    Parameters
+    ----------
+    `start_positions` (list-like, mandatory):
+        The `playStartPosition` of each play.
+
+    `posteams` (list-like, mandatory):
+        The team with the ball on each play.
+
+    Returns
+    ----------
+    A `list` with a `(down, yds_to_go, yrdln, side_of_field, yardline_110)`
+    `tuple` for each play, or `None` for plays
+    whose starting position can not be parsed.
+    `side_of_field` is the team with the ball,
+    if the yardline does not say which side of the field it is on.
+    """
+    posteams = list(posteams)
+    matches_arr = [
+        PBP_PATTERNS["down_and_distance"].search(x)
+        if isinstance(x, str) else None
+        for x in start_positions
+    ]
+    yrdlns = [None if x is None else x.group(3) for x in matches_arr]
+    yardline_110 = get_yardline_110(yrdlns, posteams)
+    add_pattern_hits(
+        {"down_and_distance": sum(x is not None for x in matches_arr)}
+    )
+
+    start_positions_arr = []
+    side_of_field_hits = 0
+    for match, posteam, yardline in zip(matches_arr, posteams, yardline_110):
+        try:
+            down = int(match.group(1))
+            yds_to_go = int(match.group(2))
+        except (AttributeError, ValueError):
+            start_positions_arr.append(None)
+            continue
+        if np.isnan(yardline):
+            start_positions_arr.append(None)
+            continue
+
+        yrdln = match.group(3)
+        side_of_field = PBP_PATTERNS["side_of_field"].search(yrdln)
+        if side_of_field is None:
+            side_of_field = posteam
+        else:
+            side_of_field_hits += 1
+            side_of_field = side_of_field.group(1)
+        start_positions_arr.append(
+            (down, yds_to_go, yrdln, side_of_field, int(yardline))
+        )
+    add_pattern_hits({"side_of_field": side_of_field_hits})
+    return start_positions_arr
@@ -1,804 +1,488 @@
+import asyncio
 import json
 import logging
 import os
-import time
 from datetime import datetime
 
 import pandas as pd
-import requests
 from tqdm import tqdm
 
-from get_schedules import get_cfl_schedules
+from fetch_engine import FetchEngine, fetch_all, fetch_url
+from get_schedules import FINAL_EVENT_STATUS, get_cfl_schedules
+from http_client import RETRY_DELAY
+from parquet_io import write_parquet
+from player_crosswalk import update_player_crosswalk
+from schemas import (
+    PLAYER_GAME_STATS_ARROW_SCHEMA,
+    TEAM_GAME_STATS_ARROW_SCHEMA,
+    apply_schema,
+)
+
+# The columns that identify a player in the player stats of a game,
+# and the key each one has in the JSON data.
+PLAYER_IDENTITY_FIELDS = {
+    "competitor_id": "competitorId",
+    "player_jersey_number": "number",
+    "player_full_name": "name",
+    "player_abv_name": "abbreviationName",
+    "player_position": "position",
+    "player_status": "type",
+}
+
+# For every stat category in the JSON data,
+# what kind of stat it is (for error messages),
+# and the column each of its stats is stored in.
+# Stats that map to `None` (averages, ratings, etc.) are not kept,
+# because they are calculated again from the totals.
+PLAYER_STAT_CATEGORIES = {
+    "passing": (
+        "passing",
+        {
+            "YARDS": "passing_YDS",
+            "COMPLETIONS_ATTEMPTS": "passing_COMP/ATT",
+            "TOUCHDOWNS": "passing_TD",
+            "INTERCEPTIONS": "passing_INT",
+            "LONGEST": "passing_LONG",
+            "AVERAGE_YARDS": None,
+            "RATING": None,
+        }
+    ),
+    "rushing": (
+        "rushing",
+        {
+            "YARDS": "rushing_YDS",
+            "TOUCHDOWNS": "rushing_TD",
+            "INTERCEPTIONS": "passing_INT",
+            "LONGEST": "rushing_LONG",
+            "CARRIES": "rushing_ATT",
+            "AVERAGE_YARDS": None,
+        }
+    ),
+    "receiving": (
+        "receiving",
+        {
+            "YARDS": "receiving_YDS",
+            "TOUCHDOWNS": "receiving_TD",
+            "TARGETS": "receiving_TGT",
+            "LONGEST": "receiving_LONG",
+            "YARDS_AFTER_CATCH": "receiving_YAC",
+            "RECEPTIONS": "receiving_REC",
+            "AVERAGE_YARDS": None,
+        }
+    ),
+    "defence": (
+        "defensive",
+        {
+            "DEFENCE_SOLO": "defense_SOLO",
+            "DEFENCE_SK": "defense_SACKS",
+            "DEFENCE_TFL": "defense_TFL",
+            "DEFENCE_INT": "defense_INT",
+            "DEFENCE_FF": "defense_FF",
+            "DEFENCE_FR": "defense_FR",
+            "DEFENCE_STT": "defense_ST_TAK",
+        }
+    ),
+    "fieldGoals": (
+        "kicking",
+        {
+            "FIELDGOALS_FGFGA": "kicking_FG",
+            "FIELDGOALS_LNG": "kicking_FG_LONG",
+            "FIELDGOALS_XP": "kicking_XP",
+            "FIELDGOALS_SNG": "kicking_ROUGE",
+            "FIELDGOALS_FG": None,
+        }
+    ),
+    "kickoffs": (
+        "kickoff",
+        {
+            "KICKOFFS_NO": "kickoffs_NUM",
+            "KICKOFFS_YDS": "kickoffs_YDS",
+            "KICKOFFS_LNG": "kickoffs_LONG",
+            "KICKOFFS_AVG": None,
+        }
+    ),
+    "punts": (
+        "punting",
+        {
+            "PUNTING_NO": "punting_NO",
+            "PUNTING_YDS": "punting_GROSS_YDS",
+            "PUNTING_LNG": "punting_LONG",
+            "PUNTING_IN10": "punting_IN_10",
+            "PUNTING_AVG": None,
+        }
+    ),
+    "kickoffReturns": (
+        "kick return",
+        {
+            "KICKRETURN_NO": "kick_return_NUM",
+            "KICKRETURN_YDS": "kick_return_YDS",
+            "KICKRETURN_LNG": "kick_return_LONG",
+            "KICKRETURN_AVG": None,
+        }
+    ),
+    "puntReturns": (
+        "punt return",
+        {
+            "PUNTRETURN_NO": "punt_return_NUM",
+            "PUNTRETURN_YDS": "punt_return_YDS",
+            "PUNTRETURN_LNG": "punt_return_LONG",
+            "PUNTRETURN_AVG": None,
+        }
+    ),
+}
+
+PLAYER_GAME_STATS_COLUMNS = [
+    "competitor_id",
+    "player_jersey_number",
+    "player_full_name",
+    "player_abv_name",
+    "player_position",
+    "player_status",
+    # Passing
+    "passing_COMP",
+    "passing_ATT",
+    "passing_COMP%",
+    "passing_YDS",
+    "passing_TD",
+    "passing_INT",
+    "passing_LONG",
+    "passing_YDS/ATT",
+    "passing_AY/A",
+    # Rushing
+    "rushing_ATT",
+    "rushing_YDS",
+    "rushing_TD",
+    "rushing_LONG",
+    "rushing_AVG",
+    # Receiving
+    "receiving_TGT",
+    "receiving_REC",
+    "receiving_YDS",
+    "receiving_YAC",
+    "receiving_TD",
+    "receiving_LONG",
+    "receiving_AVG",
+    "receiving_YDS/TGT",
+    "receiving_CATCH%",
+    # Defense
+    "defense_SOLO",
+    "defense_SACKS",
+    "defense_TFL",
+    "defense_INT",
+    "defense_FF",
+    "defense_FR",
+    "defense_ST_TAK",
+    # FG
+    "kicking_FGM",
+    "kicking_FGA",
+    "kicking_FG%",
+    "kicking_FG_LONG",
+    "kicking_XP",
+    "kicking_ROUGE",
+    # Kickoffs
+    "kickoffs_NUM",
+    "kickoffs_YDS",
+    "kickoffs_LONG",
+    # Punting
+    "punting_NO",
+    "punting_GROSS_YDS",
+    "punting_GROSS_AVG",
+    "punting_LONG",
+    "punting_IN_10",
+    # Kick Returns
+    "kick_return_NUM",
+    "kick_return_YDS",
+    "kick_return_LONG",
+    "kick_return_AVG",
+    # Punt Returns
+    "punt_return_NUM",
+    "punt_return_YDS",
+    "punt_return_LONG",
+    "punt_return_AVG",
+]
 
 
 def player_parser(data: dict) -> pd.DataFrame:
-    """ """
-    pd.set_option('future.no_silent_downcasting', True)
-    # print(data)
-    # passing
-    columns_arr = [
-        "competitor_id",
-        "player_jersey_number",
-        "player_full_name",
-        "player_abv_name",
-        "player_position",
-        "player_status",
-        # Passing
-        "passing_COMP",
-        "passing_ATT",
-        "passing_COMP%",
-        "passing_YDS",
-        "passing_TD",
-        "passing_INT",
-        "passing_LONG",
-        "passing_YDS/ATT",
-        "passing_AY/A",
-        # Rushing
-        "rushing_ATT",
-        "rushing_YDS",
-        "rushing_TD",
-        "rushing_LONG",
-        "rushing_AVG",
-        # Receiving
-        "receiving_TGT",
-        "receiving_REC",
-        "receiving_YDS",
-        "receiving_YAC",
-        "receiving_TD",
-        "receiving_LONG",
-        "receiving_AVG",
-        "receiving_YDS/TGT",
-        "receiving_CATCH%",
-        # Defense
-        "defense_SOLO",
-        "defense_SACKS",
-        "defense_TFL",
-        "defense_INT",
-        "defense_FF",
-        "defense_FR",
-        "defense_ST_TAK",
-        # FG
-        "kicking_FGM",
-        "kicking_FGA",
-        "kicking_FG%",
-        "kicking_FG_LONG",
-        "kicking_XP",
-        "kicking_ROUGE",
-        # Kickoffs
-        "kickoffs_NUM",
-        "kickoffs_YDS",
-        "kickoffs_LONG",
-        # Punting
-        "punting_NO",
-        "punting_GROSS_YDS",
-        "punting_GROSS_AVG",
-        "punting_LONG",
-        "punting_IN_10",
-        # Kick Returns
-        "kick_return_NUM",
-        "kick_return_YDS",
-        "kick_return_LONG",
-        "kick_return_AVG",
-        # Punt Returns
-        "punt_return_NUM",
-        "punt_return_YDS",
-        "punt_return_LONG",
-        "punt_return_AVG",
-    ]
-    temp_df = pd.DataFrame()
-    passing_df = pd.DataFrame()
-    rushing_df = pd.DataFrame()
-    receiving_df = pd.DataFrame()
-    defense_df = pd.DataFrame()
-    kicking_df = pd.DataFrame()
-    kickoffs_df = pd.DataFrame()
-    punting_df = pd.DataFrame()
-    kick_return_df = pd.DataFrame()
-    punt_return_df = pd.DataFrame()
-
-    passing_df_arr = []
-    rushing_df_arr = []
-    receiving_df_arr = []
-    defense_df_arr = []
-    kicking_df_arr = []
-    kickoffs_df_arr = []
-    punting_df_arr = []
-    kick_return_df_arr = []
-    punt_return_df_arr = []
-
-    # Stat parsing
-    for player in data["passing"]:
-        competitor_id = player["competitorId"]
-        player_full_name = player["name"]
-        player_abv_name = player["abbreviationName"]
-        player_position = player["position"]
-        player_jersey_number = player["number"]
-        player_status = player["type"]
-
-        temp_df = pd.DataFrame(
-            {
-                "competitor_id": competitor_id,
-                "player_jersey_number": player_jersey_number,
-                "player_full_name": player_full_name,
-                "player_abv_name": player_abv_name,
-                "player_position": player_position,
-                "player_status": player_status,
-            },
-            index=[0],
-        )
-        for stat in player["stats"]:
-            if stat["name"] == "YARDS":
-                temp_df["passing_YDS"] = stat["statValue"]
-            elif stat["name"] == "COMPLETIONS_ATTEMPTS":
-                temp_df["passing_COMP/ATT"] = stat["statValue"]
-            elif stat["name"] == "TOUCHDOWNS":
-                temp_df["passing_TD"] = stat["statValue"]
-            elif stat["name"] == "INTERCEPTIONS":
-                temp_df["passing_INT"] = stat["statValue"]
-            elif stat["name"] == "LONGEST":
-                temp_df["passing_LONG"] = stat["statValue"]
-            elif stat["name"] == "AVERAGE_YARDS":
-                pass
-            elif stat["name"] == "RATING":
-                pass
-            else:
-                raise LookupError(
-                    f"Unhandled passing stat: `{stat}`"
-                )
-        passing_df_arr.append(temp_df)
-        del temp_df
-
-    for player in data["rushing"]:
-        competitor_id = player["competitorId"]
-        player_full_name = player["name"]
-        player_abv_name = player["abbreviationName"]
-        player_position = player["position"]
-        player_jersey_number = player["number"]
-        player_status = player["type"]
-
-        temp_df = pd.DataFrame(
-            {
-                "competitor_id": competitor_id,
-                "player_jersey_number": player_jersey_number,
-                "player_full_name": player_full_name,
-                "player_abv_name": player_abv_name,
-                "player_position": player_position,
-                "player_status": player_status,
-            },
-            index=[0],
-        )
-        for stat in player["stats"]:
-            if stat["name"] == "YARDS":
-                temp_df["rushing_YDS"] = stat["statValue"]
-            elif stat["name"] == "TOUCHDOWNS":
-                temp_df["rushing_TD"] = stat["statValue"]
-            elif stat["name"] == "INTERCEPTIONS":
-                temp_df["passing_INT"] = stat["statValue"]
-            elif stat["name"] == "LONGEST":
-                temp_df["rushing_LONG"] = stat["statValue"]
-            elif stat["name"] == "CARRIES":
-                temp_df["rushing_ATT"] = stat["statValue"]
-            elif stat["name"] == "AVERAGE_YARDS":
-                pass
-            else:
-                raise LookupError(
-                    f"Unhandled rushing stat: `{stat}`"
-                )
-        rushing_df_arr.append(temp_df)
-        del temp_df
-
-    for player in data["receiving"]:
-        competitor_id = player["competitorId"]
-        player_full_name = player["name"]
-        player_abv_name = player["abbreviationName"]
-        player_position = player["position"]
-        player_jersey_number = player["number"]
-        player_status = player["type"]
-
-        temp_df = pd.DataFrame(
-            {
-                "competitor_id": competitor_id,
-                "player_jersey_number": player_jersey_number,
-                "player_full_name": player_full_name,
-                "player_abv_name": player_abv_name,
-                "player_position": player_position,
-                "player_status": player_status,
-            },
-            index=[0],
-        )
-        for stat in player["stats"]:
-            if stat["name"] == "YARDS":
-                temp_df["receiving_YDS"] = stat["statValue"]
-            elif stat["name"] == "TOUCHDOWNS":
-                temp_df["receiving_TD"] = stat["statValue"]
-            elif stat["name"] == "TARGETS":
-                temp_df["receiving_TGT"] = stat["statValue"]
-            elif stat["name"] == "LONGEST":
-                temp_df["receiving_LONG"] = stat["statValue"]
-            elif stat["name"] == "YARDS_AFTER_CATCH":
-                temp_df["receiving_YAC"] = stat["statValue"]
-            elif stat["name"] == "RECEPTIONS":
-                temp_df["receiving_REC"] = stat["statValue"]
-            elif stat["name"] == "AVERAGE_YARDS":
-                pass
-            else:
-                raise LookupError(
-                    f"Unhandled receiving stat: `{stat}`"
-                )
-        receiving_df_arr.append(temp_df)
-        del temp_df
-
-    for player in data["defence"]:
-        competitor_id = player["competitorId"]
-        player_full_name = player["name"]
-        player_abv_name = player["abbreviationName"]
-        player_position = player["position"]
-        player_jersey_number = player["number"]
-        player_status = player["type"]
-
-        temp_df = pd.DataFrame(
-            {
-                "competitor_id": competitor_id,
-                "player_jersey_number": player_jersey_number,
-                "player_full_name": player_full_name,
-                "player_abv_name": player_abv_name,
-                "player_position": player_position,
-                "player_status": player_status,
-            },
-            index=[0],
-        )
-        for stat in player["stats"]:
-            if stat["name"] == "DEFENCE_SOLO":
-                temp_df["defense_SOLO"] = stat["statValue"]
-            elif stat["name"] == "DEFENCE_SK":
-                temp_df["defense_SACKS"] = stat["statValue"]
-            elif stat["name"] == "DEFENCE_TFL":
-                temp_df["defense_TFL"] = stat["statValue"]
-            elif stat["name"] == "DEFENCE_INT":
-                temp_df["defense_INT"] = stat["statValue"]
-            elif stat["name"] == "DEFENCE_FF":
-                temp_df["defense_FF"] = stat["statValue"]
-            elif stat["name"] == "DEFENCE_FR":
-                temp_df["defense_FR"] = stat["statValue"]
-            elif stat["name"] == "DEFENCE_STT":
-                temp_df["defense_ST_TAK"] = stat["statValue"]
-            else:
-                raise LookupError(
-                    f"Unhandled defensive stat: `{stat}`"
-                )
-        defense_df_arr.append(temp_df)
-        del temp_df
-
-    for player in data["fieldGoals"]:
-        competitor_id = player["competitorId"]
-        player_full_name = player["name"]
-        player_abv_name = player["abbreviationName"]
-        player_position = player["position"]
-        player_jersey_number = player["number"]
-        player_status = player["type"]
-
-        temp_df = pd.DataFrame(
-            {
-                "competitor_id": competitor_id,
-                "player_jersey_number": player_jersey_number,
-                "player_full_name": player_full_name,
-                "player_abv_name": player_abv_name,
-                "player_position": player_position,
-                "player_status": player_status,
-            },
-            index=[0],
-        )
-        for stat in player["stats"]:
-            if stat["name"] == "FIELDGOALS_FGFGA":
-                temp_df["kicking_FG"] = stat["statValue"]
-            elif stat["name"] == "FIELDGOALS_LNG":
-                temp_df["kicking_FG_LONG"] = stat["statValue"]
-            elif stat["name"] == "FIELDGOALS_XP":
-                temp_df["kicking_XP"] = stat["statValue"]
-            elif stat["name"] == "FIELDGOALS_SNG":
-                temp_df["kicking_ROUGE"] = stat["statValue"]
-            elif stat["name"] == "FIELDGOALS_FG":
-                pass
-            else:
-                raise LookupError(
-                    f"Unhandled kicking stat: `{stat}`"
-                )
-        kicking_df_arr.append(temp_df)
-        del temp_df
-
-    for player in data["kickoffs"]:
-        competitor_id = player["competitorId"]
-        player_full_name = player["name"]
-        player_abv_name = player["abbreviationName"]
-        player_position = player["position"]
-        player_jersey_number = player["number"]
-        player_status = player["type"]
-
-        temp_df = pd.DataFrame(
-            {
-                "competitor_id": competitor_id,
-                "player_jersey_number": player_jersey_number,
-                "player_full_name": player_full_name,
-                "player_abv_name": player_abv_name,
-                "player_position": player_position,
-                "player_status": player_status,
-            },
-            index=[0],
-        )
-        for stat in player["stats"]:
-            if stat["name"] == "KICKOFFS_NO":
-                temp_df["kickoffs_NUM"] = stat["statValue"]
-            elif stat["name"] == "KICKOFFS_YDS":
-                temp_df["kickoffs_YDS"] = stat["statValue"]
-            elif stat["name"] == "KICKOFFS_LNG":
-                temp_df["kickoffs_LONG"] = stat["statValue"]
-            elif stat["name"] == "KICKOFFS_AVG":
-                pass
-            else:
-                raise LookupError(
-                    f"Unhandled kickoff stat: `{stat}`"
-                )
-        kickoffs_df_arr.append(temp_df)
-        del temp_df
-
-    for player in data["punts"]:
-        competitor_id = player["competitorId"]
-        player_full_name = player["name"]
-        player_abv_name = player["abbreviationName"]
-        player_position = player["position"]
-        player_jersey_number = player["number"]
-        player_status = player["type"]
-
-        temp_df = pd.DataFrame(
-            {
-                "competitor_id": competitor_id,
-                "player_jersey_number": player_jersey_number,
-                "player_full_name": player_full_name,
-                "player_abv_name": player_abv_name,
-                "player_position": player_position,
-                "player_status": player_status,
-            },
-            index=[0],
-        )
-        for stat in player["stats"]:
-            if stat["name"] == "PUNTING_NO":
-                temp_df["punting_NO"] = stat["statValue"]
-            elif stat["name"] == "PUNTING_YDS":
-                temp_df["punting_GROSS_YDS"] = stat["statValue"]
-            elif stat["name"] == "PUNTING_LNG":
-                temp_df["punting_LONG"] = stat["statValue"]
-            elif stat["name"] == "PUNTING_IN10":
-                temp_df["punting_IN_10"] = stat["statValue"]
-            elif stat["name"] == "PUNTING_AVG":
-                pass
-            else:
-                raise LookupError(
-                    f"Unhandled kickoff stat: `{stat}`"
-                )
-
-        punting_df_arr.append(temp_df)
-        del temp_df
-
-    for player in data["kickoffReturns"]:
-        competitor_id = player["competitorId"]
-        player_full_name = player["name"]
-        player_abv_name = player["abbreviationName"]
-        player_position = player["position"]
-        player_jersey_number = player["number"]
-        player_status = player["type"]
-
-        temp_df = pd.DataFrame(
-            {
-                "competitor_id": competitor_id,
-                "player_jersey_number": player_jersey_number,
-                "player_full_name": player_full_name,
-                "player_abv_name": player_abv_name,
-                "player_position": player_position,
-                "player_status": player_status,
-            },
-            index=[0],
-        )
-        for stat in player["stats"]:
-            if stat["name"] == "KICKRETURN_NO":
-                temp_df["kick_return_NUM"] = stat["statValue"]
-            elif stat["name"] == "KICKRETURN_YDS":
-                temp_df["kick_return_YDS"] = stat["statValue"]
-            elif stat["name"] == "KICKRETURN_LNG":
-                temp_df["kick_return_LONG"] = stat["statValue"]
-            elif stat["name"] == "KICKRETURN_AVG":
-                pass
-            else:
-                raise LookupError(
-                    f"Unhandled kickoff stat: `{stat}`"
-                )
-        kick_return_df_arr.append(temp_df)
-        del temp_df
-
-    for player in data["puntReturns"]:
-        competitor_id = player["competitorId"]
-        player_full_name = player["name"]
-        player_abv_name = player["abbreviationName"]
-        player_position = player["position"]
-        player_jersey_number = player["number"]
-        player_status = player["type"]
-
-        temp_df = pd.DataFrame(
-            {
-                "competitor_id": competitor_id,
-                "player_jersey_number": player_jersey_number,
-                "player_full_name": player_full_name,
-                "player_abv_name": player_abv_name,
-                "player_position": player_position,
-                "player_status": player_status,
-            },
-            index=[0],
-        )
-        for stat in player["stats"]:
-            if stat["name"] == "PUNTRETURN_NO":
-                temp_df["punt_return_NUM"] = stat["statValue"]
-            elif stat["name"] == "PUNTRETURN_YDS":
-                temp_df["punt_return_YDS"] = stat["statValue"]
-            elif stat["name"] == "PUNTRETURN_LNG":
-                temp_df["punt_return_LONG"] = stat["statValue"]
-            elif stat["name"] == "PUNTRETURN_AVG":
-                pass
-            else:
-                raise LookupError(
-                    f"Unhandled punt stat: `{stat}`"
-                )
-        punt_return_df_arr.append(temp_df)
-        del temp_df
-
-    # Stat cleaning
-    if len(passing_df_arr) > 0:
-        passing_df = pd.concat(passing_df_arr, ignore_index=True)
-        # print(passing_df.columns)
-
-        passing_df[["passing_COMP", "passing_ATT"]] = passing_df[
-            "passing_COMP/ATT"
-        ].str.split("/", expand=True)
-        passing_df["player_jersey_number"] = passing_df[
-            "player_jersey_number"
-        ].infer_objects(copy=False).fillna(0)
-        passing_df = passing_df.astype(
-            {
-                "player_jersey_number": "uint8",
-                "passing_YDS": "int16",
-                "passing_COMP": "uint16",
-                "passing_ATT": "uint16",
-                "passing_TD": "uint16",
-                "passing_INT": "uint16",
-                "passing_LONG": "int16",
-            }
-        )
-        passing_df["passing_COMP%"] = round(
-            passing_df["passing_COMP"] / passing_df["passing_ATT"], 3
-        )
-        passing_df["passing_YDS/ATT"] = round(
-            passing_df["passing_YDS"] / passing_df["passing_ATT"], 3
-        )
-        passing_df["passing_AY/A"] = (
-            (
-                passing_df["passing_YDS"] +
-                (passing_df["passing_TD"] * 20) -
-                (passing_df["passing_INT"] * 45)
-            ) / passing_df["passing_ATT"]
-        )
+    """
+    Given the player stats of one team in a game,
+    return them as a pandas `DataFrame`, with one row per player.
+
+    Every stat category is read in a single pass,
+    into one row per player,
+    so a player with stats in several categories
+    (for example, a quarterback who also ran the ball)
+    ends up in a single row.
+
+    Parameters
+    ----------
+    `data` (dict, mandatory):
+        The `playerStats` of one team (`homeTeam` or `awayTeam`),
+        from the JSON data of a game.
+
+    Returns
+    ----------
+    A pandas `DataFrame` with the columns in `PLAYER_GAME_STATS_COLUMNS`,
+    sorted by player.
+    """
+    players = {}
+
+    for category, (stat_type, stat_columns) in PLAYER_STAT_CATEGORIES.items():
+        for player in data[category]:
+            player_key = tuple(
+                player[key] for key in PLAYER_IDENTITY_FIELDS.values()
+            )
+            row = players.get(player_key)
+            if row is None:
+                row = dict(zip(PLAYER_IDENTITY_FIELDS, player_key))
+                players[player_key] = row
+
+            for stat in player["stats"]:
+                if stat["name"] not in stat_columns:
+                    raise LookupError(
+                        f"Unhandled {stat_type} stat: `{stat}`"
+                    )
+                column = stat_columns[stat["name"]]
+                if column is not None:
+                    row[column] = stat["statValue"]
+
+    stats_df = pd.DataFrame(list(players.values()))
+
+    # Completions and field goals are given as "made/attempted".
+    for column, made_column, attempted_column in (
+        ("passing_COMP/ATT", "passing_COMP", "passing_ATT"),
+        ("kicking_FG", "kicking_FGM", "kicking_FGA"),
+    ):
+        if column in stats_df.columns:
+            stats_df[[made_column, attempted_column]] = stats_df[
+                column
+            ].str.split("/", expand=True)
+
+    stats_df = stats_df.reindex(columns=PLAYER_GAME_STATS_COLUMNS)
+    stats_df["player_jersey_number"] = stats_df[
+        "player_jersey_number"
+    ].fillna(0)
+    stats_df = apply_schema(stats_df, PLAYER_GAME_STATS_ARROW_SCHEMA)
+
+    passing_att = stats_df["passing_ATT"] > 0
+    stats_df.loc[passing_att, "passing_COMP%"] = round(
+        stats_df["passing_COMP"] / stats_df["passing_ATT"], 3
+    )
+    stats_df.loc[passing_att, "passing_YDS/ATT"] = round(
+        stats_df["passing_YDS"] / stats_df["passing_ATT"], 3
+    )
+    stats_df.loc[passing_att, "passing_AY/A"] = (
+        stats_df["passing_YDS"] +
+        (stats_df["passing_TD"] * 20) -
+        (stats_df["passing_INT"] * 45)
+    ) / stats_df["passing_ATT"]
+
+    stats_df.loc[stats_df["rushing_ATT"] > 0, "rushing_AVG"] = round(
+        stats_df["rushing_YDS"] / stats_df["rushing_ATT"], 3
+    )
 
-    if len(rushing_df_arr) > 0:
-        rushing_df = pd.concat(rushing_df_arr, ignore_index=True)
-        rushing_df["player_jersey_number"] = rushing_df[
-            "player_jersey_number"
-        ].infer_objects(copy=False).fillna(0)
-        rushing_df = rushing_df.astype(
-            {
-                "player_jersey_number": "uint8",
-                "rushing_ATT": "uint16",
-                "rushing_YDS": "int16",
-            }
-        )
-        rushing_df["rushing_AVG"] = round(
-            rushing_df["rushing_YDS"] / rushing_df["rushing_ATT"], 3
-        )
+    receiving_rec = stats_df["receiving_REC"] > 0
+    stats_df.loc[receiving_rec, "receiving_AVG"] = round(
+        stats_df["receiving_YDS"] / stats_df["receiving_REC"], 3
+    )
+    receiving_tgt = stats_df["receiving_TGT"] > 0
+    stats_df.loc[receiving_tgt, "receiving_YDS/TGT"] = round(
+        stats_df["receiving_YDS"] / stats_df["receiving_TGT"], 3
+    )
+    stats_df.loc[receiving_tgt, "receiving_CATCH%"] = round(
+        stats_df["receiving_REC"] / stats_df["receiving_TGT"], 3
+    )
 
-    if len(receiving_df_arr) > 0:
-        receiving_df = pd.concat(receiving_df_arr, ignore_index=True)
-        # print(receiving_df.columns)
-        receiving_df["player_jersey_number"] = receiving_df[
-            "player_jersey_number"
-        ].infer_objects(copy=False).fillna(0)
-        receiving_df = receiving_df.astype(
-            {
-                "player_jersey_number": "uint8",
-                "receiving_YDS": "int16",
-                "receiving_TD": "uint16",
-                "receiving_TGT": "uint16",
-                "receiving_LONG": "int16",
-                "receiving_YAC": "int16",
-                "receiving_REC": "uint16",
-            }
-        )
-        receiving_df.loc[
-            receiving_df["receiving_REC"] > 0,
-            "receiving_AVG"
-        ] = round(
-            receiving_df["receiving_YDS"] / receiving_df["receiving_REC"], 3
-        )
-        receiving_df.loc[
-            receiving_df["receiving_REC"] > 0,
-            "receiving_YDS/TGT"
-        ] = round(
-            receiving_df["receiving_YDS"] / receiving_df["receiving_TGT"], 3
-        )
-        receiving_df.loc[
-            receiving_df["receiving_TGT"] > 0,
-            "receiving_CATCH%"
-        ] = round(
-            receiving_df["receiving_REC"] / receiving_df["receiving_TGT"], 3
-        )
+    stats_df.loc[stats_df["kicking_FGA"] > 0, "kicking_FG%"] = round(
+        stats_df["kicking_FGM"] / stats_df["kicking_FGA"], 3
+    )
+    stats_df.loc[
+        stats_df["punting_NO"] > 0,
+        "punting_GROSS_AVG"
+    ] = round(
+        stats_df["punting_GROSS_YDS"] / stats_df["punting_NO"], 3
+    )
+    stats_df.loc[
+        stats_df["kick_return_NUM"] > 0,
+        "kick_return_AVG"
+    ] = round(
+        stats_df["kick_return_YDS"] / stats_df["kick_return_NUM"], 3
+    )
+    stats_df.loc[
+        stats_df["punt_return_NUM"] > 0,
+        "punt_return_AVG"
+    ] = round(
+        stats_df["punt_return_YDS"] / stats_df["punt_return_NUM"], 3
+    )
 
-    if len(defense_df_arr) > 0:
-        defense_df = pd.concat(defense_df_arr, ignore_index=True)
-        defense_df["player_jersey_number"] = defense_df[
-            "player_jersey_number"
-        ].infer_objects(copy=False).fillna(0)
-        defense_df = defense_df.astype(
-            {
-                "player_jersey_number": "uint8",
-            }
-        )
+    stats_df = stats_df.sort_values(
+        list(PLAYER_IDENTITY_FIELDS),
+        ignore_index=True
+    )
+    return stats_df
 
-    if len(kicking_df_arr) > 0:
-        kicking_df = pd.concat(kicking_df_arr, ignore_index=True)
-        kicking_df["player_jersey_number"] = kicking_df[
-            "player_jersey_number"
-        ].infer_objects(copy=False).fillna(0)
-        kicking_df[["kicking_FGM", "kicking_FGA"]] = kicking_df[
-            "kicking_FG"
-        ].str.split("/", expand=True)
-        # kicking_df = kicking_df.fillna(0)
-        kicking_df = kicking_df.astype(
-            {
-                "player_jersey_number": "uint8",
-                "kicking_XP": "uint16",
-                "kicking_ROUGE": "uint16",
-                # "kickoffs_NUM": "uint16",
-                # "kickoffs_YDS": "int16",
-                # "kickoffs_LONG": "int16",
-                "kicking_FGM": "uint16",
-                "kicking_FGA": "uint16",
-            }
-        )
-        kicking_df.loc[kicking_df["kicking_FGA"] > 0, "kicking_FG%"] = round(
-            kicking_df["kicking_FGM"] / kicking_df["kicking_FGA"], 3
-        )
 
-    if len(kickoffs_df_arr) > 0:
-        kickoffs_df = pd.concat(kickoffs_df_arr, ignore_index=True)
-        kickoffs_df["player_jersey_number"] = kickoffs_df[
-            "player_jersey_number"
-        ].infer_objects(copy=False).fillna(0)
-        kickoffs_df = kickoffs_df.astype(
-            {
-                "player_jersey_number": "uint8",
-                "kickoffs_NUM": "uint16",
-                "kickoffs_YDS": "int16",
-                "kickoffs_LONG": "int16",
-            }
-        )
-        kickoffs_df.loc[
-            kickoffs_df["kickoffs_NUM"] > 0,
-            "kickoff_AVG"
-        ] = round(
-            kickoffs_df["kickoffs_YDS"] / kickoffs_df["kickoffs_NUM"], 3
-        )
+def get_cfl_game_stats_schedule(season: int) -> pd.DataFrame:
+    """
+    Given a season, return the games of that season that have game stats
+    (every game that has a score, and a fixture ID).
+    """
+    schedule_df = get_cfl_schedules(season=season)
+    schedule_df = schedule_df[
+        (
+            (schedule_df["team_1_score"] > 0) |
+            (schedule_df["team_2_score"] > 0)
+        ).fillna(False)
+    ]
+    # schedule_df = schedule_df[(schedule_df["eventTypeName"] != "Preseason")]
+    schedule_df = schedule_df.dropna(subset=["fixtureId"])
+    return schedule_df
 
-    if len(punting_df_arr) > 0:
-        punting_df = pd.concat(punting_df_arr, ignore_index=True)
-        punting_df["player_jersey_number"] = punting_df[
-            "player_jersey_number"
-        ].infer_objects(copy=False).fillna(0)
-        punting_df = punting_df.astype(
-            {
-                "player_jersey_number": "uint8",
-                "punting_NO": "uint16",
-                "punting_GROSS_YDS": "int16",
-                "punting_LONG": "int16",
-                "punting_IN_10": "uint16",
-            }
-        )
-        punting_df.loc[
-            punting_df["punting_NO"] > 0,
-            "punting_GROSS_AVG"
-        ] = round(
-            punting_df["punting_GROSS_YDS"] / punting_df["punting_NO"], 3
-        )
 
-    if len(kick_return_df_arr) > 0:
-        kick_return_df = pd.concat(kick_return_df_arr, ignore_index=True)
-        kick_return_df["player_jersey_number"] = kick_return_df[
-            "player_jersey_number"
-        ].infer_objects(copy=False).fillna(0)
-        kick_return_df = kick_return_df.astype(
-            {
-                "player_jersey_number": "uint8",
-                "kick_return_NUM": "uint16",
-                "kick_return_YDS": "int16",
-                "kick_return_LONG": "int16",
-            }
-        )
-        kick_return_df.loc[
-            kick_return_df["kick_return_NUM"] > 0,
-            "kick_return_AVG"
-        ] = round(
-            kick_return_df["kick_return_YDS"] /
-            kick_return_df["kick_return_NUM"],
-            3
-        )
-        # print(kick_return_df.columns)
-
-    if len(punt_return_df_arr) > 0:
-        punt_return_df = pd.concat(punt_return_df_arr, ignore_index=True)
-        punt_return_df["player_jersey_number"] = punt_return_df[
-            "player_jersey_number"
-        ].infer_objects(copy=False).fillna(0)
-        punt_return_df = punt_return_df.astype(
-            {
-                "player_jersey_number": "uint8",
-                "punt_return_NUM": "uint16",
-                "punt_return_YDS": "int16",
-                "punt_return_LONG": "int16",
-            }
-        )
-        punt_return_df.loc[
-            punt_return_df["punt_return_NUM"] > 0,
-            "punt_return_AVG"
-        ] = round(
-            punt_return_df["punt_return_YDS"] /
-            punt_return_df["punt_return_NUM"],
-            3
-        )
-
-    # Combine it all into a single DataFrame
-    stats_df = pd.merge(
-        left=rushing_df,
-        right=passing_df,
-        how="outer",
-        on=[
-            "competitor_id",
-            "player_jersey_number",
-            "player_full_name",
-            "player_abv_name",
-            "player_position",
-            "player_status",
-        ]
+def get_cfl_player_game_stats_url(fixture_id: int, game_id: int) -> str:
+    """ """
+    # url = (
+    #     "https://gsm-widgets.betstream.betgenius.com/widget-data/"
+    #     + "multisportgametracker?productName=democfl_light"
+    #     + f"&fixtureId={fixture_id}&activeContent=playerStats"
+    #     + "&sport=AmericanFootball&sportId=17"
+    #     + "&competitionId=1035&isUsingBetGeniusId=true"
+    # )
+    return (
+        "https://gsm-widgets.betstream.betgenius.com/widget-data" +
+        "/multisportgametracker?productName=democfl_light" +
+        f"&fixtureId={fixture_id}&activeContent=playerStats" +
+        f"&sport=AmericanFootball&sportId=17&competitionId={game_id}" +
+        "&isUsingBetGeniusId=true"
     )
 
-    if len(receiving_df) > 0:
-        stats_df = stats_df.merge(
-            right=receiving_df,
-            how="outer",
-            on=[
-                "competitor_id",
-                "player_jersey_number",
-                "player_full_name",
-                "player_abv_name",
-                "player_position",
-                "player_status",
-            ]
-        )
 
-    if len(defense_df) > 0:
-        stats_df = stats_df.merge(
-            right=defense_df,
-            how="outer",
-            on=[
-                "competitor_id",
-                "player_jersey_number",
-                "player_full_name",
-                "player_abv_name",
-                "player_position",
-                "player_status",
-            ]
-        )
+def get_cfl_team_game_stats_url(fixture_id: int) -> str:
+    """ """
+    return (
+        "https://gsm-widgets.betstream.betgenius.com/widget-data" +
+        "/multisportgametracker?productName=democfl_light" +
+        f"&fixtureId={fixture_id}&activeContent=teamStats" +
+        "&sport=AmericanFootball&sportId=17"
+    )
 
-    if len(kicking_df) > 0:
-        stats_df = stats_df.merge(
-            right=kicking_df,
-            how="outer",
-            on=[
-                "competitor_id",
-                "player_jersey_number",
-                "player_full_name",
-                "player_abv_name",
-                "player_position",
-                "player_status",
-            ]
-        )
 
-    if len(kickoffs_df) > 0:
-        stats_df = stats_df.merge(
-            right=kickoffs_df,
-            how="outer",
-            on=[
-                "competitor_id",
-                "player_jersey_number",
-                "player_full_name",
-                "player_abv_name",
-                "player_position",
-                "player_status",
-            ]
+async def fetch_cfl_team_game_stats_json(
+    engine: FetchEngine,
+    url: str,
+    final: bool = False
+) -> list:
+    """
+    Download the team stats of a game, through a `FetchEngine`.
+
+    If the first response has no data,
+    wait `RETRY_DELAY` seconds and download the team stats a second time.
+
+    Parameters
+    ----------
+    `engine` (FetchEngine, mandatory):
+        The engine to download with.
+
+    `url` (str, mandatory):
+        The team stats URL of the game.
+
+    `final` (bool, optional):
+        If `True`, the game is final,
+        and its response is cached forever.
+
+    Returns
+    ----------
+    A `list` with every `requests.Response` for this game, in order.
+    """
+    responses = [await engine.get(url, final=final)]
+
+    if "fixture information not available" in responses[0].text.lower():
+        return responses
+
+    json_data = json.loads(responses[0].text)
+    if len(json_data["data"]) == 0:
+        await asyncio.sleep(RETRY_DELAY)
+        responses.append(
+            await engine.get(url, final=final, refresh=True)
+        )
+    return responses
+
+
+async def fetch_cfl_game_stats_json(
+    engine: FetchEngine,
+    fixture_id: int,
+    game_id: int,
+    final: bool = False
+) -> tuple:
+    """
+    Download the player stats and the team stats of a game
+    at the same time, through a `FetchEngine`.
+
+    Parameters
+    ----------
+    `engine` (FetchEngine, mandatory):
+        The engine to download with.
+
+    `fixture_id` (int, mandatory):
+        The fixture ID of the game.
+
+    `game_id` (int, mandatory):
+        The game ID (`eventId`) of the game.
+
+    `final` (bool, optional):
+        If `True`, the game is final,
+        and its responses are cached forever.
+
+    Returns
+    ----------
+    A `tuple` with the player stats response of this game,
+    and every team stats response of this game
+    (see `fetch_cfl_team_game_stats_json()`).
+    """
+    player_response, team_responses = await asyncio.gather(
+        engine.get(
+            get_cfl_player_game_stats_url(fixture_id, game_id),
+            final=final
+        ),
+        fetch_cfl_team_game_stats_json(
+            engine,
+            get_cfl_team_game_stats_url(fixture_id),
+            final=final
         )
+    )
+    return player_response, team_responses
 
-    if len(punting_df) > 0:
-        stats_df = stats_df.merge(
-            right=punting_df,
-            how="outer",
-            on=[
-                "competitor_id",
-                "player_jersey_number",
-                "player_full_name",
-                "player_abv_name",
-                "player_position",
-                "player_status",
-            ]
-        )
 
-    if len(kick_return_df) > 0:
-        stats_df = stats_df.merge(
-            right=kick_return_df,
-            how="outer",
-            on=[
-                "competitor_id",
-                "player_jersey_number",
-                "player_full_name",
-                "player_abv_name",
-                "player_position",
-                "player_status",
-            ]
-        )
+def parse_cfl_player_game_stats(
+    season: int,
+    schedule_df: pd.DataFrame,
+    responses_arr: list
+) -> pd.DataFrame:
+    """
+    Parse and save the player stats of every game in a season.
 
-    if len(punt_return_df) > 0:
-        stats_df = stats_df.merge(
-            right=punt_return_df,
-            how="outer",
-            on=[
-                "competitor_id",
-                "player_jersey_number",
-                "player_full_name",
-                "player_abv_name",
-                "player_position",
-                "player_status",
-            ]
-        )
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The season of these games.
 
-    # print(stats_df.columns)
-    stats_df = stats_df.reindex(columns=columns_arr)
-    return stats_df
+    `schedule_df` (pandas.DataFrame, mandatory):
+        The games to parse, from `get_cfl_game_stats_schedule()`.
 
+    `responses_arr` (list, mandatory):
+        The player stats response of each game in `schedule_df`,
+        in the same order.
 
-def get_cfl_player_game_stats(season: int) -> pd.DataFrame:
-    """ """
+    Returns
+    ----------
+    A pandas `DataFrame` with the player stats of every game.
+    """
     now = datetime.now()
     stats_df = pd.DataFrame()
     stats_df_arr = []
-    schedule_df = get_cfl_schedules(season=season)
-    schedule_df = schedule_df[
-        (schedule_df["team_1_score"] > 0) | (schedule_df["team_2_score"] > 0)
-    ]
-    # schedule_df = schedule_df[(schedule_df["eventTypeName"] != "Preseason")]
-    schedule_df = schedule_df.dropna(subset=["fixtureId"])
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4)"
-        + " AppleWebKit/537.36 (KHTML, like Gecko) "
-        + "Chrome/138.0.0.0 Safari/537.36",
-    }
     game_ids_arr = schedule_df["eventId"].to_list()
-    fixture_ids_arr = schedule_df["fixtureId"].to_list()
     season_type_arr = schedule_df["eventTypeName"].to_list()
 
     for i in tqdm(range(0, len(game_ids_arr))):
-        fixture_id = fixture_ids_arr[i]
         game_id = game_ids_arr[i]
 
         season_type = season_type_arr[i]
@@ -806,19 +490,7 @@ def get_cfl_player_game_stats(season: int) -> pd.DataFrame:
         if "grey cup" in season_type.lower():
             season_type = "Playoffs"
 
-        # url = (
-        #     "https://gsm-widgets.betstream.betgenius.com/widget-data/"
-        #     + "multisportgametracker?productName=democfl_light"
-        #     + f"&fixtureId={fixture_id}&activeContent=playerStats"
-        #     + "&sport=AmericanFootball&sportId=17"
-        #     + "&competitionId=1035&isUsingBetGeniusId=true"
-        # )
-        url = "https://gsm-widgets.betstream.betgenius.com/widget-data" +\
-            "/multisportgametracker?productName=democfl_light" +\
-            f"&fixtureId={fixture_id}&activeContent=playerStats" +\
-            f"&sport=AmericanFootball&sportId=17&competitionId={game_id}" +\
-            "&isUsingBetGeniusId=true"
-        response = requests.get(url=url, headers=headers)
+        response = responses_arr[i]
 
         json_data = json.loads(response.text)
         json_data = json_data["data"]
@@ -864,37 +536,73 @@ def get_cfl_player_game_stats(season: int) -> pd.DataFrame:
                 f"\nUnhandled exception when parsing game ID {game_id} `{e}`"
             )
 
-        time.sleep(2)
     if len(stats_df_arr) > 0:
         stats_df = pd.concat(stats_df_arr, ignore_index=True)
         stats_df["last_updated"] = now.isoformat()
         stats_df["season"] = season
+        stats_df = apply_schema(stats_df, PLAYER_GAME_STATS_ARROW_SCHEMA)
 
         stats_df.to_csv(
             f"player_stats/game_stats/{season}_cfl_player_game_stats.csv",
             index=False
         )
+        write_parquet(
+            stats_df,
+            "player_stats/game_stats/" +
+            f"{season}_cfl_player_game_stats.parquet",
+            PLAYER_GAME_STATS_ARROW_SCHEMA
+        )
+        update_player_crosswalk("game_stats", stats_df)
 
     return stats_df
 
 
-def get_cfl_team_game_stats(season: int) -> pd.DataFrame:
+def get_cfl_player_game_stats(season: int) -> pd.DataFrame:
     """ """
+    schedule_df = get_cfl_game_stats_schedule(season)
+    urls_arr = [
+        get_cfl_player_game_stats_url(fixture_id, game_id)
+        for fixture_id, game_id in zip(
+            schedule_df["fixtureId"].to_list(),
+            schedule_df["eventId"].to_list()
+        )
+    ]
+    is_final_arr = (
+        schedule_df["eventStatus_name"] == FINAL_EVENT_STATUS
+    ).to_list()
+    # Every game is downloaded concurrently, then parsed in schedule order.
+    responses_arr = fetch_all(list(zip(urls_arr, is_final_arr)), fetch_url)
+    return parse_cfl_player_game_stats(season, schedule_df, responses_arr)
+
+
+def parse_cfl_team_game_stats(
+    season: int,
+    schedule_df: pd.DataFrame,
+    responses_arr: list
+) -> pd.DataFrame:
+    """
+    Parse and save the team stats of every game in a season.
+
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The season of these games.
+
+    `schedule_df` (pandas.DataFrame, mandatory):
+        The games to parse, from `get_cfl_game_stats_schedule()`.
+
+    `responses_arr` (list, mandatory):
+        The team stats responses of each game in `schedule_df`,
+        in the same order (see `fetch_cfl_team_game_stats_json()`).
+
+    Returns
+    ----------
+    A pandas `DataFrame` with the team stats of every game.
+    """
     now = datetime.now()
     stats_df = pd.DataFrame()
     stats_df_arr = []
     temp_df = pd.DataFrame()
-    schedule_df = get_cfl_schedules(season=season)
-    schedule_df = schedule_df[
-        (schedule_df["team_1_score"] > 0) | (schedule_df["team_2_score"] > 0)
-    ]
-    # schedule_df = schedule_df[(schedule_df["eventTypeName"] != "Preseason")]
-    schedule_df = schedule_df.dropna(subset=["fixtureId"])
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4)"
-        + " AppleWebKit/537.36 (KHTML, like Gecko) "
-        + "Chrome/138.0.0.0 Safari/537.36",
-    }
     game_ids_arr = schedule_df["eventId"].to_list()
     fixture_ids_arr = schedule_df["fixtureId"].to_list()
     season_type_arr = schedule_df["eventTypeName"].to_list()
@@ -960,19 +668,7 @@ def get_cfl_team_game_stats(season: int) -> pd.DataFrame:
         if "grey cup" in season_type.lower():
             season_type = "Playoffs"
 
-        # url = (
-        #     "https://gsm-widgets.betstream.betgenius.com/widget-data/"
-        #     + "multisportgametracker?productName=democfl_light"
-        #     + f"&fixtureId={fixture_id}&activeContent=playerStats"
-        #     + "&sport=AmericanFootball&sportId=17"
-        #     + "&competitionId=1035&isUsingBetGeniusId=true"
-        # )
-        url = "https://gsm-widgets.betstream.betgenius.com/widget-data" +\
-            "/multisportgametracker?productName=democfl_light" +\
-            f"&fixtureId={fixture_id}&activeContent=teamStats" +\
-            "&sport=AmericanFootball&sportId=17"
-        response = requests.get(url=url, headers=headers)
-        time.sleep(2)
+        response = responses_arr[i][0]
 
         json_data = json.loads(response.text)
 
@@ -981,10 +677,7 @@ def get_cfl_team_game_stats(season: int) -> pd.DataFrame:
         json_data = json_data["data"]
 
         if len(json_data) == 0:
-            time.sleep(15)
-
-            response = requests.get(url=url, headers=headers)
-            time.sleep(2)
+            response = responses_arr[i][1]
 
             json_data = json.loads(response.text)
 
@@ -1213,13 +906,82 @@ def get_cfl_team_game_stats(season: int) -> pd.DataFrame:
     if len(stats_df_arr) > 0:
         stats_df = pd.concat(stats_df_arr, ignore_index=True)
         stats_df["last_updated"] = now.isoformat()
+        stats_df = apply_schema(stats_df, TEAM_GAME_STATS_ARROW_SCHEMA)
         stats_df.to_csv(
             f"team_stats/game_stats/{season}_cfl_team_game_stats.csv",
             index=False
         )
+        write_parquet(
+            stats_df,
+            f"team_stats/game_stats/{season}_cfl_team_game_stats.parquet",
+            TEAM_GAME_STATS_ARROW_SCHEMA
+        )
     return stats_df
 
 
+def get_cfl_team_game_stats(season: int) -> pd.DataFrame:
+    """ """
+    schedule_df = get_cfl_game_stats_schedule(season)
+    urls_arr = [
+        get_cfl_team_game_stats_url(fixture_id)
+        for fixture_id in schedule_df["fixtureId"].to_list()
+    ]
+    is_final_arr = (
+        schedule_df["eventStatus_name"] == FINAL_EVENT_STATUS
+    ).to_list()
+    # Every game is downloaded concurrently, then parsed in schedule order.
+    responses_arr = fetch_all(
+        list(zip(urls_arr, is_final_arr)),
+        fetch_cfl_team_game_stats_json
+    )
+    return parse_cfl_team_game_stats(season, schedule_df, responses_arr)
+
+
+def get_cfl_game_stats(season: int) -> tuple:
+    """
+    Get the player stats and the team stats of every game in a season,
+    reading the schedule once,
+    and downloading both stats of each game at the same time.
+
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The season you want game stats from.
+
+    Returns
+    ----------
+    A `tuple` with two pandas `DataFrame`s,
+    the player game stats and the team game stats of this season.
+    """
+    schedule_df = get_cfl_game_stats_schedule(season)
+    is_final_arr = (
+        schedule_df["eventStatus_name"] == FINAL_EVENT_STATUS
+    ).to_list()
+    # Every game is downloaded concurrently, then parsed in schedule order.
+    responses_arr = fetch_all(
+        list(
+            zip(
+                schedule_df["fixtureId"].to_list(),
+                schedule_df["eventId"].to_list(),
+                is_final_arr
+            )
+        ),
+        fetch_cfl_game_stats_json
+    )
+
+    player_stats_df = parse_cfl_player_game_stats(
+        season,
+        schedule_df,
+        [player_response for player_response, _ in responses_arr]
+    )
+    team_stats_df = parse_cfl_team_game_stats(
+        season,
+        schedule_df,
+        [team_responses for _, team_responses in responses_arr]
+    )
+    return player_stats_df, team_stats_df
+
+
 if __name__ == "__main__":
     now = datetime.now()
     season = now.year
@@ -1246,7 +1008,7 @@ if __name__ == "__main__":
         logging.info("`./team_stats/game_stats` already exists.")
 
     for i in range(season, season+1):
-        print(f"Getting {i} player game stats.")
-        print(get_cfl_player_game_stats(i))
-        print(f"Getting {i} team game stats.")
-        print(get_cfl_team_game_stats(i))
+        print(f"Getting {i} player and team game stats.")
+        player_stats_df, team_stats_df = get_cfl_game_stats(i)
+        print(player_stats_df)
+        print(team_stats_df)
@@ -1,12 +1,14 @@
 import logging
 import os
-import time
 from datetime import datetime
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
+from http_client import http_get
+from parquet_io import write_parquet
+from schemas import NEGOTIATION_LISTS_ARROW_SCHEMA, apply_schema
+
 
 def get_negotiation_lists():
     """ """
@@ -28,14 +30,7 @@ def get_negotiation_lists():
 
     url = "https://www.cfl.ca/negotiation-list/"
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4)"
-        + " AppleWebKit/537.36 (KHTML, like Gecko) "
-        + "Chrome/138.0.0.0 Safari/537.36",
-    }
-
-    response = requests.get(url=url, headers=headers)
-    time.sleep(1)
+    response = http_get(url)
     soup = BeautifulSoup(response.text, features="lxml")
     team_lists = soup.find_all("li", {"role": "tab", "class": "week-row"})
     for team in team_lists:
@@ -63,10 +58,17 @@ def get_negotiation_lists():
     data_df = pd.concat(data_df_arr, ignore_index=True)
     data_df["last_update"] = datetime_iso
     data_df["update_date"] = date_str
+    data_df = apply_schema(data_df, NEGOTIATION_LISTS_ARROW_SCHEMA)
     data_df.to_csv(
         f"rosters/negotiation_list/{date_str}_cfl_negotiation_lists.csv",
         index=False
     )
+    write_parquet(
+        data_df,
+        "rosters/negotiation_list/" +
+        f"{date_str}_cfl_negotiation_lists.parquet",
+        NEGOTIATION_LISTS_ARROW_SCHEMA
+    )
 
 
 if __name__ == "__main__":
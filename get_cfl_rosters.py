@@ -1,16 +1,22 @@
 import json
 import logging
 import os
-import time
 from datetime import datetime
 
 import numpy as np
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
 from get_schedules import get_cfl_schedules
+from http_client import http_get
+from parquet_io import write_parquet
+from player_crosswalk import update_player_crosswalk
+from schemas import (
+    ROSTERS_ARROW_SCHEMA,
+    STATS_CREW_ROSTERS_ARROW_SCHEMA,
+    apply_schema,
+)
 
 
 def parse_cfl_player_url(player_url: str) -> int:
@@ -44,11 +50,6 @@ def get_cfl_rosters():
         "https://www.cfl.ca/wp-content/themes/cfl.ca/inc/"
         + "admin-ajax.php?action=get_all_players"
     )
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4)"
-        + " AppleWebKit/537.36 (KHTML, like Gecko) "
-        + "Chrome/138.0.0.0 Safari/537.36",
-    }
     # rosters_df = pd.DataFrame()
     schedule_df = get_cfl_schedules(season)
     schedule_df = schedule_df[schedule_df["eventStatus_name"] != "Pre-Game"]
@@ -66,9 +67,9 @@ def get_cfl_rosters():
     elif len(schedule_df) == 0:
         week = 0
     else:
-        week = max(schedule_df["week"].to_list()) + 1
+        week = int(schedule_df["week"].max()) + 1
 
-    response = requests.get(url=url, headers=headers)
+    response = http_get(url)
 
     json_data = json.loads(response.text)
     json_data = json_data["data"]
@@ -94,20 +95,6 @@ def get_cfl_rosters():
     players_df["weight"] = pd.to_numeric(players_df["weight"], errors="coerce")
     players_df["age"] = pd.to_numeric(players_df["age"], errors="coerce")
     players_df = players_df.replace(r"^\s*$", np.nan, regex=True)
-    players_df = players_df.astype(
-        {
-            # "jersey_num": "uint16",
-            "player_name": "string",
-            "current_team_abv": "string",
-            "position": "string",
-            "import_status": "string",
-            "height": "string",
-            # "weight": "uint16",
-            # "age": "uint16",
-            "college": "string",
-            "player_url": "string",
-        }
-    )
     players_df = players_df.sort_values(
         ["current_team_abv", "jersey_num", "player_url"]
     )
@@ -122,17 +109,35 @@ def get_cfl_rosters():
     players_df = players_df.replace(r"^\s*$", np.nan, regex=True)
     rosters_df = players_df.dropna(subset=["current_team_abv"])
     players_df.loc[players_df["player_id"] != 0, "season"] = season
+    players_df = apply_schema(players_df, ROSTERS_ARROW_SCHEMA)
+    rosters_df = apply_schema(rosters_df, ROSTERS_ARROW_SCHEMA)
 
     players_df.to_csv("rosters/cfl_players.csv", index=False)
+    write_parquet(
+        players_df,
+        "rosters/cfl_players.parquet",
+        ROSTERS_ARROW_SCHEMA
+    )
 
     rosters_df.to_csv(f"rosters/{now.year}_cfl_rosters.csv", index=False)
+    write_parquet(
+        rosters_df,
+        f"rosters/{now.year}_cfl_rosters.parquet",
+        ROSTERS_ARROW_SCHEMA
+    )
     rosters_df.loc[players_df["player_id"] != 0, "week"] = week
+    rosters_df = apply_schema(rosters_df, ROSTERS_ARROW_SCHEMA)
 
     rosters_df.to_csv(
         f"rosters/weekly/{now.year}-{week:02d}_cfl_weekly_rosters.csv",
         index=False
     )
-    rosters_df
+    write_parquet(
+        rosters_df,
+        f"rosters/weekly/{now.year}-{week:02d}_cfl_weekly_rosters.parquet",
+        ROSTERS_ARROW_SCHEMA
+    )
+    update_player_crosswalk("cfl_rosters", rosters_df, season=season)
     return rosters_df, players_df
 
 
@@ -148,12 +153,6 @@ def get_stats_crew_cfl_rosters(season: int):
     except FileExistsError:
         logging.info("`./weekly` already exists.")
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4)"
-        + " AppleWebKit/537.36 (KHTML, like Gecko) "
-        + "Chrome/138.0.0.0 Safari/537.36",
-    }
-
     # now = datetime.now()
 
     # for season in range(2021, now.year+1):
@@ -163,8 +162,7 @@ def get_stats_crew_cfl_rosters(season: int):
 
     initial_url = f"https://www.statscrew.com/football/l-CFL/y-{season}"
     urls_arr = []
-    response = requests.get(url=initial_url, headers=headers)
-    time.sleep(5)
+    response = http_get(initial_url)
     soup = BeautifulSoup(response.text, features="lxml")
 
     base_urls_arr = soup.find_all("a")
@@ -178,8 +176,7 @@ def get_stats_crew_cfl_rosters(season: int):
         team_id = url.split("/y-")[0]
         team_id = team_id.split("/t-")[1]
         team_id = team_id.replace("CFL", "")
-        response = requests.get(url=url, headers=headers)
-        time.sleep(5)
+        response = http_get(url)
         soup = BeautifulSoup(response.text, features="lxml")
 
         table_html = soup.find("table", {"class": "sortable"})
@@ -226,10 +223,17 @@ def get_stats_crew_cfl_rosters(season: int):
     roster_df[["player_first_name", "player_last_name"]] = roster_df[
         "player_full_name"
     ].str.split(" ", n=1, expand=True)
+    roster_df = apply_schema(roster_df, STATS_CREW_ROSTERS_ARROW_SCHEMA)
     roster_df.to_csv(
         f"rosters/{season}_stats_crew_cfl_rosters.csv",
         index=False
     )
+    write_parquet(
+        roster_df,
+        f"rosters/{season}_stats_crew_cfl_rosters.parquet",
+        STATS_CREW_ROSTERS_ARROW_SCHEMA
+    )
+    update_player_crosswalk("stats_crew_rosters", roster_df, season=season)
     return roster_df
 
 
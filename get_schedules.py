@@ -1,35 +1,69 @@
 import json
 import logging
 import os
+import time
 from datetime import datetime
 
 import pandas as pd
-import requests
 from tqdm import tqdm
 
+from parquet_io import write_parquet
+from response_cache import DEFAULT_TTL, cached_http_get
+from schemas import SCHEDULE_ARROW_SCHEMA, apply_schema, read_dataset
 
-def get_cfl_schedules(season: int) -> pd.DataFrame:
+# The `eventStatus_name` of a game that is over,
+# and whose data will not change anymore.
+FINAL_EVENT_STATUS = "Final"
+# The `eventStatus_name` of a game that has not started yet.
+PRE_GAME_EVENT_STATUS = "Pre-Game"
+# The `eventStatus_name` values of a game that is being played.
+# Games that are postponed, cancelled, or suspended are not in here.
+IN_PROGRESS_EVENT_STATUSES = (
+    "In Progress",
+    "Half Time",
+    "Halftime",
+    "End of Period",
+    "Overtime",
+)
+# How long (in seconds) the saved schedule of a season that is not over
+# can be reused by a new run before it is downloaded again.
+SCHEDULE_TTL = DEFAULT_TTL
+SCHEDULE_SNAPSHOT_DIR = "cache/schedules"
+# The schedule columns `ScheduleProvider` can look games up by.
+SCHEDULE_INDEX_COLUMNS = ("fixtureId", "eventId", "week", "eventStatus_name")
+
+
+def download_cfl_schedules(
+    season: int,
+    ttl: float = SCHEDULE_TTL,
+    refresh: bool = False
+) -> pd.DataFrame:
     """
     Given a season, download, parse, and return CFL schedule data
     back as a pandas `DataFrame` (think spreadsheet).
 
+    Unlike `get_cfl_schedules()`, this parses the schedule again
+    every time it is called.
+
     Parameters
     ----------
     `season` (int, mandatory):
         The season you want a CFL schedule for.
 
+    `ttl` (float, optional):
+        How old (in seconds) a cached response can be
+        before the schedule is downloaded again.
+
+    `refresh` (bool, optional):
+        If `True`, ignore any cached response and download it again.
+
     Returns
     ----------
     A pandas `DataFrame` with CFL schedule data.
     """
     url = "https://www.cfl.ca/wp-content/themes/cfl.ca/inc/" +\
         f"admin-ajax.php?action=scoreboard&lang=en&week=all&season={season}"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4)"
-        + " AppleWebKit/537.36 (KHTML, like Gecko) "
-        + "Chrome/138.0.0.0 Safari/537.36",
-    }
-    response = requests.get(url=url, headers=headers)
+    response = cached_http_get(url, ttl=ttl, refresh=refresh)
     json_data = json.loads(response.text)
     schedule_df = pd.json_normalize(json_data)
     schedule_df["startDate"] = pd.to_datetime(
@@ -37,22 +71,6 @@ def get_cfl_schedules(season: int) -> pd.DataFrame:
     ).dt.tz_convert("UTC")
     # schedule_df = schedule_df.infer_objects()
     print()
-    # print(schedule_df.memory_usage(index=False))
-    schedule_df = schedule_df.astype(
-        {
-            "eventId": "uint16",
-            "fixtureId": "uint64",
-            # "startDate": "datetime64[ns]",
-            "eventTypeId": "uint8",
-            "eventStatus_eventStatusId": "uint8",
-            "eventStatus_name": "string",
-            "eventStatus_period": "uint8",
-        },
-        errors="ignore",
-        # errors="raise"
-    )
-    # print(schedule_df.memory_usage(index=False))
-    # print(schedule_df.dtypes)
     schedule_df["week"] = pd.to_numeric(schedule_df["week"], errors="coerce")
     schedule_df["day_of_week"] = schedule_df["startDate"].dt.day_name()
     try:
@@ -61,10 +79,247 @@ def get_cfl_schedules(season: int) -> pd.DataFrame:
         )
     except Exception as e:
         logging.info(f"Unhandled exception `{e}`.")
+    schedule_df = apply_schema(schedule_df, SCHEDULE_ARROW_SCHEMA)
     # schedule_df.to_csv("test.csv", index=False)
     return schedule_df
 
 
+def is_final_schedule(schedule_df: pd.DataFrame) -> bool:
+    """
+    Given the schedule of a season,
+    return `True` if every game in it is final,
+    so the schedule will not change anymore.
+    """
+    return bool(
+        len(schedule_df) > 0 and
+        (schedule_df["eventStatus_name"] == FINAL_EVENT_STATUS).all()
+    )
+
+
+class ScheduleProvider:
+    """
+    Keeps the schedule of every season that was asked for in memory,
+    so every scraper in a run shares one download (and one parse)
+    of each schedule.
+
+    A schedule kept in memory is used for the rest of the process,
+    so every scraper in a run sees the same schedule.
+    Schedules are also saved as snapshots on disk,
+    so the next run can reuse them without downloading them again,
+    unless they are older than `ttl`, and not every game in them is final.
+
+    Parameters
+    ----------
+    `ttl` (float, optional):
+        How old (in seconds) the snapshot of a season that is not over
+        can be before it is downloaded again.
+
+    `snapshot_dir` (str, optional):
+        Where to save schedule snapshots.
+        If `None`, schedules are only kept in memory.
+
+    `memory_ttl` (float, optional):
+        If set, how old (in seconds) the schedule of a season
+        that is not over can be kept in memory
+        before it is loaded again (for long-running processes,
+        like `watch_cfl_pbp.py`).
+        If not set, it is kept for the rest of the process.
+    """
+
+    def __init__(
+        self,
+        ttl: float = SCHEDULE_TTL,
+        snapshot_dir: str = SCHEDULE_SNAPSHOT_DIR,
+        memory_ttl: float = None
+    ):
+        self.ttl = ttl
+        self.snapshot_dir = snapshot_dir
+        self.memory_ttl = memory_ttl
+        # season -> (when the schedule was downloaded, the schedule)
+        self._schedules = {}
+        # season -> column -> value -> the row positions with that value
+        self._indexes = {}
+
+    def _is_fresh(
+        self,
+        loaded_at: float,
+        schedule_df: pd.DataFrame,
+        ttl: float
+    ) -> bool:
+        """ """
+        return (
+            ttl is None or
+            is_final_schedule(schedule_df) or
+            time.time() - loaded_at <= ttl
+        )
+
+    def _get_snapshot_path(self, season: int) -> str:
+        """ """
+        return f"{self.snapshot_dir}/{season}_cfl_schedule.parquet"
+
+    def _load_snapshot(self, season: int) -> tuple:
+        """
+        Load the snapshot of a season, if there is one that can still be used.
+        """
+        if self.snapshot_dir is None:
+            return None
+        snapshot_path = self._get_snapshot_path(season)
+        try:
+            loaded_at = os.path.getmtime(snapshot_path)
+            schedule_df = read_dataset(snapshot_path, SCHEDULE_ARROW_SCHEMA)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logging.warning(
+                "Ignoring the unreadable schedule snapshot " +
+                f"`{snapshot_path}`: {e}"
+            )
+            return None
+
+        if not self._is_fresh(loaded_at, schedule_df, self.ttl):
+            return None
+        return loaded_at, schedule_df
+
+    def _save_snapshot(self, season: int, schedule_df: pd.DataFrame):
+        """ """
+        if self.snapshot_dir is None:
+            return
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        write_parquet(
+            schedule_df,
+            self._get_snapshot_path(season),
+            SCHEDULE_ARROW_SCHEMA
+        )
+
+    def get(self, season: int, refresh: bool = False) -> pd.DataFrame:
+        """
+        Given a season, return its schedule,
+        downloading it only if there is no usable copy of it.
+
+        Parameters
+        ----------
+        `season` (int, mandatory):
+            The season you want a CFL schedule for.
+
+        `refresh` (bool, optional):
+            If `True`, download the schedule again,
+            even if there is a usable copy of it.
+
+        Returns
+        ----------
+        A pandas `DataFrame` with CFL schedule data.
+        Every caller gets the same `DataFrame`,
+        so it must not be modified in place.
+        """
+        entry = None if refresh else self._schedules.get(season)
+        if entry is not None and self._is_fresh(*entry, self.memory_ttl):
+            return entry[1]
+
+        entry = None if refresh else self._load_snapshot(season)
+        if entry is None:
+            schedule_df = download_cfl_schedules(
+                season,
+                ttl=self.ttl,
+                refresh=refresh
+            )
+            entry = (time.time(), schedule_df)
+            self._save_snapshot(season, schedule_df)
+
+        self._schedules[season] = entry
+        self._indexes[season] = {
+            column: entry[1].groupby(
+                column,
+                sort=False,
+                observed=True
+            ).indices
+            for column in SCHEDULE_INDEX_COLUMNS
+            if column in entry[1].columns
+        }
+        return entry[1]
+
+    def _lookup(self, season: int, column: str, value) -> pd.DataFrame:
+        """ """
+        schedule_df = self.get(season)
+        positions = self._indexes[season].get(column, {}).get(value, [])
+        return schedule_df.iloc[positions]
+
+    def get_game_by_fixture_id(self, season: int, fixture_id: int):
+        """
+        Given a season and a fixture ID,
+        return the schedule row of that game as a pandas `Series`,
+        or `None` if it is not in the schedule of that season.
+        """
+        games_df = self._lookup(season, "fixtureId", fixture_id)
+        return games_df.iloc[0] if len(games_df) > 0 else None
+
+    def get_game_by_event_id(self, season: int, event_id: int):
+        """
+        Given a season and a game ID (`eventId`),
+        return the schedule row of that game as a pandas `Series`,
+        or `None` if it is not in the schedule of that season.
+        """
+        games_df = self._lookup(season, "eventId", event_id)
+        return games_df.iloc[0] if len(games_df) > 0 else None
+
+    def get_week(self, season: int, week: int) -> pd.DataFrame:
+        """
+        Given a season and a week, return every game of that week.
+        """
+        return self._lookup(season, "week", week)
+
+    def get_games_by_status(self, season: int, status: str) -> pd.DataFrame:
+        """
+        Given a season and an `eventStatus_name`
+        (for example, `FINAL_EVENT_STATUS`),
+        return every game of that season with that status.
+        """
+        return self._lookup(season, "eventStatus_name", status)
+
+    def clear(self):
+        """
+        Forget every schedule kept in memory
+        (snapshots on disk are kept).
+        """
+        self._schedules = {}
+        self._indexes = {}
+
+
+# The `ScheduleProvider` shared by every scraper in this process.
+_schedule_provider = ScheduleProvider()
+
+
+def get_schedule_provider() -> ScheduleProvider:
+    """
+    Return the `ScheduleProvider` shared by every scraper in this process.
+    """
+    return _schedule_provider
+
+
+def get_cfl_schedules(season: int, refresh: bool = False) -> pd.DataFrame:
+    """
+    Given a season, return CFL schedule data
+    back as a pandas `DataFrame` (think spreadsheet).
+
+    The schedule of each season is downloaded once per run,
+    and shared by every scraper that asks for it
+    (see `ScheduleProvider`).
+
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The season you want a CFL schedule for.
+
+    `refresh` (bool, optional):
+        If `True`, download the schedule again,
+        even if there is a usable copy of it.
+
+    Returns
+    ----------
+    A pandas `DataFrame` with CFL schedule data.
+    """
+    return get_schedule_provider().get(season, refresh=refresh)
+
+
 if __name__ == "__main__":
     now = datetime.now()
     now_timestamp = now.isoformat()
@@ -88,3 +343,8 @@ if __name__ == "__main__":
             f"schedule/{i}_cfl_schedule.csv",
             index=False
         )
+        write_parquet(
+            df,
+            f"schedule/{i}_cfl_schedule.parquet",
+            SCHEDULE_ARROW_SCHEMA
+        )
@@ -3,9 +3,13 @@ import json
 import logging
 import os
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
+from http_client import http_get
+from parquet_io import write_parquet
+from player_crosswalk import update_player_crosswalk
+from schemas import TRANSACTIONS_ARROW_SCHEMA, apply_schema
+
 
 def parse_player_id(html_string: str) -> str:
     """
@@ -69,11 +73,6 @@ def get_cfl_transactions(season: int) -> pd.DataFrame:
     ----------
     A pandas `DataFrame` with CFL transaction data.
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4)"
-        + " AppleWebKit/537.36 (KHTML, like Gecko) "
-        + "Chrome/138.0.0.0 Safari/537.36",
-    }
     transactions_df = pd.DataFrame()
     # transaction_df_arr = []
     url = (
@@ -81,7 +80,7 @@ def get_cfl_transactions(season: int) -> pd.DataFrame:
         + f"action=get_transactions&season={season}"
     )
 
-    response = requests.get(url=url, headers=headers)
+    response = http_get(url)
 
     json_data = json.loads(response.text)
     json_data = json_data["data"]
@@ -107,7 +106,12 @@ def get_cfl_transactions(season: int) -> pd.DataFrame:
     transactions_df = transactions_df.drop(
         columns=["player_html"]
     )
+    transactions_df = apply_schema(
+        transactions_df,
+        TRANSACTIONS_ARROW_SCHEMA
+    )
     print(transactions_df)
+    update_player_crosswalk("transactions", transactions_df, season=season)
     # transactions_df.to_csv("test.csv", index=False)
     # print(json_data)
     return transactions_df
@@ -140,3 +144,8 @@ if __name__ == "__main__":
             f"transactions/{now.year}_cfl_transactions.csv",
             index=False
         )
+        write_parquet(
+            df,
+            f"transactions/{now.year}_cfl_transactions.parquet",
+            TRANSACTIONS_ARROW_SCHEMA
+        )
@@ -0,0 +1,139 @@
+import logging
+import threading
+from importlib.util import find_spec
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limiter import get_rate_limiter
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4)"
+    + " AppleWebKit/537.36 (KHTML, like Gecko) "
+    + "Chrome/138.0.0.0 Safari/537.36"
+)
+
+# `urllib3` can only decode brotli responses
+# if a brotli package is installed, so only ask for them if it is.
+if find_spec("brotli") or find_spec("brotlicffi"):
+    ACCEPT_ENCODING = "gzip, deflate, br"
+else:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+# Every host these scripts download data from.
+# Each one gets its own pooled, keep-alive `requests.Session`.
+HTTP_HOSTS = (
+    "cfl.ca",
+    "gsm-widgets.betstream.betgenius.com",
+    "statscrew.com",
+)
+HTTP_POOL_SIZE = 10
+# How long to wait before downloading a URL again,
+# when the first response did not have the data in it yet.
+RETRY_DELAY = 15
+
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def get_host(url: str) -> str:
+    """
+    Given a URL, return the host in `HTTP_HOSTS` it belongs to.
+
+    Parameters
+    ----------
+    `url` (str, mandatory):
+        The URL you want the host of.
+
+    Returns
+    ----------
+    The matching host in `HTTP_HOSTS`
+    (`www.cfl.ca` -> `cfl.ca`),
+    or the hostname of `url` if it matches none of them.
+    """
+    hostname = (urlsplit(url).hostname or "").lower()
+    for host in HTTP_HOSTS:
+        if hostname == host or hostname.endswith(f".{host}"):
+            return host
+    return hostname
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    Given a URL, return the shared `requests.Session` for its host,
+    creating it the first time that host is seen.
+
+    Parameters
+    ----------
+    `url` (str, mandatory):
+        The URL you want to download.
+
+    Returns
+    ----------
+    A `requests.Session` with keep-alive connection pooling,
+    and the headers every request to that host should send.
+    """
+    host = get_host(url)
+
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(host)
+        if session is None:
+            logging.info(f"Opening a new HTTP session for `{host}`.")
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=HTTP_POOL_SIZE
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(
+                {
+                    "User-Agent": USER_AGENT,
+                    "Accept-Encoding": ACCEPT_ENCODING,
+                    "Connection": "keep-alive",
+                }
+            )
+            _SESSIONS[host] = session
+    return session
+
+
+def http_get(
+    url: str,
+    rate_limited: bool = True,
+    **kwargs
+) -> requests.Response:
+    """
+    Download `url` with the shared session for its host,
+    waiting for the rate limiter of that host first.
+
+    Parameters
+    ----------
+    `url` (str, mandatory):
+        The URL you want to download.
+
+    `rate_limited` (bool, optional):
+        If `False`, do not wait for the rate limiter of this host.
+        Only set this if the caller already took a token
+        from that rate limiter.
+
+    `**kwargs`:
+        Passed through to `requests.Session.get()`.
+
+    Returns
+    ----------
+    The `requests.Response` for `url`.
+    """
+    if rate_limited:
+        get_rate_limiter(get_host(url)).acquire()
+    return get_session(url).get(url=url, **kwargs)
+
+
+def close_sessions():
+    """
+    Close every shared session, and the connections they hold open.
+    """
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
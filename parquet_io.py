@@ -0,0 +1,152 @@
+import logging
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+PARQUET_COMPRESSION = "zstd"
+
+
+def _is_missing(value) -> bool:
+    """ """
+    return value is None or value is pd.NA or (
+        isinstance(value, float) and value != value
+    )
+
+
+def _infer_arrow_array(values: pd.Series) -> pa.Array:
+    """
+    Convert one column of a `DataFrame` with the type Arrow infers for it,
+    or to strings if its values have more than one type.
+    """
+    try:
+        return pa.array(values, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array(
+            values.map(lambda x: None if _is_missing(x) else str(x)),
+            type=pa.string()
+        )
+
+
+def _to_arrow_array(
+    column: str,
+    values: pd.Series,
+    arrow_type: pa.DataType
+) -> pa.Array:
+    """
+    Convert one column of a `DataFrame` to `arrow_type`.
+
+    Numbers that were scraped as text are parsed,
+    empty strings in numeric columns become nulls,
+    and anything that is not a string in a string column
+    is written out as one.
+    If a column still does not fit `arrow_type`,
+    it keeps the type Arrow infers for it, and a warning is logged,
+    so a surprise in the source data never loses any of it.
+    """
+    try:
+        return pa.array(values, type=arrow_type, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        error = e
+
+    if pa.types.is_string(arrow_type) or pa.types.is_dictionary(arrow_type):
+        return pa.array(
+            values.map(lambda x: None if _is_missing(x) else str(x)),
+            type=arrow_type,
+            from_pandas=True
+        )
+
+    if pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type):
+        try:
+            values = pd.to_numeric(
+                values.map(
+                    lambda x: None
+                    if isinstance(x, str) and len(x.strip()) == 0
+                    else x
+                )
+            )
+            return pa.array(values, type=arrow_type, from_pandas=True)
+        except (TypeError, ValueError) as e:
+            error = e
+
+    logging.warning(
+        f"`{column}` could not be stored as `{arrow_type}`, " +
+        f"and was stored with an inferred type instead: {error}"
+    )
+    return _infer_arrow_array(values)
+
+
+def to_arrow_table(df: pd.DataFrame, schema: pa.Schema) -> pa.Table:
+    """
+    Given a pandas `DataFrame` and its Arrow schema,
+    return an Arrow `Table` with the types declared in that schema.
+
+    Parameters
+    ----------
+    `df` (pandas.DataFrame, mandatory):
+        The data you want to convert.
+
+    `schema` (pyarrow.Schema, mandatory):
+        The declared schema of this dataset (see `schemas.py`).
+        Columns of `df` that `schema` does not declare
+        keep the type Arrow infers for them.
+
+    Returns
+    ----------
+    A `pyarrow.Table` with the columns of `df`, in the same order.
+    """
+    arrays_arr = []
+    fields_arr = []
+
+    for column in df.columns:
+        column_name = str(column)
+        if column_name in schema.names:
+            array = _to_arrow_array(
+                column_name,
+                df[column],
+                schema.field(column_name).type
+            )
+        else:
+            array = _infer_arrow_array(df[column])
+        arrays_arr.append(array)
+        fields_arr.append(pa.field(column_name, array.type))
+
+    return pa.Table.from_arrays(arrays_arr, schema=pa.schema(fields_arr))
+
+
+def write_parquet(
+    df: pd.DataFrame,
+    path: str,
+    schema: pa.Schema,
+    metadata: dict = None
+):
+    """
+    Save a pandas `DataFrame` as a Parquet file,
+    with the types declared in its Arrow schema.
+
+    Parameters
+    ----------
+    `df` (pandas.DataFrame, mandatory):
+        The data you want to save.
+
+    `path` (str, mandatory):
+        Where to save it.
+
+    `schema` (pyarrow.Schema, mandatory):
+        The declared schema of this dataset (see `schemas.py`).
+
+    `metadata` (dict, optional):
+        Extra key-value metadata to store in the Parquet footer.
+    """
+    table = to_arrow_table(df, schema)
+    if metadata is not None:
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), **metadata}
+        )
+    pq.write_table(
+        table,
+        f"{path}.tmp",
+        compression=PARQUET_COMPRESSION
+    )
+    os.replace(f"{path}.tmp", path)
@@ -2,7 +2,7 @@ import logging
 import os
 from datetime import UTC, datetime
 
-import pandas as pd
+from schemas import PLAYER_GAME_STATS_ARROW_SCHEMA, read_dataset
 
 
 def parse_cfl_player_season_stats(season: int):
@@ -76,8 +76,9 @@ def parse_cfl_player_season_stats(season: int):
         "last_updated",
     ]
 
-    base_df = pd.read_csv(
-        f"player_stats/game_stats/{season}_cfl_player_game_stats.csv"
+    base_df = read_dataset(
+        f"player_stats/game_stats/{season}_cfl_player_game_stats.csv",
+        PLAYER_GAME_STATS_ARROW_SCHEMA
     )
 
     base_df["competitor_id"] = base_df["competitor_id"].fillna(
@@ -97,6 +98,7 @@ def parse_cfl_player_season_stats(season: int):
         ],
         group_keys=False,
         as_index=False,
+        observed=True,
     ).agg(
         {
             "game_id": "count",
@@ -144,6 +146,13 @@ def parse_cfl_player_season_stats(season: int):
         }
     )
 
+    # Season totals can outgrow the per-game integer types.
+    final_df = final_df.astype(
+        {
+            column: "Int64"
+            for column in final_df.select_dtypes("integer").columns
+        }
+    )
     final_df.rename(columns={"game_id": "games_played"}, inplace=True)
     final_df.loc[final_df["passing_ATT"] > 0, "passing_COMP%"] = (
         final_df["passing_COMP"] / final_df["passing_ATT"]
@@ -0,0 +1,241 @@
+import glob
+import hashlib
+import logging
+import os
+import shutil
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from parquet_io import write_parquet
+from schemas import PBP_ARROW_SCHEMA, apply_schema
+
+# The play-by-play data of every game, as a Hive-partitioned Parquet dataset
+# (`season=2024/week=5/game_id=9888990/part-0.parquet`),
+# so a single week or game can be read without reading the whole season.
+PBP_DATASET_DIR = "pbp/dataset"
+PBP_PARTITION_COLUMNS = ("season", "week", "game_id")
+# Plays are stored in each partition without `order_sequence`,
+# which depends on every game before them in the season,
+# so a partition only changes when the plays of its own game do.
+# `read_pbp_dataset()` numbers the plays it reads instead.
+PBP_SEASON_COLUMNS = ("order_sequence",)
+# The order `read_pbp_dataset()` returns plays in.
+PBP_SORT_COLUMNS = ("season", "week", "game_id", "game_play_num")
+# The partition value Hive uses for rows without one (e.g. no week number).
+HIVE_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+PBP_PARTITIONING = ds.partitioning(
+    pa.schema(
+        [PBP_ARROW_SCHEMA.field(column) for column in PBP_PARTITION_COLUMNS]
+    ),
+    flavor="hive"
+)
+
+
+def get_pbp_partition_path(season: int, week: int, game_id: int) -> str:
+    """
+    Given a season, week, and game ID,
+    return the directory of that game in the pbp dataset.
+    """
+    if pd.isna(week):
+        week = HIVE_NULL_PARTITION
+    else:
+        week = int(week)
+    return (
+        f"{PBP_DATASET_DIR}/season={int(season)}/week={week}/" +
+        f"game_id={int(game_id)}"
+    )
+
+
+def get_pbp_game_hash(game_df: pd.DataFrame) -> str:
+    """
+    Given the play-by-play data of a game,
+    return a SHA-256 hash of its contents.
+    """
+    row_hashes = pd.util.hash_pandas_object(game_df, index=False)
+    return hashlib.sha256(row_hashes.to_numpy().tobytes()).hexdigest()
+
+
+def get_pbp_partition_hash(file_path: str) -> str:
+    """
+    Given a file in the pbp dataset, return the content hash
+    stored in its footer, or `None` if there is no such file.
+    """
+    try:
+        metadata = pq.read_schema(file_path).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    return metadata.get(b"content_sha256", b"").decode("utf-8")
+
+
+def write_pbp_game(
+    game_df: pd.DataFrame,
+    season: int,
+    week: int,
+    game_id: int
+) -> bool:
+    """
+    Save the play-by-play data of one game to its partition
+    of the pbp dataset, unless that partition already has the same data.
+
+    Parameters
+    ----------
+    `game_df` (pandas.DataFrame, mandatory):
+        The play-by-play data of this game,
+        with the columns in `PBP_ARROW_SCHEMA`
+        (`order_sequence` is not needed, and is not saved).
+
+    `season` (int, mandatory):
+        The season of this game.
+
+    `week` (int, mandatory):
+        The week of this game.
+
+    `game_id` (int, mandatory):
+        The game ID (fixture ID) of this game.
+
+    Returns
+    ----------
+    `True` if the partition of this game was written.
+    """
+    partition_path = get_pbp_partition_path(season, week, game_id)
+    file_path = f"{partition_path}/part-0.parquet"
+
+    game_df = game_df.drop(
+        columns=list(PBP_PARTITION_COLUMNS + PBP_SEASON_COLUMNS),
+        errors="ignore"
+    )
+    content_hash = get_pbp_game_hash(game_df)
+    if get_pbp_partition_hash(file_path) == content_hash:
+        return False
+
+    os.makedirs(partition_path, exist_ok=True)
+    write_parquet(
+        game_df,
+        file_path,
+        PBP_ARROW_SCHEMA,
+        metadata={"content_sha256": content_hash}
+    )
+    return True
+
+
+def write_pbp_dataset(pbp_df: pd.DataFrame, season: int) -> int:
+    """
+    Save the play-by-play data of a season to the pbp dataset,
+    one partition per game.
+
+    Only games whose data changed since the last time they were saved
+    are written again, and each one replaces its partition atomically,
+    so a reader never sees a partially written game.
+    Games that are no longer in `pbp_df` under the same week
+    (for example, a game that was rescheduled)
+    are removed from this season.
+
+    Parameters
+    ----------
+    `pbp_df` (pandas.DataFrame, mandatory):
+        The play-by-play data of every game of this season,
+        as built by `get_cfl_pbp.get_cfl_season_pbp_data()`.
+
+    `season` (int, mandatory):
+        The season of `pbp_df`.
+
+    Returns
+    ----------
+    How many game partitions were written.
+    """
+    kept_paths = set()
+    written = 0
+
+    for (week, game_id), game_df in pbp_df.groupby(
+        ["week", "game_id"],
+        sort=False,
+        dropna=False
+    ):
+        kept_paths.add(get_pbp_partition_path(season, week, game_id))
+        if write_pbp_game(game_df, season, week, game_id):
+            written += 1
+
+    for partition_path in glob.glob(
+        f"{PBP_DATASET_DIR}/season={int(season)}/week=*/game_id=*"
+    ):
+        if partition_path not in kept_paths:
+            logging.info(f"Removing `{partition_path}` from the pbp dataset.")
+            shutil.rmtree(partition_path)
+            week_path = os.path.dirname(partition_path)
+            if len(os.listdir(week_path)) == 0:
+                os.rmdir(week_path)
+
+    logging.info(
+        f"{written} of {len(kept_paths)} games of the {season} season " +
+        "were written to the pbp dataset."
+    )
+    return written
+
+
+def read_pbp_dataset(filters=None, columns: list = None) -> pd.DataFrame:
+    """
+    Read play-by-play data from the pbp dataset.
+
+    Only the partitions that can match `filters` are opened,
+    so filtering on `season`, `week`, or `game_id`
+    reads just the games that were asked for.
+
+    Parameters
+    ----------
+    `filters` (list or pyarrow.dataset.Expression, optional):
+        Which plays to read, either as a `pyarrow.dataset` expression
+        (`ds.field("week") == 5`), or in the `pyarrow.parquet` format
+        (`[("season", "=", 2024), ("week", "in", [5, 6])]`).
+        If not set, every play in the dataset is read.
+
+    `columns` (list, optional):
+        The columns to read. If not set, every column is read.
+
+    Returns
+    ----------
+    A pandas `DataFrame` with the matching plays,
+    sorted by season, week, game, and `game_play_num`.
+    `order_sequence` numbers these plays from 0 in each season,
+    in that order, so it only matches the season play-by-play files
+    if every game of a season was read.
+    """
+    if isinstance(filters, list):
+        filters = pq.filters_to_expression(filters)
+
+    # Only finished files are read,
+    # never the temporary file of a partition that is being replaced.
+    dataset = ds.dataset(
+        sorted(
+            glob.glob(
+                f"{PBP_DATASET_DIR}/season=*/week=*/game_id=*/*.parquet"
+            )
+        ),
+        schema=PBP_ARROW_SCHEMA,
+        format="parquet",
+        partitioning=PBP_PARTITIONING,
+        partition_base_dir=PBP_DATASET_DIR
+    )
+    if columns is None:
+        columns = PBP_ARROW_SCHEMA.names
+    read_columns_arr = [
+        column for column in columns
+        if column not in PBP_SEASON_COLUMNS
+    ]
+    read_columns_arr += [
+        column for column in PBP_SORT_COLUMNS
+        if column not in read_columns_arr
+    ]
+
+    pbp_df = dataset.to_table(
+        columns=read_columns_arr,
+        filter=filters
+    ).to_pandas()
+    pbp_df = pbp_df.sort_values(
+        list(PBP_SORT_COLUMNS),
+        ignore_index=True
+    )
+    pbp_df["order_sequence"] = pbp_df.groupby("season").cumcount()
+    return apply_schema(pbp_df[list(columns)], PBP_ARROW_SCHEMA)
@@ -0,0 +1,209 @@
+import numpy as np
+
+# The share of the yards to go a play has to gain on each down
+# to be a successful play (third and fourth downs have to be converted).
+SUCCESS_RATE_BY_DOWN = {
+    1: 0.4,
+    2: 0.6,
+    3: 1.0,
+    4: 1.0,
+}
+# The end yardline a punt or kickoff has to stop short of
+# to be inside the twenty.
+INSIDE_TWENTY_YARDLINE = 20
+
+# The columns `get_game_state_columns()` reads,
+# besides `punt_end_yl` and `kickoff_end_yl`.
+GAME_STATE_INPUT_COLUMNS = (
+    "posteam",
+    "defteam",
+    "posteam_type",
+    "down",
+    "yds_to_go",
+    "yards_gained",
+    "is_no_play",
+    "td_team",
+    "field_goal_result",
+    "two_point_conv_result",
+    "extra_point_result",
+    "defensive_extra_point_conv",
+    "is_rouge",
+    "third_down_converted",
+    "third_down_failed",
+    "fourth_down_converted",
+    "fourth_down_failed",
+)
+# The columns `get_game_state_columns()` returns.
+GAME_STATE_COLUMNS = (
+    "success",
+    "third_down_converted",
+    "third_down_failed",
+    "fourth_down_converted",
+    "fourth_down_failed",
+    "punt_inside_twenty",
+    "kickoff_inside_twenty",
+    "total_home_score",
+    "total_away_score",
+    "posteam_score",
+    "defteam_score",
+    "posteam_score_post",
+    "defteam_score_post",
+    "score_differential_post",
+)
+
+
+def _is_good(results) -> np.ndarray:
+    """ """
+    return np.fromiter(
+        (x.lower() == "good" for x in results),
+        dtype=bool,
+        count=len(results)
+    )
+
+
+def _is_true(values) -> np.ndarray:
+    """ """
+    return np.fromiter(
+        (x is True or x is np.True_ for x in values),
+        dtype=bool,
+        count=len(values)
+    )
+
+
+def _is_false(values) -> np.ndarray:
+    """ """
+    return np.fromiter(
+        (x is False or x is np.False_ for x in values),
+        dtype=bool,
+        count=len(values)
+    )
+
+
+def _is_inside_twenty(end_yardlines) -> np.ndarray:
+    """ """
+    return np.fromiter(
+        (
+            x is not None and x < INSIDE_TWENTY_YARDLINE
+            for x in end_yardlines
+        ),
+        dtype=bool,
+        count=len(end_yardlines)
+    )
+
+
+def get_game_state_columns(
+    plays: dict,
+    total_home_score: int = 0,
+    total_away_score: int = 0
+) -> dict:
+    """
+    Given the plays of a game, in the order they were played,
+    work out the state of the game around every play, in one pass:
+    which plays were successful, which third and fourth downs
+    were converted, which punts and kickoffs ended inside the twenty,
+    and the score before and after every play.
+
+    Parameters
+    ----------
+    `plays` (dict or pandas.DataFrame, mandatory):
+        The columns in `GAME_STATE_INPUT_COLUMNS`,
+        plus `punt_end_yl` and `kickoff_end_yl`
+        (`yardline_110` of where each punt or kickoff ended,
+        `None` if it was not one).
+        Third and fourth down flags that were already set
+        while parsing a play are kept.
+
+    `total_home_score` (int, optional):
+        The score of the home team before the first play in `plays`.
+
+    `total_away_score` (int, optional):
+        The score of the away team before the first play in `plays`.
+
+    Returns
+    ----------
+    A `dict` with a `list` for every column in `GAME_STATE_COLUMNS`.
+    """
+    if len(plays["posteam"]) == 0:
+        return {column: [] for column in GAME_STATE_COLUMNS}
+
+    is_play = _is_false(plays["is_no_play"])
+    downs = np.asarray(plays["down"], dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gain_rates = (
+            np.asarray(plays["yards_gained"], dtype=float) /
+            np.asarray(plays["yds_to_go"], dtype=float)
+        )
+
+    is_success_by_down = {
+        down: (downs == down) & (gain_rates > rate) & is_play
+        for down, rate in SUCCESS_RATE_BY_DOWN.items()
+    }
+    game_state = {
+        "success": np.logical_or.reduce(list(is_success_by_down.values())),
+        "third_down_converted": (
+            _is_true(plays["third_down_converted"]) | is_success_by_down[3]
+        ),
+        "third_down_failed": (
+            _is_true(plays["third_down_failed"]) |
+            ((downs == 3) & ~is_success_by_down[3])
+        ),
+        "fourth_down_converted": (
+            _is_true(plays["fourth_down_converted"]) | is_success_by_down[4]
+        ),
+        "fourth_down_failed": (
+            _is_true(plays["fourth_down_failed"]) |
+            ((downs == 4) & ~is_success_by_down[4])
+        ),
+        "punt_inside_twenty": _is_inside_twenty(plays["punt_end_yl"]),
+        "kickoff_inside_twenty": _is_inside_twenty(plays["kickoff_end_yl"]),
+    }
+
+    # The points each team scored on every play.
+    posteam_arr = np.asarray(plays["posteam"], dtype=object)
+    defteam_arr = np.asarray(plays["defteam"], dtype=object)
+    td_team_arr = np.asarray(plays["td_team"], dtype=object)
+    is_posteam_td = (td_team_arr == posteam_arr) & is_play
+    is_defteam_td = (td_team_arr == defteam_arr) & is_play & ~is_posteam_td
+    posteam_points = (
+        6 * is_posteam_td +
+        3 * (_is_good(plays["field_goal_result"]) & is_play) +
+        2 * (_is_good(plays["two_point_conv_result"]) & is_play) +
+        1 * (_is_good(plays["extra_point_result"]) & is_play) +
+        1 * (_is_true(plays["is_rouge"]) & is_play)
+    )
+    defteam_points = (
+        6 * is_defteam_td +
+        2 * (_is_true(plays["defensive_extra_point_conv"]) & is_play)
+    )
+
+    # The running score of each team, after every play.
+    is_home = np.asarray(plays["posteam_type"], dtype=object) == "home"
+    home_scores = total_home_score + np.cumsum(
+        np.where(is_home, posteam_points, defteam_points)
+    )
+    away_scores = total_away_score + np.cumsum(
+        np.where(is_home, defteam_points, posteam_points)
+    )
+    home_scores_pre = np.concatenate(([total_home_score], home_scores[:-1]))
+    away_scores_pre = np.concatenate(([total_away_score], away_scores[:-1]))
+
+    posteam_scores = np.where(is_home, home_scores_pre, away_scores_pre)
+    defteam_scores = np.where(is_home, away_scores_pre, home_scores_pre)
+    game_state.update(
+        {
+            "total_home_score": home_scores,
+            "total_away_score": away_scores,
+            "posteam_score": posteam_scores,
+            "defteam_score": defteam_scores,
+            "posteam_score_post": posteam_scores + posteam_points,
+            "defteam_score_post": defteam_scores + defteam_points,
+            "score_differential_post": (
+                posteam_scores + posteam_points -
+                defteam_scores - defteam_points
+            ),
+        }
+    )
+    return {
+        column: game_state[column].tolist()
+        for column in GAME_STATE_COLUMNS
+    }
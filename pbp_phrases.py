@@ -0,0 +1,302 @@
+import logging
+import time
+from collections import deque
+from datetime import datetime
+
+from schemas import PBP_ARROW_SCHEMA, read_dataset
+
+# Every phrase that the play-by-play parser tests for
+# in the lowercase play description.
+PBP_PHRASES = (
+    "  return 0 yards to the",
+    " (#",
+    " end of play",
+    " for 0 yards to the",
+    "#",
+    "(",
+    "), out of bounds",
+    "1st down",
+    "advances",
+    "advances ",
+    "advances for loss of",
+    "block",
+    "blocked",
+    "blocked by",
+    "broken up by",
+    "broken up by ",
+    "caught at",
+    "declined",
+    "defensive pat successful",
+    "delay of game",
+    "downed",
+    "end of play",
+    "end of play ",
+    "end of play single",
+    "field goal",
+    "first down",
+    "for gain of",
+    "for gain of 0 yards recovered by",
+    "for loss of",
+    "forced by",
+    "fumble",
+    "fumble by",
+    "fumbled",
+    "fumbled by",
+    "fumbled snap",
+    "fumbled snap at",
+    "gain of",
+    "hold, return",
+    "illegal block",
+    "illegal block, return",
+    "illegal kickoff",
+    "incomplete",
+    "kick",
+    "kick attempt failed",
+    "kick attempt good",
+    "kneel",
+    "kneel down",
+    "kneel down  at",
+    "lateral",
+    "lateral to",
+    "left",
+    "middle",
+    "montreal alouettes",
+    "muffed by",
+    "no huddle",
+    "no play",
+    "no yards, 15 yards",
+    "nullified by penalty",
+    "onside kickoff",
+    "open field kick",
+    "out of bounds",
+    "out of bounds at",
+    "overturned",
+    "overturned play",
+    "pass",
+    "pass attempt failed",
+    "pass attempt successful",
+    "pass complete",
+    "pass intercepted by",
+    "penalty",
+    "penalty ",
+    "play overturned",
+    "punt",
+    "recovered by",
+    "return",
+    "return for loss",
+    "return for loss of",
+    "returned",
+    "right",
+    "rush",
+    "rush attempt failed",
+    "rush attempt successful",
+    "rush for",
+    "sack",
+    "sacked",
+    "sacked for gain of",
+    "sacked for loss",
+    "safety",
+    "short to ",
+    "shotgun",
+    "single nullified by penalty",
+    "spike",
+    "the previous play is under review",
+    "the rulling on the field",
+    "thrown to",
+    "thrown to ",
+    "timeout",
+    "to",
+    "touchback",
+    "touchback single",
+    "touchdown",
+    "touchdown nullified",
+    "touchdown nullified by penalty",
+    "yard gain",
+    "yard loss",
+    "yards gain",
+    "yards gain (",
+    "yards loss",
+    "yards to the",
+    "yards to the (",
+    "yards to the penalty",
+)
+
+
+class PhraseScanner:
+    """
+    Finds every phrase from a fixed set of phrases
+    in a single pass over a string (Aho-Corasick).
+
+    The automaton is built once, when the scanner is created.
+    Missing transitions are resolved ahead of time,
+    so scanning a string costs one dictionary lookup per character.
+
+    Parameters
+    ----------
+    `phrases` (iterable of str, mandatory):
+        The phrases this scanner should look for.
+    """
+
+    def __init__(self, phrases):
+        self.phrases = tuple(dict.fromkeys(phrases))
+
+        goto = [{}]
+        outputs = [set()]
+
+        for phrase in self.phrases:
+            state = 0
+            for char in phrase:
+                if char not in goto[state]:
+                    goto.append({})
+                    outputs.append(set())
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            outputs[state].add(phrase)
+
+        # Breadth-first, so that the failure state of every state
+        # is complete before that state is used.
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fail_state = fail[state]
+                while fail_state and char not in goto[fail_state]:
+                    fail_state = fail[fail_state]
+                fail[next_state] = goto[fail_state].get(char, 0)
+                if fail[next_state] == next_state:
+                    fail[next_state] = 0
+                outputs[next_state] |= outputs[fail[next_state]]
+
+        # Fold the failure links into the transition table.
+        transitions = [dict(goto[0])]
+        queue = deque(goto[0].values())
+        transitions.extend({} for _ in range(len(goto) - 1))
+        while queue:
+            state = queue.popleft()
+            transitions[state] = {
+                **transitions[fail[state]],
+                **goto[state]
+            }
+            queue.extend(goto[state].values())
+
+        self._transitions = transitions
+        self._outputs = [frozenset(x) for x in outputs]
+
+    def scan(self, string: str) -> frozenset:
+        """
+        Find every phrase in this scanner that appears in `string`.
+
+        Parameters
+        ----------
+        `string` (str, mandatory):
+            The string to scan.
+
+        Returns
+        ----------
+        A `frozenset` of every phrase found in `string`.
+        """
+        transitions = self._transitions
+        outputs = self._outputs
+        found = set()
+        state = 0
+
+        for char in string:
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                found |= outputs[state]
+        return frozenset(found)
+
+
+PBP_PHRASE_SCANNER = PhraseScanner(PBP_PHRASES)
+
+
+def find_pbp_phrases(description: str) -> frozenset:
+    """
+    Find every phrase in `PBP_PHRASES`
+    that appears in a lowercase play description.
+
+    Parameters
+    ----------
+    `description` (str, mandatory):
+        The play description, in lowercase.
+
+    Returns
+    ----------
+    A `frozenset` of every phrase found in `description`.
+    """
+    return PBP_PHRASE_SCANNER.scan(description)
+
+
+def benchmark_pbp_phrases(season: int, rounds: int = 5) -> dict:
+    """
+    Compares the phrase scanner against testing every phrase
+    in a play description one at a time,
+    using the play descriptions of a season
+    that has already been saved by `get_cfl_season_pbp_data()`.
+
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The season of play-by-play data to benchmark against.
+
+    `rounds` (int, optional):
+        How many times each method should scan every description.
+        The fastest round of each method is reported.
+
+    Returns
+    ----------
+    A `dict` with the number of descriptions,
+    and the fastest time (in seconds) of each method.
+    """
+    pbp_df = read_dataset(
+        f"pbp/{season}_cfl_pbp.csv",
+        PBP_ARROW_SCHEMA,
+        usecols=["desc"]
+    )
+    descriptions = pbp_df["desc"].dropna().astype(str).str.lower().to_list()
+    del pbp_df
+
+    def substring_chain(description: str) -> frozenset:
+        return frozenset(x for x in PBP_PHRASES if x in description)
+
+    timings = {}
+    for name, method in (
+        ("substring_chain", substring_chain),
+        ("phrase_scanner", find_pbp_phrases),
+    ):
+        best = None
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for description in descriptions:
+                method(description)
+            elapsed = time.perf_counter() - start
+            if best is None or elapsed < best:
+                best = elapsed
+        timings[name] = best
+
+    for description in descriptions:
+        if substring_chain(description) != find_pbp_phrases(description):
+            raise ValueError(
+                "The phrase scanner and the substring chain " +
+                f"disagree on `{description}`."
+            )
+
+    logging.info(
+        f"Scanned {len(descriptions)} descriptions " +
+        f"from the {season} season: " +
+        f"substring chain {timings['substring_chain']:.3f}s, " +
+        f"phrase scanner {timings['phrase_scanner']:.3f}s."
+    )
+    return {"descriptions": len(descriptions), **timings}
+
+
+if __name__ == "__main__":
+    now = datetime.now()
+    season = now.year
+
+    if now.month < 5:
+        season -= 1
+
+    print(benchmark_pbp_phrases(season))
@@ -0,0 +1,1843 @@
+import re
+from collections import Counter
+
+# Every regular expression used to parse play-by-play descriptions,
+# compiled once at import and looked up by name.
+PBP_PATTERNS = {
+    "yardline_number": re.compile(r"([\-0-9]+)"),
+    "down_and_distance": re.compile(
+        r"([0-9])[a-zA-Z]+ & ([\-0-9]+) at ([a-zA-Z0-9\-\s]+)"
+    ),
+    "side_of_field": re.compile(r"([a-zA-Z]+)"),
+    "penalty_01": re.compile(r"PENALTY ([a-zA-Z]+) ([a-zA-Z\s\,]+) declined"),
+    "pass_incomplete_01": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass incomplete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) thrown to " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "pass_complete_01": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+)[ \([\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+)\)]?"
+    ),
+    "pass_incomplete_02": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass incomplete ([a-zA-Z]+) to " +
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) thrown to ([0-9a-zA-Z\-]+) broken up " +
+        r"by [\#0-9]+ ([a-zA-Z\.\-\s\']+)"
+    ),
+    "pass_incomplete_03": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass incomplete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) thrown to " +
+        r"([0-9a-zA-Z\-]+) broken up by [\#0-9]+ ([a-zA-Z\.\-\s\']+)"
+    ),
+    "pass_incomplete_04": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass incomplete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) thrown to ([0-9a-zA-Z\-]+) broken up by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+)"
+    ),
+    "pass_incomplete_05": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass incomplete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) broken up by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+)"
+    ),
+    "pass_incomplete_06": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass incomplete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) broken up by [\#0-9]+ ([a-zA-Z\.\-\s\']+)"
+    ),
+    "pass_incomplete_07": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass incomplete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) thrown to ([0-9a-zA-Z\-]+)"
+    ),
+    "pass_incomplete_08": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass incomplete ([a-zA-Z]+) thrown " +
+        r"to ([0-9a-zA-Z\-]+)"
+    ),
+    "pass_incomplete_09": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass incomplete ([a-zA-Z]+) to " +
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) thrown to ([0-9a-zA-Z\-]+)"
+    ),
+    "pass_incomplete_10": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass incomplete, Spike"
+    ),
+    "pass_incomplete_11": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass incomplete ([a-zA-Z]+)( " +
+        r"[a-zA-Z]+)?"
+    ),
+    "pass_incomplete_12": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass incomplete ([a-zA-Z]+) to " +
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+)"
+    ),
+    "pass_incomplete_13": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass incomplete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+).? The previous play " +
+        r"is under review.?"
+    ),
+    "pass_incomplete_14": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass incomplete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+)"
+    ),
+    "overturned_01": re.compile(r"The ruling on the field ([A-Za-z]+).?"),
+    "safety_touch_01": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) SAFETY TOUCH"
+    ),
+    "safety_touch_02": re.compile(r" ([a-zA-Z\.\-\s\']+) SAFETY TOUCH"),
+    "overturned_02": re.compile(
+        r"PLAY OVERTURNED. \(Original Play: (\([0-9\:]+\))?([a-zA-Z\#\s\.0-9" +
+        r"]+)\)"
+    ),
+    "pass_complete_02": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? loss to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\), out of bounds"
+    ),
+    "player_name": re.compile(r"[\#0-9]+ ([a-zA-Z\.\-\s\']+)"),
+    "pass_complete_03": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? loss to the " +
+        r"([0-9a-zA-Z\-]+), out of bounds at ([0-9a-zA-Z\-]+)"
+    ),
+    "pass_complete_04": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? loss to the " +
+        r"([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ ([a-zA-Z\.\-\s\']+) at " +
+        r"([0-9a-zA-Z\-]+) forced by [\#0-9]+ ([a-zA-Z\.\-\s\']+) recovered " +
+        r"by ([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) " +
+        r"advances ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "pass_complete_05": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? loss to the " +
+        r"([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ ([a-zA-Z\.\-\s\']+) at " +
+        r"([0-9a-zA-Z\-]+) forced by [\#0-9]+ ([a-zA-Z\.\-\s\']+) recovered " +
+        r"by ([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "pass_complete_06": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? loss to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "pass_complete_07": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"fumbled by [\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) " +
+        r"forced by [\#0-9]+ ([a-zA-Z\.\-\s\']+) recovered by ([A-Z{2,4}]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+)return for loss of ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "pass_complete_08": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"fumbled by [\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) " +
+        r"forced by [\#0-9]+ ([a-zA-Z\.\-\s\']+) recovered by ([A-Z{2,4}]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+)return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+)\, out of bounds at ([0-9a-zA-Z\-]+)"
+    ),
+    "pass_complete_09": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"fumbled by [\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) " +
+        r"forced by [\#0-9]+ ([a-zA-Z\.\-\s\']+) recovered by ([A-Z{2,4}]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+)return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "pass_complete_10": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"fumbled by [\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+)? " +
+        r"+forced by [\#0-9]+ ([a-zA-Z\.\-\s\']+) recovered by " +
+        r"([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+)return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "pass_complete_11": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) to " +
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at ([0-9a-zA-Z\-]+), for " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\), out of bounds"
+    ),
+    "pass_complete_12": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\), out of bounds"
+    ),
+    "pass_complete_13": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"?, out of bounds"
+    ),
+    "pass_complete_14": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"fumbled by [\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) " +
+        r"recovered by ([A-Z]+) [\#0-9]+ ([a-zA-Z\.\-\s\']+) at " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\-\s\']+) return ([0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+)\, out of bounds at " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "pass_complete_15": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"fumbled by [\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) " +
+        r"forced by [\#0-9]+ ([a-zA-Z\.\-\s\']+) recovered by ([A-Z]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) advances " +
+        r"([0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+)\, out of bounds at " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "pass_complete_16": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"fumbled by [\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) " +
+        r"forced by [\#0-9]+ ([a-zA-Z\.\-\s\']+)\, out of bounds at " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "pass_complete_17": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+), out of bounds at ([0-9a-zA-Z\-]+)"
+    ),
+    "pass_complete_18": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"fumbled by [\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) " +
+        r"forced by [\#0-9]+ ([a-zA-Z\.\-\s\']+) recovered by ([A-Z{2,4}]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) advances " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "pass_complete_19": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"fumbled by [\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) " +
+        r"forced by [\#0-9]+ ([a-zA-Z\.\-\s\']+) recovered by ([A-Z{2,4}]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "pass_complete_20": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) open field kick ([0-9\-]+) yard[s]? " +
+        r"to the ([0-9a-zA-Z\-]+) recovered by ([A-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+), [END|end]+ [OF|of]+ " +
+        r"[PLAY|play]+"
+    ),
+    "pass_complete_21": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"lateral to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([0-9\-]) yard[s]? " +
+        r"gain to the ([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "pass_complete_22": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "pass_complete_23": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"fumbled by [\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) " +
+        r"forced by [\#0-9]+ ([a-zA-Z\.\-\s\']+) recovered by ([A-Z{2,4}]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) advances " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "pass_complete_24": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"fumbled by [\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) " +
+        r"recovered by ([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\-\s\']+) at " +
+        r"([0-9a-zA-Z\-]+) advances ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "pass_complete_25": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) open field kick ([\-0-9]+) yard[s]? " +
+        r"to the ([0-9a-zA-Z\-]+) recovered by ([A-Z{2,4}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "pass_complete_26": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) to " +
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at ([0-9a-zA-Z\-]+), for " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "pass_complete_27": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) "
+    ),
+    "pass_complete_28": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "pass_complete_29": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? loss to the ([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "pass_complete_30": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? loss to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "pass_complete_31": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) recovered by ([A-Z]{2,4}) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+), out of bounds at " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "pass_complete_32": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+), out of bounds"
+    ),
+    "pass_complete_33": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) recovered by ([A-Z]{2,4}) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+), out of bounds"
+    ),
+    "pass_complete_34": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+), out of bounds at " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "pass_complete_35": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) recovered by ([A-Z]{2,4}) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "pass_complete_36": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) recovered by ([A-Z]{2,4}) " +
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "pass_complete_37": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) recovered by ([A-Z]{2,4}) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+), [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) for ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "pass_complete_38": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) recovered by ([A-Z]{2,4}) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "pass_complete_39": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) recovered by ([A-Z]{2,4}) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "pass_complete_40": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) recovered by ([A-Z]{2,4}) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "pass_complete_41": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) ? open field kick ([\-0-9]+) " +
+        r"yards to the ([0-9a-zA-Z\-]+) recovered by ([A-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "pass_complete_42": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) ? open field kick ([\-0-9]+) " +
+        r"yards to the ([0-9a-zA-Z\-]+) recovered by ([A-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) return ([\-0-9]+) yards to the " +
+        r"([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "pass_complete_43": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "pass_complete_44": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) to " +
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "overturned_03": re.compile(
+        r"\(OVERTURNED PLAY: ([a-zA-Z0-9\s\(\)\#\.\:\,\-\']+)\)"
+    ),
+    "pass_complete_45": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\-\s\']+) " +
+        r"open field kick ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"recovered by ([A-Z{2|3}]+) [\#0-9]+ ([a-zA-Z\.\-\s\']+) at " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "pass_complete_46": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "pass_complete_47": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"fumbled by [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"forced by [\#0-9]+ ([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) TOUCHDOWN"
+    ),
+    "pass_complete_48": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"fumbled by [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"forced by [\#0-9]+ ([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) advances " +
+        r"([0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) TOUCHDOWN"
+    ),
+    "pass_complete_49": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) caught at " +
+        r"([0-9a-zA-Z\-]+), for ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"TOUCHDOWN"
+    ),
+    "interception_01": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass intercepted by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) broken up by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) [\#0-9]+ ([a-zA-Z\.\-\s\']+) return " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) TOUCHDOWN"
+    ),
+    "interception_02": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass intercepted by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) lateral to [\#0-9]+ ([a-zA-Z\.\-\s\']+) TOUCHDOWN"
+    ),
+    "interception_03": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) pass intercepted by [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) TOUCHDOWN"
+    ),
+    "pass_complete_50": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "pass_complete_51": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([A-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) TOUCHDOWN"
+    ),
+    "pass_complete_52": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+), End Of Play TOUCHDOWN"
+    ),
+    "pass_complete_53": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) pass complete ([a-zA-Z]+) " +
+        r"([a-zA-Z]+) to [\#0-9]+ ([a-zA-Z\.\-\s\']+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) TOUCHDOWN"
+    ),
+    "interception_04": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) pass intercepted by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return for loss of ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "interception_05": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) pass intercepted by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) broken up by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+), out of bounds at " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "interception_06": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) pass intercepted by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) broken up by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "interception_07": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) pass intercepted by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "interception_08": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) pass intercepted by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+), Touchback"
+    ),
+    "interception_09": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) pass intercepted by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "fumble_01": re.compile(
+        r"fumbled by [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"forced by [\#0-9]+ ([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) advances " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) \([\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+)\)"
+    ),
+    "fumble_02": re.compile(
+        r"fumbled by [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"recovered by ([A-Z{2|3}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "interception_10": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) pass intercepted by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) lateral to [\#0-9]+ ([a-zA-Z\.\s\-\']+) for " +
+        r"([\-0-9]+) yard[s]? gain to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "tacklers": re.compile(r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"),
+    "penalty_02": re.compile(r"PENALTY([a-zA-Z0-9\s\(\)\#\.\,\-\']+)"),
+    "penalty_03": re.compile(
+        r"([A-Z]{2,4}) ([\s\,a-zA-Z0-9\()]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\) " +
+        r"? ([\-0-9]+) yard[s]? from ([0-9a-zA-Z\-]+)? to ([0-9a-zA-Z\-]+)"
+    ),
+    "penalty_04": re.compile(
+        r"([A-Z]{2,4}) ([\s\,a-zA-Z0-9\()]+) ? ([\-0-9]+) yard[s]? from " +
+        r"([0-9a-zA-Z\-]+)? to ([0-9a-zA-Z\-]+)"
+    ),
+    "penalty_05": re.compile(r"([A-Z]{2,4}) Pass interference, defense, 1ST"),
+    "penalty_06": re.compile(
+        r"([A-Z]{2,4}) ([\s\,a-zA-Z0-9\()]+)\s([\-0-9]+) yard[s]? from " +
+        r"([0-9a-zA-Z\-]+) to ([0-9a-zA-Z\-]+)"
+    ),
+    "penalty_07": re.compile(r"([A-Z]{2,4}) ([a-zA-Z\-\s\,0-9]+)"),
+    "penalty_08": re.compile(
+        r"([A-Z]{2,4}) ([a-zA-Z\-\s\,0-9]+) \([\#0-9]+ ([a-zA-Z\.\s\-\']+)\)"
+    ),
+    "sack_01": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) sacked for gain of ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\), " +
+        r"fumble by [\#0-9]+ ([a-zA-Z\.\s\-\']+) recovered by ([A-Z{2|3}]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "sack_02": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) sacked for loss of ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "sack_03": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) sacked for [loss|gain]+ of " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "penalty_09": re.compile(r"PENALTY ([a-zA-Z0-9\s\(\)\#\.\,\-\']+)"),
+    "penalty_10": re.compile(
+        r"([A-Z]{2,4}) ([\s\,a-zA-Z0-9\()]+) \([\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+)\) ([\-0-9]+) yard[s]? from ([0-9a-zA-Z\-]+)? " +
+        r"to ([0-9a-zA-Z\-]+)"
+    ),
+    "fumble_03": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? loss to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by " +
+        r"([A-Z{2|3}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+), " +
+        r"End Of Play"
+    ),
+    "fumble_04": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "fumble_05": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) advances " +
+        r"([0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "fumble_06": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "fumble_07": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) advances ([\-0-9]+) yards " +
+        r"to the ([0-9a-zA-Z\-]+) lateral to [\#0-9]+ ([a-zA-Z\.\s\-\']+) " +
+        r"advances ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "fumble_08": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) advances ([\-0-9]+) yards " +
+        r"to the ([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "fumble_09": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yards to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "fumble_10": re.compile(
+        r"[\#0-9 ]+? ([a-zA-Z\.\s\-]+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9 ]+? " +
+        r"([a-zA-Z\.\s\-]+) at ([0-9a-zA-Z\-]+) forced by [\#0-9 ]+? " +
+        r"([a-zA-Z\.\s\-]+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) advances ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+)\, out of bounds at " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "fumble_11": re.compile(
+        r"[\#0-9 ]+? ([a-zA-Z\.\s\-]+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9 ]+? " +
+        r"([a-zA-Z\.\s\-]+) at ([0-9a-zA-Z\-]+) forced by [\#0-9 ]+? " +
+        r"([a-zA-Z\.\s\-]+), out of bounds at ([0-9a-zA-Z\-]+)"
+    ),
+    "fumble_12": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? loss to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "fumble_13": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? loss to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) advances ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "fumble_14": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? loss to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "fumble_15": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? loss to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) advances " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+), out of bounds at"
+    ),
+    "fumble_16": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? loss to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) advances " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "fumble_17": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? loss to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "fumble_18": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? loss to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yards to the " +
+        r"([0-9a-zA-Z\-]+) lateral to [\#0-9]+ ([a-zA-Z\.\s\-\']+) for " +
+        r"([\-0-9]+) yard[s]? gain to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "fumble_19": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? loss to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yards to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "fumble_20": re.compile(
+        r"Montreal Alouettes rush ([a-zA-Z]+) for ([\-0-9]+) yard[s]? loss " +
+        r"to the ([0-9a-zA-Z\-]+) fumbled by Montreal Alouettes at " +
+        r"([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) ?[\#0-9]+? " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yards to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "fumble_21": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? loss to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yards to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "run_01": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? loss to the ([0-9a-zA-Z\-]+) \([\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+)\)"
+    ),
+    "run_02": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+)"
+    ),
+    "run_03": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush for ([\-0-9]+) yard[s]? gain to " +
+        r"the ([0-9a-zA-Z\-]+)"
+    ),
+    "fumble_22": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) advances ([\-0-9]+) yards " +
+        r"to the ([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "fumble_23": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) advances " +
+        r"([\-0-9]+) yards to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "fumble_24": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "fumble_25": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "fumble_26": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return for loss of ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "fumble_27": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "run_04": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush for ([\-0-9]+) yard[s]? gain to " +
+        r"the ([0-9a-zA-Z\-]+) \([\#0-9]+ ([a-zA-Z\.\s\-\']+)\)"
+    ),
+    "run_05": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "sack_04": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) sacked for loss of ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) \([\#0-9]+ ([a-zA-Z\.\s\-\']+)\)"
+    ),
+    "run_06": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+)"
+    ),
+    "kneel_01": re.compile(
+        r"Kneel down by [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"for gain of ([\-0-9]+) yards"
+    ),
+    "run_07": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) \([\#0-9]+ ([a-zA-Z\.\s\-\']+)\)"
+    ),
+    "fumble_28": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? loss to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([A-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yards to the " +
+        r"([0-9a-zA-Z\-]+) TOUCHDOWN, clock ([0-9\:]+)"
+    ),
+    "fumble_29": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([A-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yards to the " +
+        r"([0-9a-zA-Z\-]+) TOUCHDOWN, clock ([0-9\:]+)"
+    ),
+    "fumble_30": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? loss to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by " +
+        r"([A-Z{2|3}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yards to the " +
+        r"([0-9a-zA-Z\-]+) TOUCHDOWN"
+    ),
+    "run_08": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+) TOUCHDOWN"
+    ),
+    "run_09": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "run_10": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? loss to the ([0-9a-zA-Z\-]+) lateral to [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) for ([\-0-9]+) yards to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "fumble_31": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return for loss of ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \([\#0-9]+ ([a-zA-Z\.\s\-\']+)\)"
+    ),
+    "run_11": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "run_12": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+), out of bounds at " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "fumble_32": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by " +
+        r"([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "fumble_33": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([A-Z{2,4}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "run_13": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain \([0-9]+\) to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "penalty_11": re.compile(
+        r"([A-Z]{2,4}) Illegal sub \(too many men\) ([\-0-9]+) yards from " +
+        r"([0-9a-zA-Z\-]+) to ([0-9a-zA-Z\-]+)"
+    ),
+    "penalty_12": re.compile(r"([A-Z]{2,4}) ([\s\,a-zA-Z0-9\()]+), 1ST DOWN"),
+    "kneel_02": re.compile(
+        r"Kneel down  at ([0-9a-zA-Z\-]+) for loss of ([\-0-9]+) yard[s]?"
+    ),
+    "penalty_13": re.compile(r"PENALTY ([A-Z{2|3}]+) ([a-zA-Z\s]+) declined"),
+    "kneel_03": re.compile(
+        r"Kneel down by [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"for gain of ([\-0-9]+) yard[s]?"
+    ),
+    "kneel_04": re.compile(
+        r"Kneel down by [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"for loss of ([\-0-9]+) yard[s]?"
+    ),
+    "fumbled_snap_01": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) fumbled snap Shotgun [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) yard[s]? loss " +
+        r"to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ ([a-zA-Z\.\s\-\']+) " +
+        r"at ([0-9a-zA-Z\-]+) recovered by ([A-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "fumbled_snap_02": re.compile(
+        r"Shotgun [\#0-9]+ ([a-zA-Z\.\s\-\']+) fumbled snap at " +
+        r"([0-9a-zA-Z\-]+) for loss of ([\-0-9]+) yard[s]? recovered by " +
+        r"([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) " +
+        r"yard[s]? gain to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "fumbled_snap_03": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) fumbled snap Shotgun [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) yards gain to " +
+        r"the ([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "fumbled_snap_04": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) fumbled snap at ([0-9a-zA-Z\-]+) for " +
+        r"gain of ([0-9\-]+) yards recovered by ([A-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) rush ([a-z\s]+) for ([0-9\-]+) yards loss to " +
+        r"the OTT39 \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "fumbled_snap_05": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) fumbled snap Shotgun [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) rush ([a-zA-Z]+) for ([\-0-9]+) yard[s]? to " +
+        r"the ([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "fumbled_snap_06": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) fumbled snap at ([0-9a-zA-Z\-]+) for " +
+        r"loss of ([\-0-9]+) yard[s]? recovered by ([A-Z{2,4}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) pass incomplete ([a-z]+) ([a-z]+) to [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) thrown to ([0-9a-zA-Z\-]+)"
+    ),
+    "fumbled_snap_07": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) fumbled snap at ([0-9a-zA-Z\-]+) for " +
+        r"loss of ([\-0-9]+) yard[s]? recovered by ([A-Z{2,4}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) pass incomplete ([a-z]+) ([a-z]+) thrown to " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "fumbled_snap_08": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) fumbled snap at ([0-9a-zA-Z\-]+) for " +
+        r"gain of ([\-0-9]+) yard[s]? recovered by ([A-Z{2,4}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) pass incomplete ([a-z]+) ([a-z]+) thrown to " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "penalty_14": re.compile(r"([A-Z]{2,4}) ([a-zA-Z\-\s\,0-9]+) declined"),
+    "penalty_15": re.compile(r"([A-Z{2,4}]+) Offside, 1ST DOWN"),
+    "punt_01": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) blocked by [\#0-9]+ ([a-zA-Z\.\s\-\']+) " +
+        r"recovered by ([a-zA-Z]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return for loss of " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) TOUCHDOWN\, clock " +
+        r"([0-9\:]+)"
+    ),
+    "punt_02": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return for loss of ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_03": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return for loss of " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) TOUCHDOWN"
+    ),
+    "punt_04": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return for loss of " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) advances ([\-0-9]+) yards " +
+        r"to the ([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_05": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return for loss of " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yards to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_06": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return for loss of " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) lateral to [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) for ([\-0-9]+) yard[s]? gain to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_07": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return for loss of " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_08": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ ([a-zA-Z\.\s\-\']+) at " +
+        r"([0-9a-zA-Z\-]+) forced by [\#0-9]+ ([a-zA-Z\.\s\-\']+) recovered " +
+        r"by ([a-zA-Z]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_09": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yards to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "punt_10": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yards to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yards to the " +
+        r"([0-9a-zA-Z\-]+), out of bounds at ([0-9a-zA-Z\-]+)"
+    ),
+    "punt_11": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) advances for loss of " +
+        r"([\-0-9]+) yards to the ([0-9a-zA-Z\-]+) [TOUCHDOWN|touchdown]+"
+    ),
+    "punt_12": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) advances ([\-0-9]+) yards " +
+        r"to the ([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_13": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yards to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_14": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yards to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_15": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return for loss of " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by " +
+        r"([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) TOUCHDOWN"
+    ),
+    "punt_16": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) blocked by [\#0-9]+ ([a-zA-Z\.\s\-\']+) " +
+        r"recovered by ([a-zA-Z]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) TOUCHDOWN"
+    ),
+    "punt_17": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) TOUCHDOWN"
+    ),
+    "punt_18": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) blocked by [\#0-9]+ ([a-zA-Z\.\s\-\']+) " +
+        r"recovered by ([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at " +
+        r"([0-9a-zA-Z\-]+)\, [END|end]+ [OF|of]+ [PLAY|play]+"
+    ),
+    "punt_19": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) blocked by [\#0-9]+ ([a-zA-Z\.\s\-\']+) " +
+        r"recovered by ([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_20": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+)\, out of bounds at " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "punt_21": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_22": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) blocked by [\#0-9]+ ([a-zA-Z\.\s\-\']+) " +
+        r"recovered by ([a-zA-Z]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_23": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by " +
+        r"([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+), " +
+        r"End Of Play"
+    ),
+    "punt_24": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by " +
+        r"([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "punt_25": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return for loss of " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by " +
+        r"([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"advances ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_26": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return for loss of " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by " +
+        r"([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([0-9\-]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_27": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return for loss of " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by " +
+        r"([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_28": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by " +
+        r"([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"advances for loss of ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_29": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by " +
+        r"([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"advances ([0-9\-]) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_30": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by " +
+        r"([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_31": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by " +
+        r"([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) TOUCHDOWN"
+    ),
+    "punt_32": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by " +
+        r"([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+), out of bounds at ([0-9a-zA-Z\-]+)"
+    ),
+    "punt_33": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by " +
+        r"([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_34": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) muffed by [\#0-9]+ ([a-zA-Z\.\s\-\']+) at " +
+        r"([0-9a-zA-Z\-]+) recovered by ([A-Z{2,4}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_35": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_36": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) lateral to [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) for ([\-0-9]+) yard[s]? gain to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\), out of bounds"
+    ),
+    "punt_37": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\), " +
+        r"out of bounds"
+    ),
+    "punt_38": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+), out of bounds at ([0-9a-zA-Z\-]+)"
+    ),
+    "punt_39": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return for loss of " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+), out of bounds at " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "punt_40": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+), out of bounds at " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "punt_41": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+), out of bounds at " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "punt_42": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+), out of bounds at ([0-9a-zA-Z\-]+)"
+    ),
+    "punt_43": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) TOUCHDOWN, clock ([0-9\:]+)"
+    ),
+    "punt_44": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+)  return 0 yards to the"
+    ),
+    "punt_45": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+)"
+    ),
+    "punt_46": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) lateral to [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) for ([\-0-9]+) yard[s]? gain to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_47": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "punt_48": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+), out of bounds at " +
+        r"([0-9a-zA-Z\-]+) SINGLE"
+    ),
+    "punt_49": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+), out of bounds at ([0-9a-zA-Z\-]+) SINGLE"
+    ),
+    "punt_50": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return for loss of " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+)( \([\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+)\))?"
+    ),
+    "punt_51": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+), Touchback SINGLE, clock ([\:0-9]+)"
+    ),
+    "punt_52": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) recovered by ([A-Z{2|3}]+) [\#0-9 ]+? " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+), End Of Play SINGLE"
+    ),
+    "punt_53": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) "
+    ),
+    "punt_54": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+)( \([\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+)\))?"
+    ),
+    "penalty_16": re.compile(
+        r"TOUCHDOWN nullified by penalty, clock ([0-9\:]+) " +
+        r"[PENALTY|penalty]+ ([A-Z]+) No yards, 15 yards \([\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+)\) ([0-9]+) yard[s]+ from ([0-9a-zA-Z\-]+) to " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "punt_55": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) [\#0-9 ]+? " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+), out of bounds at ([0-9a-zA-Z\-]+)"
+    ),
+    "punt_56": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) blocked by [\#0-9]+ ([a-zA-Z\.\s\-\']+) " +
+        r"recovered by ([a-zA-Z]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at " +
+        r"([0-9a-zA-Z\-]+) TOUCHDOWN nullified by penalty"
+    ),
+    "punt_57": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) blocked by [\#0-9]+ ([a-zA-Z\.\s\-\']+) " +
+        r"recovered by ([a-zA-Z]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at " +
+        r"([0-9a-zA-Z\-]+) TOUCHDOWN"
+    ),
+    "punt_58": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yards to the " +
+        r"([0-9a-zA-Z\-]+) TOUCHDOWN"
+    ),
+    "punt_59": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) TOUCHDOWN"
+    ),
+    "punt_60": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "punt_61": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) forced by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) recovered by ([A-Z{2,4}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) advances ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_62": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by " +
+        r"([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"advances ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "punt_63": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) blocked by [\#0-9]+ ([a-zA-Z\.\s\-\']+) " +
+        r"recovered by ([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the"
+    ),
+    "punt_64": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \([\#0-9]+ ([a-zA-Z\.\s\-\']+)\)"
+    ),
+    "punt_65": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) \([\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+)\)"
+    ),
+    "punt_66": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) recovered by ([a-zA-Z]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \([\#0-9]+ ([a-zA-Z\.\s\-\']+)\)"
+    ),
+    "punt_67": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "punt_68": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) lateral to [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) for ([\-0-9]+) yard[s]? gain to the " +
+        r"([0-9a-zA-Z\-]+) \([\#0-9]+ ([a-zA-Z\.\s\-\']+)\), out of bounds"
+    ),
+    "punt_69": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) \([\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+)\), out of bounds"
+    ),
+    "punt_70": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) TOUCHDOWN nullified by penalty"
+    ),
+    "punt_71": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the PENALTY"
+    ),
+    "punt_72": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the \(([a-zA-Z0-9\#\.\-\s\'\;\,]+)\)"
+    ),
+    "punt_73": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) TOUCHDOWN"
+    ),
+    "punt_74": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+)  ?return ([0-9\-]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [SINGLE|single]+ nullified by penalty"
+    ),
+    "punt_75": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([0-9\-]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) [SINGLE|single]+ nullified by " +
+        r"penalty"
+    ),
+    "punt_76": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [SINGLE|single]+ nullified by penalty"
+    ),
+    "punt_77": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) punt ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+), Touchback"
+    ),
+    "penalty_17": re.compile(
+        r"([A-Z]{2,4}) ([\s\,a-zA-Z0-9\()]+) - Loss of Down \([\#0-9]+ " +
+        r"([a-zA-Z\.\-\s\']+)\)"
+    ),
+    "penalty_18": re.compile(
+        r"([A-Z]{2,4}) ([\s\,a-zA-Z0-9\()]+) ([\-0-9]+) yard"
+    ),
+    "kickoff_01": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) onside kickoff ([\-0-9]+) yard[s]? " +
+        r"to the ([0-9a-zA-Z\-]+), out of bounds at ([0-9a-zA-Z\-]+)"
+    ),
+    "kickoff_02": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) onside kickoff ([\-0-9]+) yard[s]? " +
+        r"to the ([0-9a-zA-Z\-]+), End Of Play"
+    ),
+    "kickoff_03": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) onside kickoff ([\-0-9]+) yard[s]? " +
+        r"to the ([0-9a-zA-Z\-]+) (\#[0-9]+) ([a-zA-Z\.\-\s\']+) return " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+)( \([\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+)\))?"
+    ),
+    "kickoff_04": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) kickoff ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+), out of bounds at ([0-9a-zA-Z\-]+)"
+    ),
+    "kickoff_05": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) kickoff ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return for loss of " +
+        r"([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+)( \([\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+)\))?"
+    ),
+    "kickoff_06": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) kickoff ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+)( \([\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+)\))?"
+    ),
+    "kickoff_07": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) onside kickoff ([\-0-9]+) yard[s]? " +
+        r"to the ([0-9a-zA-Z\-]+)"
+    ),
+    "kickoff_08": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) kickoff ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+)  ?return ([\-0-9]+) yards to the " +
+        r"([0-9a-zA-Z\-]+), out of bounds at ([0-9a-zA-Z\-]+)"
+    ),
+    "kickoff_09": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) kickoff ([\-0-9]+) yards to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+)(, End Of Play)? SINGLE"
+    ),
+    "kickoff_10": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) kickoff ([\-0-9]+) yards to the " +
+        r"([0-9a-zA-Z\-]+), Touchback SINGLE"
+    ),
+    "kickoff_11": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) kickoff ([\-0-9]+) yards to the " +
+        r"([0-9a-zA-Z\-]+), out of bounds at ([0-9a-zA-Z\-]+) SINGLE"
+    ),
+    "kickoff_12": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) kickoff ([\-0-9]+) yards to the " +
+        r"([0-9a-zA-Z\-]+) SINGLE"
+    ),
+    "penalty_19": re.compile(
+        r"([A-Z{2|3}]+) Illegal sub \(too many men\)[ ]? ([\-0-9]+) yards " +
+        r"from ([0-9a-zA-Z\-]+)? to ([0-9a-zA-Z\-]+)"
+    ),
+    "penalty_20": re.compile(
+        r"([A-Z{2|3}]+) Time count after 3min warning on 1st or 2nd down - " +
+        r"Loss of Down \([\#0-9]+ ([a-zA-Z\.\s\-\']+)\)"
+    ),
+    "field_goal_01": re.compile(
+        r"field goal attempt from ([\-0-9]+) yard[s]? ([a-zA-Z\s]+)"
+    ),
+    "field_goal_02": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) field goal attempt from ([\-0-9]+) " +
+        r"yard[s]? ([a-zA-Z\s]+) \(H: [\#0-9]+ ([a-zA-Z\.\s\-\']+), LS: " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+)\)"
+    ),
+    "field_goal_03": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) field goal attempt from ([\-0-9]+) " +
+        r"yard[s]? NO GOOD blocked by [\#0-9]+ ([a-zA-Z\.\s\-\']+) \(H: " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+), LS: [\#0-9]+ ([a-zA-Z\.\s\-\']+)\), " +
+        r"clock ([\:0-9]+) recovered by ([A-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) TOUCHDOWN"
+    ),
+    "field_goal_04": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) field goal attempt from ([\-0-9]+) " +
+        r"yard[s]? NO GOOD blocked by [\#0-9]+ ([a-zA-Z\.\s\-\']+) \(H: " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+), LS: [\#0-9]+ ([a-zA-Z\.\s\-\']+)\), " +
+        r"clock ([\:0-9]+) recovered by ([A-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+), out of bounds at " +
+        r"([0-9a-zA-Z\-]+)"
+    ),
+    "field_goal_05": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) field goal attempt from ([\-0-9]+) " +
+        r"yard[s]? NO GOOD blocked by [\#0-9]+ ([a-zA-Z\.\s\-\']+) \(H: " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+), LS: [\#0-9]+ ([a-zA-Z\.\s\-\']+)\), " +
+        r"clock ([\:0-9]+) recovered by ([A-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+), End Of Play SINGLE, " +
+        r"clock ([\:0-9]+)"
+    ),
+    "field_goal_06": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) field goal attempt from ([\-0-9]+) " +
+        r"yard[s]? NO GOOD blocked by [\#0-9]+ ([a-zA-Z\.\s\-\']+) \(H: " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+), LS: [\#0-9]+ ([a-zA-Z\.\s\-\']+)\), " +
+        r"clock ([\:0-9]+) recovered by ([A-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "field_goal_07": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) field goal attempt from ([\-0-9]+) " +
+        r"yard[s]? NO GOOD blocked by [\#0-9]+ ([a-zA-Z\.\s\-\']+) \(H: " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+), LS: [\#0-9]+ ([a-zA-Z\.\s\-\']+)\), " +
+        r"clock ([\:0-9]+) recovered by ([A-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) fumbled by [\#0-9]+ ([a-zA-Z\.\-\s\']+) at " +
+        r"([0-9a-zA-Z\-]+) forced by [\#0-9]+ ([a-zA-Z\.\-\s\']+) recovered " +
+        r"by ([A-Z]{2,4}) [\#0-9]+ ([a-zA-Z\.\-\s\']+) at ([0-9a-zA-Z\-]+) " +
+        r"advances for loss of ([\-0-9]+) yard[s]? to the ([0-9a-zA-Z\-]+) " +
+        r"\(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "field_goal_08": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) field goal attempt from ([\-0-9]+) " +
+        r"yard[s]? NO GOOD blocked by [\#0-9]+ ([a-zA-Z\.\s\-\']+) \(H: " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+), LS: [\#0-9]+ ([a-zA-Z\.\s\-\']+)\), " +
+        r"clock ([\:0-9]+) recovered by ([A-Z{2|3}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "one_point_01": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) kick attempt ([a-zA-Z]+) \( ? " +
+        r"blocked by [\#0-9]+ ([a-zA-Z\.\s\-\']+)\) \(H: [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+), LS: [\#0-9]+ ([a-zA-Z\.\s\-\']+)\) recovered " +
+        r"by ([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) defensive PAT " +
+        r"Successful"
+    ),
+    "one_point_02": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) kick attempt ([a-zA-Z]+) \(H: " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+), LS: [\#0-9]+ ([a-zA-Z\.\s\-\']+)\) " +
+        r"recovered by ([A-Z{2,4}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) " +
+        r"defensive PAT Successful"
+    ),
+    "one_point_03": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) kick attempt ([a-zA-Z]+) \(H: " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+), LS: [\#0-9]+ ([a-zA-Z\.\s\-\']+)\)"
+    ),
+    "one_point_04": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) kick attempt ([a-zA-Z]+) \( ?blocked " +
+        r"by [\#0-9]+ ([a-zA-Z\.\s\-\']+)\) \(H: [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+), LS: [\#0-9]+ ([a-zA-Z\.\s\-\']+)\) recovered " +
+        r"by ([A-Z{2|3}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) yard[s]? to the " +
+        r"([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "one_point_05": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) kick attempt ([a-zA-Z]+) \(H: " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+), LS: [\#0-9]+ ([a-zA-Z\.\s\-\']+)\) " +
+        r"recovered by ([A-Z{2|3}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+)\, [END|end]+ [OF|of]+ " +
+        r"[PLAY|play]+"
+    ),
+    "one_point_06": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) kick attempt ([a-zA-Z]+) \(H: " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+), LS: [\#0-9]+ ([a-zA-Z\.\s\-\']+)\) " +
+        r"recovered by ([A-Z{2|3}]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\)"
+    ),
+    "fumbled_snap_09": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) Fumbled Snap at ([0-9a-zA-Z\-]+) for " +
+        r"loss of ([\-0-9]+) yard[s]? recovered by ([A-Z{2,4}]+) [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+) at ([0-9a-zA-Z\-]+) advances ([\-0-9]+) yards " +
+        r"to ([0-9a-zA-Z\-]+) \(([a-zA-Z0-9\#\.\-\s\'\;]+)\), Attempt Failed"
+    ),
+    "one_point_07": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) kick attempt good \(H: [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+), LS: [\#0-9]+ ([a-zA-Z\.\s\-\']+)\)"
+    ),
+    "one_point_08": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) kick attempt ([a-zA-Z]+) \(H: " +
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+), LS: [\#0-9]+ ([a-zA-Z\.\s\-\']+)\) " +
+        r"recovered by ([A-Z]{2,4}) [\#0-9]+ ([a-zA-Z\.\s\-\']+) at " +
+        r"([0-9a-zA-Z\-]+) [\#0-9]+ ([a-zA-Z\.\s\-\']+) return ([\-0-9]+) " +
+        r"yard[s]? to the ([0-9a-zA-Z\-]+) \([\#0-9]+ ([a-zA-Z\.\s\-\']+)\)"
+    ),
+    "one_point_09": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\-\s\']+) kick attempt failed \(H: [\#0-9]+ " +
+        r"([a-zA-Z\.\s\-\']+), LS: [\#0-9]+ ([a-zA-Z\.\s\-\']+)\)"
+    ),
+    "penalty_21": re.compile(
+        r"([A-Z]{2,4}) ([\s\,a-zA-Z0-9\()]+)\s([\-0-9]+) yard[s]? from " +
+        r"?([0-9a-zA-Z\-]+)? to ([0-9a-zA-Z\-]+)"
+    ),
+    "two_point_rush_01": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush attempt [Successful|successful]+"
+    ),
+    "two_point_pass_01": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) pass attempt [Successful|successful]+"
+    ),
+    "two_point_rush_02": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush attempt [Failed|failed]+"
+    ),
+    "two_point_pass_02": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) pass attempt [Failed|failed]+"
+    ),
+    "two_point_pass_03": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) pass attempt failed"
+    ),
+    "two_point_pass_04": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) pass attempt Successful"
+    ),
+    "two_point_rush_03": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush attempt failed"
+    ),
+    "two_point_rush_04": re.compile(
+        r"[\#0-9]+ ([a-zA-Z\.\s\-\']+) rush attempt Successful"
+    ),
+    "penalty_22": re.compile(
+        r"([A-Z{2|3}]+) Time count after 3min warning on 1st or 2nd down - " +
+        r"Loss 10 yards \([\#0-9]+ ([a-zA-Z\.\s\-\']+)\)"
+    ),
+    "penalty_23": re.compile(r"([A-Z]{2,4}) ([a-zA-Z\-\s\,0-9]+) , 1ST DOWN"),
+}
+
+# Number of times each pattern in `PBP_PATTERNS` found at least one match.
+PATTERN_HITS = Counter()
+
+
+def pbp_findall(pattern_name: str, string: str) -> list:
+    """
+    Equivalent to `re.findall()`, using a precompiled pattern
+    from `PBP_PATTERNS`.
+
+    Parameters
+    ----------
+    `pattern_name` (str, mandatory):
+        The name of the pattern in `PBP_PATTERNS`.
+
+    `string` (str, mandatory):
+        The text that will be searched.
+
+    Returns
+    ----------
+    A `list` of every match, identical to what `re.findall()` returns.
+    """
+    matches = PBP_PATTERNS[pattern_name].findall(string)
+    if matches:
+        PATTERN_HITS[pattern_name] += 1
+    return matches
+
+
+def get_pattern_hits() -> dict:
+    """
+    Get the number of times each play-by-play pattern has fired.
+
+    Returns
+    ----------
+    A `dict` of every pattern name in `PBP_PATTERNS`
+    and the number of times that pattern found a match,
+    ordered from the most to the least used pattern.
+    """
+    hits_dict = {name: PATTERN_HITS[name] for name in PBP_PATTERNS}
+    return dict(
+        sorted(hits_dict.items(), key=lambda x: x[1], reverse=True)
+    )
+
+
+def add_pattern_hits(hits: dict) -> None:
+    """
+    Add hit counts from elsewhere (like a worker process)
+    to the hit counter of every play-by-play pattern.
+
+    Parameters
+    ----------
+    `hits` (dict, mandatory):
+        A `dict` of pattern names and hit counts,
+        as returned by `get_pattern_hits()`.
+    """
+    PATTERN_HITS.update(hits)
+
+
+def reset_pattern_hits() -> None:
+    """
+    Reset the hit counter of every play-by-play pattern.
+    """
+    PATTERN_HITS.clear()
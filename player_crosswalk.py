@@ -0,0 +1,628 @@
+import logging
+import os
+import re
+import unicodedata
+from datetime import datetime
+
+import pandas as pd
+
+from parquet_io import write_parquet
+from schemas import PLAYER_CROSSWALK_ARROW_SCHEMA, read_dataset
+
+# Every workflow that updates the crosswalk restores it from the
+# GitHub Actions cache before it starts, so `person_id` values
+# are kept between runs, and every source adds to the same crosswalk.
+PLAYER_CROSSWALK_PATH = "rosters/cfl_player_crosswalk"
+# The ID of a player in each source.
+PLAYER_CROSSWALK_KEYS = (
+    "cfl_player_id",
+    "competitor_id",
+    "stats_crew_player_id",
+)
+# Every source that can update the crosswalk, and its columns:
+# (crosswalk key, ID column, name column, abbreviated name column,
+# team column).
+PLAYER_CROSSWALK_SOURCES = {
+    # `get_cfl_rosters.get_cfl_rosters()`
+    "cfl_rosters": (
+        "cfl_player_id",
+        "player_id",
+        "player_name",
+        None,
+        "current_team_abv",
+    ),
+    # `get_transactions.get_cfl_transactions()`
+    "transactions": (
+        "cfl_player_id",
+        "player_id",
+        "player_name",
+        None,
+        "team_id",
+    ),
+    # `get_cfl_game_stats.parse_cfl_player_game_stats()`
+    "game_stats": (
+        "competitor_id",
+        "competitor_id",
+        "player_full_name",
+        "player_abv_name",
+        "team_abv",
+    ),
+    # `get_cfl_rosters.get_stats_crew_cfl_rosters()`
+    "stats_crew_rosters": (
+        "stats_crew_player_id",
+        "stats_crew_player_id",
+        "player_full_name",
+        None,
+        "team_id",
+    ),
+}
+# Name suffixes that one source has, and another does not.
+NAME_SUFFIXES = ("jr", "sr", "ii", "iii", "iv", "v")
+
+
+def _is_missing(value) -> bool:
+    """ """
+    return value is None or value is pd.NA or (
+        isinstance(value, float) and value != value
+    )
+
+
+def get_player_key(key: str, player_id):
+    """
+    Given a crosswalk key and a player ID from that source,
+    return that ID the way the crosswalk stores it
+    (`int`, or `str` for statscrew.com),
+    or `None` if it is not a usable ID.
+    """
+    if _is_missing(player_id):
+        return None
+    if key == "stats_crew_player_id":
+        player_id = str(player_id).strip()
+        return player_id if len(player_id) > 0 else None
+    try:
+        player_id = int(player_id)
+    except (TypeError, ValueError):
+        return None
+    # `get_cfl_rosters.parse_cfl_player_url()` returns `-1000`
+    # for player URLs it can not parse.
+    return player_id if player_id > 0 else None
+
+
+def get_full_name(player_name: str) -> str:
+    """
+    Given a player name, return it as `First Last`
+    (CFL.ca can list players as `Last, First`).
+    """
+    if _is_missing(player_name):
+        return None
+    player_name = " ".join(str(player_name).split())
+    if "," in player_name:
+        last_name, first_name = player_name.split(",", 1)
+        player_name = f"{first_name.strip()} {last_name.strip()}".strip()
+    return player_name if len(player_name) > 0 else None
+
+
+def normalize_player_name(player_name: str) -> str:
+    """
+    Given a player name, return the form of it every source agrees on
+    (lowercase, without accents, punctuation, or suffixes like `Jr.`),
+    so `Jean-Luc O'Neil Jr.` and `jean luc oneil` are the same name.
+    """
+    player_name = get_full_name(player_name)
+    if player_name is None:
+        return None
+    player_name = unicodedata.normalize("NFKD", player_name)
+    player_name = "".join(
+        x for x in player_name if not unicodedata.combining(x)
+    )
+    player_name = re.sub(r"[\-_]", " ", player_name.casefold())
+    player_name = re.sub(r"[^a-z0-9 ]", "", player_name)
+    names_arr = [x for x in player_name.split() if x not in NAME_SUFFIXES]
+    return " ".join(names_arr) if len(names_arr) > 0 else None
+
+
+def get_pbp_player_names(full_name: str, abv_name: str = None) -> set:
+    """
+    Given the full name of a player, and their abbreviated name
+    in the game stats (if known), return every name
+    the play-by-play data can call them,
+    as lowercase strings (`b.mitchell`, `b. mitchell`, `bo.mitchell`, ...).
+    """
+    names = set()
+    if not _is_missing(abv_name):
+        abv_name = " ".join(str(abv_name).split()).casefold()
+        names.add(abv_name)
+        names.add(abv_name.replace(". ", "."))
+        names.add(abv_name.replace(". ", ".").replace(".", ". "))
+
+    full_name = get_full_name(full_name)
+    if full_name is None:
+        return names
+    full_name = full_name.casefold()
+    names.add(full_name)
+
+    names_arr = full_name.split(" ")
+    if len(names_arr) < 2:
+        return names
+    first_name = names_arr[0]
+    for last_name in {" ".join(names_arr[1:]), names_arr[-1]}:
+        for initials in {first_name[:1], first_name[:2]}:
+            names.add(f"{initials}.{last_name}")
+            names.add(f"{initials}. {last_name}")
+    return names
+
+
+class PlayerCrosswalk:
+    """
+    Links every player across the sources this repository scrapes:
+    their CFL.ca player ID, their betgenius `competitor_id`,
+    their statscrew.com player ID,
+    and the abbreviated names used in the play-by-play data.
+
+    Every player gets a `person_id`,
+    and every ID and name of that player points to it
+    through an in-memory hash index, so looking a player up
+    by any of them never scans the crosswalk.
+    The crosswalk is saved to `path` (as a CSV and a Parquet file),
+    and is updated incrementally with `update()`
+    every time rosters, transactions, or game stats are scraped.
+
+    Parameters
+    ----------
+    `path` (str, optional):
+        Where to save the crosswalk, without a file extension.
+        If `None`, the crosswalk is only kept in memory.
+    """
+
+    def __init__(self, path: str = PLAYER_CROSSWALK_PATH):
+        self.path = path
+        self.clear()
+
+    def clear(self):
+        """
+        Forget every player kept in memory
+        (the saved crosswalk is kept, and loaded again when needed).
+        """
+        # person_id -> the IDs and names of that player
+        self._players = {}
+        # person_id -> every (season, team_abv) that player was seen with
+        self._teams = {}
+        # crosswalk key -> ID -> person_id
+        self._key_indexes = {key: {} for key in PLAYER_CROSSWALK_KEYS}
+        # normalized name -> every person_id with that name
+        self._name_index = {}
+        # (season, team_abv, pbp name) -> every person_id with that name
+        self._pbp_name_index = {}
+        self._last_person_id = 0
+        self._loaded = False
+
+    def __len__(self) -> int:
+        """ """
+        return len(self._players)
+
+    def _add_to_index(self, index: dict, value, person_id: int):
+        """ """
+        if value is not None:
+            index.setdefault(value, set()).add(person_id)
+
+    def _index_pbp_names(self, person_id: int, season: int, team_abv: str):
+        """ """
+        if season is None or team_abv is None:
+            return
+        player = self._players[person_id]
+        for player_name in get_pbp_player_names(
+            player["player_full_name"],
+            player["player_abv_name"]
+        ):
+            self._add_to_index(
+                self._pbp_name_index,
+                (season, team_abv, player_name),
+                person_id
+            )
+
+    def _add_player(self, person_id: int = None) -> int:
+        """ """
+        if person_id is None:
+            person_id = self._last_person_id + 1
+        self._last_person_id = max(self._last_person_id, person_id)
+        self._players[person_id] = {
+            "cfl_player_id": None,
+            "competitor_id": None,
+            "stats_crew_player_id": None,
+            "player_full_name": None,
+            "player_abv_name": None,
+            "last_updated": None,
+        }
+        self._teams[person_id] = set()
+        return person_id
+
+    def _set_value(self, person_id: int, column: str, value) -> bool:
+        """
+        Set one ID or name of a player, and update every index it is in.
+        Returns `True` if anything changed.
+        """
+        player = self._players[person_id]
+        if value is None or player[column] == value:
+            return False
+        player[column] = value
+
+        if column in self._key_indexes:
+            self._key_indexes[column][value] = person_id
+        elif column == "player_full_name":
+            self._add_to_index(
+                self._name_index,
+                normalize_player_name(value),
+                person_id
+            )
+
+        if column in ("player_full_name", "player_abv_name"):
+            for season, team_abv in self._teams[person_id]:
+                self._index_pbp_names(person_id, season, team_abv)
+        return True
+
+    def _add_team(self, person_id: int, season: int, team_abv: str) -> bool:
+        """ """
+        if (season, team_abv) in self._teams[person_id]:
+            return False
+        self._teams[person_id].add((season, team_abv))
+        self._index_pbp_names(person_id, season, team_abv)
+        return True
+
+    def _match_player(
+        self,
+        key: str,
+        player_id,
+        player_name: str,
+        season: int,
+        team_abv: str
+    ) -> int:
+        """
+        Find the player a record of a source belongs to,
+        or `None` if it is a player the crosswalk has not seen yet.
+
+        A record with an ID the crosswalk already has is that player.
+        Otherwise, it is matched by name to a player
+        that does not have an ID from this source yet,
+        first among the players of the same team that season,
+        then among players seen within a season of it,
+        and only if exactly one player matches.
+        """
+        person_id = self._key_indexes[key].get(player_id)
+        if person_id is not None:
+            return person_id
+
+        name = normalize_player_name(player_name)
+        if name is None:
+            return None
+        candidates = [
+            x for x in self._name_index.get(name, ())
+            if self._players[x][key] is None
+        ]
+
+        if team_abv is not None:
+            team_candidates = [
+                x for x in candidates
+                if any(
+                    team == team_abv and (season is None or year == season)
+                    for year, team in self._teams[x]
+                )
+            ]
+            if len(team_candidates) == 1:
+                return team_candidates[0]
+            elif len(team_candidates) > 1:
+                return None
+
+        if season is not None:
+            candidates = [
+                x for x in candidates
+                if any(
+                    year is None or abs(year - season) <= 1
+                    for year, _ in self._teams[x]
+                ) or len(self._teams[x]) == 0
+            ]
+        if len(candidates) == 1:
+            return candidates[0]
+        return None
+
+    def update(
+        self,
+        source: str,
+        records_df: pd.DataFrame,
+        season: int = None
+    ) -> int:
+        """
+        Add every player in data scraped from one source to the crosswalk.
+
+        Parameters
+        ----------
+        `source` (str, mandatory):
+            Where `records_df` is from
+            (one of `PLAYER_CROSSWALK_SOURCES`).
+
+        `records_df` (pandas.DataFrame, mandatory):
+            The rosters, transactions, or game stats of that source.
+
+        `season` (int, optional):
+            The season of `records_df`,
+            if it does not have a `season` column.
+
+        Returns
+        ----------
+        How many players were added to the crosswalk, or changed.
+        """
+        if source not in PLAYER_CROSSWALK_SOURCES:
+            raise ValueError(
+                f"Unknown player source `{source}`. " +
+                f"Expected one of {', '.join(PLAYER_CROSSWALK_SOURCES)}."
+            )
+        self.load()
+        key, id_column, name_column, abv_name_column, team_column = (
+            PLAYER_CROSSWALK_SOURCES[source]
+        )
+
+        records_df = records_df.dropna(subset=[id_column])
+        columns_arr = [id_column, name_column, abv_name_column, team_column]
+        if season is None and "season" in records_df.columns:
+            columns_arr.append("season")
+        records_df = pd.DataFrame(
+            {
+                column: records_df[column].to_numpy(dtype=object)
+                if column in records_df.columns
+                else None
+                for column in columns_arr
+                if column is not None
+            }
+        )
+        if "season" not in records_df.columns:
+            records_df["season"] = season
+        records_df = records_df.drop_duplicates()
+
+        now = datetime.now().isoformat()
+        changed = set()
+        for record in records_df.itertuples(index=False):
+            record = record._asdict()
+            player_id = get_player_key(key, record[id_column])
+            if player_id is None:
+                continue
+
+            player_name = get_full_name(record[name_column])
+            abv_name = (
+                None if abv_name_column is None or
+                _is_missing(record[abv_name_column])
+                else str(record[abv_name_column]).strip()
+            )
+            team_abv = (
+                None if _is_missing(record[team_column])
+                else str(record[team_column]).strip().upper()
+            )
+            record_season = (
+                None if _is_missing(record["season"])
+                else int(record["season"])
+            )
+
+            person_id = self._match_player(
+                key,
+                player_id,
+                player_name,
+                record_season,
+                team_abv
+            )
+            if person_id is None:
+                person_id = self._add_player()
+                changed.add(person_id)
+
+            if any(
+                [
+                    self._set_value(person_id, key, player_id),
+                    self._players[person_id]["player_full_name"] is None and
+                    self._set_value(
+                        person_id,
+                        "player_full_name",
+                        player_name
+                    ),
+                    self._set_value(person_id, "player_abv_name", abv_name),
+                    team_abv is not None and
+                    self._add_team(person_id, record_season, team_abv),
+                ]
+            ):
+                self._players[person_id]["last_updated"] = now
+                changed.add(person_id)
+
+        logging.info(
+            f"{len(changed)} players were added to or changed in " +
+            f"the player crosswalk, from the {source} data."
+        )
+        return len(changed)
+
+    def lookup(self, key: str, player_id) -> dict:
+        """
+        Given a crosswalk key (one of `PLAYER_CROSSWALK_KEYS`)
+        and a player ID from that source,
+        return a `dict` with every ID and name of that player
+        (and their `person_id`),
+        or `None` if the crosswalk does not have that player.
+        """
+        self.load()
+        if key not in self._key_indexes:
+            raise ValueError(
+                f"Unknown crosswalk key `{key}`. " +
+                f"Expected one of {', '.join(PLAYER_CROSSWALK_KEYS)}."
+            )
+        return self.get_player(
+            self._key_indexes[key].get(get_player_key(key, player_id))
+        )
+
+    def lookup_pbp_name(
+        self,
+        season: int,
+        team_abv: str,
+        player_name: str
+    ) -> dict:
+        """
+        Given a season, a team, and the name of a player
+        in the play-by-play data of that team (`B.Mitchell`),
+        return a `dict` with every ID and name of that player,
+        or `None` if that name does not point to exactly one player.
+        """
+        self.load()
+        if _is_missing(player_name) or _is_missing(team_abv):
+            return None
+        person_ids = self._pbp_name_index.get(
+            (
+                int(season),
+                str(team_abv).upper(),
+                " ".join(str(player_name).split()).casefold()
+            ),
+            ()
+        )
+        if len(person_ids) != 1:
+            return None
+        return self.get_player(next(iter(person_ids)))
+
+    def get_player(self, person_id: int) -> dict:
+        """
+        Given a `person_id`, return a `dict` with every ID and name
+        of that player, or `None` if there is no such player.
+        """
+        if person_id not in self._players:
+            return None
+        return {"person_id": person_id, **self._players[person_id]}
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Return the crosswalk as a pandas `DataFrame`,
+        with one row per player, season, and team
+        (see `schemas.PLAYER_CROSSWALK_ARROW_SCHEMA`).
+        """
+        rows_arr = []
+        for person_id, player in self._players.items():
+            teams_arr = sorted(
+                self._teams[person_id],
+                key=lambda x: (x[0] is None, x[0] or 0, x[1])
+            ) or [(None, None)]
+            for season, team_abv in teams_arr:
+                rows_arr.append(
+                    {
+                        "person_id": person_id,
+                        **player,
+                        "season": season,
+                        "team_abv": team_abv,
+                    }
+                )
+        crosswalk_df = pd.DataFrame(
+            rows_arr,
+            columns=PLAYER_CROSSWALK_ARROW_SCHEMA.names
+        )
+        return crosswalk_df
+
+    def load(self, refresh: bool = False):
+        """
+        Load the saved crosswalk, if it was not loaded yet
+        (or again, if `refresh` is `True`).
+        """
+        if self._loaded and not refresh:
+            return
+        self.clear()
+        self._loaded = True
+        if self.path is None:
+            return
+
+        try:
+            crosswalk_df = read_dataset(
+                f"{self.path}.parquet",
+                PLAYER_CROSSWALK_ARROW_SCHEMA
+            )
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logging.warning(
+                "Ignoring the unreadable player crosswalk " +
+                f"`{self.path}.parquet`: {e}"
+            )
+            return
+
+        columns_arr = PLAYER_CROSSWALK_ARROW_SCHEMA.names
+        for row in zip(
+            *[crosswalk_df[x].to_numpy(dtype=object) for x in columns_arr]
+        ):
+            row = {
+                column: None if _is_missing(value) else value
+                for column, value in zip(columns_arr, row)
+            }
+            person_id = int(row["person_id"])
+            if person_id not in self._players:
+                self._add_player(person_id)
+                for key in PLAYER_CROSSWALK_KEYS:
+                    self._set_value(
+                        person_id,
+                        key,
+                        get_player_key(key, row[key])
+                    )
+                for column in ("player_full_name", "player_abv_name"):
+                    self._set_value(person_id, column, row[column])
+                self._players[person_id]["last_updated"] = (
+                    row["last_updated"]
+                )
+            if row["team_abv"] is not None:
+                self._add_team(
+                    person_id,
+                    None if row["season"] is None else int(row["season"]),
+                    str(row["team_abv"])
+                )
+
+    def save(self):
+        """
+        Save the crosswalk to `path`, as a CSV and a Parquet file.
+        """
+        if self.path is None:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        crosswalk_df = self.to_dataframe()
+        crosswalk_df.to_csv(f"{self.path}.csv.tmp", index=False)
+        os.replace(f"{self.path}.csv.tmp", f"{self.path}.csv")
+        write_parquet(
+            crosswalk_df,
+            f"{self.path}.parquet",
+            PLAYER_CROSSWALK_ARROW_SCHEMA
+        )
+
+
+# The `PlayerCrosswalk` shared by every scraper in this process.
+_player_crosswalk = PlayerCrosswalk()
+
+
+def get_player_crosswalk() -> PlayerCrosswalk:
+    """
+    Return the `PlayerCrosswalk` shared by every scraper in this process,
+    loading the saved crosswalk the first time it is asked for.
+    """
+    _player_crosswalk.load()
+    return _player_crosswalk
+
+
+def update_player_crosswalk(
+    source: str,
+    records_df: pd.DataFrame,
+    season: int = None
+) -> int:
+    """
+    Add every player in data scraped from one source
+    to the shared player crosswalk, and save it
+    (see `PlayerCrosswalk.update()`).
+
+    A crosswalk that can not be updated is logged, and never stops
+    the scraper that called this.
+
+    Returns
+    ----------
+    How many players were added to the crosswalk, or changed.
+    """
+    try:
+        crosswalk = get_player_crosswalk()
+        changed = crosswalk.update(source, records_df, season=season)
+        if changed > 0:
+            crosswalk.save()
+    except Exception as e:
+        logging.warning(f"Cannot update the player crosswalk: {e}")
+        return 0
+    return changed
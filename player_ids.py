@@ -0,0 +1,267 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from roster_store import get_roster_store
+
+# Every player name column in the play-by-play data,
+# and the team column that says which team that player is on
+# (`None` if the play does not say).
+# Each `*_player_name` column is linked to its `*_player_id` column.
+PBP_PLAYER_NAME_COLUMNS = {
+    "td_player_name": "td_team",
+    "passer_player_name": "posteam",
+    "receiver_player_name": "posteam",
+    "rusher_player_name": "posteam",
+    "lateral_receiver_player_name": "posteam",
+    "lateral_rusher_player_name": "posteam",
+    "lateral_sack_player_name": None,
+    "interception_player_name": "defteam",
+    "lateral_interception_player_name": None,
+    "punt_returner_player_name": "return_team",
+    "lateral_punt_returner_player_name": "return_team",
+    "kickoff_returner_player_name": "return_team",
+    "lateral_kickoff_returner_player_name": "return_team",
+    "punter_player_name": None,
+    "kicker_player_name": None,
+    "own_kickoff_recovery_player_name": None,
+    "blocked_player_name": None,
+    "tackle_for_loss_1_player_name": "defteam",
+    "tackle_for_loss_2_player_name": "defteam",
+    "qb_hit_1_player_name": "defteam",
+    "qb_hit_2_player_name": "defteam",
+    "forced_fumble_player_1_player_name": "forced_fumble_player_1_team",
+    "forced_fumble_player_2_player_name": "forced_fumble_player_2_team",
+    "solo_tackle_1_player_name": "solo_tackle_1_team",
+    "solo_tackle_2_player_name": "solo_tackle_2_team",
+    "assist_tackle_1_player_name": "assist_tackle_1_team",
+    "assist_tackle_2_player_name": "assist_tackle_2_team",
+    "assist_tackle_3_player_name": "assist_tackle_3_team",
+    "assist_tackle_4_player_name": "assist_tackle_4_team",
+    "tackle_with_assist_1_player_name": "tackle_with_assist_1_team",
+    "tackle_with_assist_2_player_name": "tackle_with_assist_2_team",
+    "pass_defense_1_player_name": "defteam",
+    "pass_defense_2_player_name": "defteam",
+    "fumbled_1_player_name": "fumbled_1_team",
+    "fumbled_2_player_name": "fumbled_2_team",
+    "fumble_recovery_1_player_name": "fumble_recovery_1_team",
+    "fumble_recovery_2_player_name": "fumble_recovery_2_team",
+    "lateral_fumble_recovery_player_name": "lateral_fumble_recovery_team",
+    "sack_player_name": "defteam",
+    "half_sack_1_player_name": "defteam",
+    "half_sack_2_player_name": "defteam",
+    "missed_fg_return_player_name": "missed_fg_return_team",
+    "penalty_player_name": "penalty_team",
+    "safety_player_name": None,
+}
+
+# season -> (the rosters of that season, the player name index built from
+# them), or `None` if there are no saved rosters of that season.
+_player_name_indexes = {}
+
+
+def build_player_name_index(roster_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Given statscrew.com rosters, return every name a player
+    can be called in the play-by-play data, per team.
+
+    Every player can be found by their first initial and last name
+    (`J.Smith`, `J. Smith`), the first two letters of their first name
+    and their last name (`Jo.Smith`, `Jo. Smith`), and their full name.
+    Last names are only used if nothing else matches.
+    A name that points to more than one player on the same team
+    is left out, rather than guessing which one it is.
+
+    Parameters
+    ----------
+    `roster_df` (pandas.DataFrame, mandatory):
+        The rosters of one season,
+        from `get_cfl_rosters.get_stats_crew_cfl_rosters()`.
+
+    Returns
+    ----------
+    A pandas `DataFrame` with the columns `team_id`, `player_name`,
+    `stats_crew_player_id`, and `priority`
+    (0 for full names and initials, 1 for last names).
+    """
+    team_ids = roster_df["team_id"].astype("string").to_numpy()
+    player_ids = roster_df["stats_crew_player_id"].astype("string").to_numpy()
+    first_names = roster_df["player_first_name"].astype("string").str.strip()
+    last_names = roster_df["player_last_name"].astype("string").str.strip()
+
+    names_arr = [
+        (0, first_names.str[0] + "." + last_names),
+        (0, first_names.str[0] + ". " + last_names),
+        (0, first_names.str[:2] + "." + last_names),
+        (0, first_names.str[:2] + ". " + last_names),
+        (0, roster_df["player_full_name"].astype("string").str.strip()),
+        (1, last_names),
+    ]
+    index_df = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "team_id": team_ids,
+                    "player_name": names.to_numpy(),
+                    "stats_crew_player_id": player_ids,
+                    "priority": priority,
+                }
+            )
+            for priority, names in names_arr
+        ],
+        ignore_index=True
+    )
+    index_df = index_df.dropna(
+        subset=["team_id", "player_name", "stats_crew_player_id"]
+    )
+    index_df = index_df.drop_duplicates(
+        ["team_id", "player_name", "stats_crew_player_id"]
+    )
+
+    # Only keep the best kind of match for every name,
+    # and only if it points to a single player.
+    index_df = index_df[
+        index_df["priority"] ==
+        index_df.groupby(
+            ["team_id", "player_name"]
+        )["priority"].transform("min")
+    ]
+    index_df = index_df[
+        ~index_df.duplicated(["team_id", "player_name"], keep=False)
+    ]
+    return index_df.reset_index(drop=True)
+
+
+def get_player_name_index(season: int) -> pd.DataFrame:
+    """
+    Given a season, return its player name index
+    (see `build_player_name_index()`),
+    or `None` if the rosters of that season were never saved.
+
+    The rosters of each season are read from the shared `RosterStore`,
+    which never downloads them in the middle of a run,
+    and the index of each season is only built once per process
+    (or again, once its rosters are refreshed).
+    """
+    roster_df = get_roster_store().get(season)
+    entry = _player_name_indexes.get(season)
+    if entry is not None and entry[0] is roster_df:
+        return entry[1]
+    elif roster_df is None:
+        if season not in _player_name_indexes:
+            logging.warning(
+                f"There are no saved {season} statscrew.com rosters, " +
+                "so no player IDs will be linked."
+            )
+            _player_name_indexes[season] = None
+        return None
+
+    _player_name_indexes[season] = (
+        roster_df,
+        build_player_name_index(roster_df)
+    )
+    return _player_name_indexes[season][1]
+
+
+def link_pbp_player_ids(pbp_df: pd.DataFrame, season: int) -> pd.DataFrame:
+    """
+    Fill in every `*_player_id` column of play-by-play data
+    with the statscrew.com player ID of its `*_player_name` column.
+
+    Every name is looked up in the roster of the team the play says
+    the player is on (for example, `posteam` for a passer).
+    Names that are not found that way,
+    or whose team the play does not say,
+    are looked up in the rosters of both teams in that game,
+    and only linked if they point to a single player.
+    Every name column of every game is resolved in one pass.
+
+    Parameters
+    ----------
+    `pbp_df` (pandas.DataFrame, mandatory):
+        Play-by-play data, with `home_team` and `away_team` columns.
+
+    `season` (int, mandatory):
+        The season of `pbp_df`.
+
+    Returns
+    ----------
+    `pbp_df`, with its `*_player_id` columns filled in.
+    Names that can not be linked are left empty.
+    """
+    index_df = get_player_name_index(season)
+    if index_df is None or len(pbp_df) == 0:
+        return pbp_df
+
+    names_df_arr = []
+    for column_num, (name_column, team_column) in enumerate(
+        PBP_PLAYER_NAME_COLUMNS.items()
+    ):
+        if name_column not in pbp_df.columns:
+            continue
+        names = pbp_df[name_column].astype("string").str.strip()
+        rows = np.flatnonzero(names.notna().to_numpy())
+        if len(rows) == 0:
+            continue
+
+        # The team the play says this player is on comes first,
+        # then both teams of the game.
+        team_columns_arr = [(1, "home_team"), (1, "away_team")]
+        if team_column in pbp_df.columns:
+            team_columns_arr.insert(0, (0, team_column))
+
+        for team_rank, team_ids_column in team_columns_arr:
+            team_ids = pbp_df[team_ids_column].astype("string").to_numpy()
+            names_df_arr.append(
+                pd.DataFrame(
+                    {
+                        "row": rows,
+                        "column_num": column_num,
+                        "team_id": team_ids[rows],
+                        "player_name": names.to_numpy()[rows],
+                        "team_rank": team_rank,
+                    }
+                )
+            )
+
+    if len(names_df_arr) == 0:
+        return pbp_df
+
+    matches_df = pd.concat(names_df_arr, ignore_index=True).merge(
+        index_df,
+        how="inner",
+        on=["team_id", "player_name"]
+    )
+    matches_df["rank"] = matches_df["team_rank"] * 2 + matches_df["priority"]
+    matches_df = matches_df[
+        matches_df["rank"] ==
+        matches_df.groupby(["row", "column_num"])["rank"].transform("min")
+    ]
+    matches_df = matches_df.drop_duplicates(
+        ["row", "column_num", "stats_crew_player_id"]
+    )
+    matches_df = matches_df[
+        ~matches_df.duplicated(["row", "column_num"], keep=False)
+    ]
+
+    player_ids = {}
+    for column_num, name_column in enumerate(PBP_PLAYER_NAME_COLUMNS):
+        if name_column not in pbp_df.columns:
+            continue
+        column_matches_df = matches_df[matches_df["column_num"] == column_num]
+        id_arr = np.full(len(pbp_df), None, dtype=object)
+        id_arr[column_matches_df["row"].to_numpy()] = (
+            column_matches_df["stats_crew_player_id"].to_numpy()
+        )
+        player_ids[name_column.replace("_player_name", "_player_id")] = (
+            pd.Series(id_arr, index=pbp_df.index, dtype="string")
+        )
+
+    linked = sum(len(x.dropna()) for x in player_ids.values())
+    logging.info(
+        f"Linked {linked} player names to statscrew.com player IDs " +
+        f"in the {season} play-by-play data."
+    )
+    return pbp_df.assign(**player_ids)
+
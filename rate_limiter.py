@@ -0,0 +1,134 @@
+import asyncio
+import threading
+import time
+
+# The request budget of every host, as
+# (requests per second, how many requests may be sent back-to-back).
+# Hosts that are not listed here get `DEFAULT_RATE_LIMIT`.
+HOST_RATE_LIMITS = {
+    "cfl.ca": (1.0, 2),
+    "gsm-widgets.betstream.betgenius.com": (2.0, 4),
+    "statscrew.com": (0.2, 1),
+}
+DEFAULT_RATE_LIMIT = (1.0, 1)
+
+_LIMITERS = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket.
+
+    Tokens are added at `rate` tokens per second,
+    up to `capacity` tokens, and every request takes one token.
+    A request only has to wait if the bucket is empty,
+    so time spent doing other work (like parsing)
+    counts towards the wait of the next request.
+
+    Waiting requests reserve their token up front,
+    so they are let through in the order they arrived.
+
+    Parameters
+    ----------
+    `rate` (float, mandatory):
+        How many tokens are added to the bucket every second.
+
+    `capacity` (int, optional):
+        The most tokens the bucket can hold.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        if rate <= 0:
+            raise ValueError("`rate` must be greater than 0.")
+        if capacity < 1:
+            raise ValueError("`capacity` must be at least 1.")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token from the bucket.
+
+        Returns
+        ----------
+        How many seconds the caller has to wait
+        before the token it took is actually available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """
+        Take one token from the bucket,
+        blocking this thread until it is available.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """
+        Take one token from the bucket,
+        without blocking the event loop while waiting for it.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def get_rate_limiter(host: str) -> TokenBucket:
+    """
+    Given a host, return the `TokenBucket` shared by every request
+    sent to that host, creating it the first time that host is seen.
+
+    Parameters
+    ----------
+    `host` (str, mandatory):
+        The host, as returned by `http_client.get_host()`.
+
+    Returns
+    ----------
+    The `TokenBucket` of `host`.
+    """
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(host)
+        if limiter is None:
+            rate, capacity = HOST_RATE_LIMITS.get(host, DEFAULT_RATE_LIMIT)
+            limiter = TokenBucket(rate, capacity)
+            _LIMITERS[host] = limiter
+    return limiter
+
+
+def set_rate_limit(host: str, rate: float, capacity: int = 1):
+    """
+    Change the request budget of a host.
+
+    Parameters
+    ----------
+    `host` (str, mandatory):
+        The host, as returned by `http_client.get_host()`.
+
+    `rate` (float, mandatory):
+        How many requests per second may be sent to `host`.
+
+    `capacity` (int, optional):
+        How many requests may be sent to `host` back-to-back.
+    """
+    with _LIMITERS_LOCK:
+        HOST_RATE_LIMITS[host] = (rate, capacity)
+        _LIMITERS[host] = TokenBucket(rate, capacity)
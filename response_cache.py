@@ -0,0 +1,248 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from http_client import http_get
+
+# Raw responses are stored twice over:
+# `bodies/` holds every distinct response body once, gzipped,
+# under the SHA-256 of that body,
+# and `urls/` holds one small JSON file per URL,
+# with the fetch metadata and the hash of its latest body.
+CACHE_DIR = "cache/responses"
+# How long (in seconds) a response for a game that is not final yet
+# can be reused before it is downloaded again.
+DEFAULT_TTL = 60
+
+
+class CachedResponse:
+    """
+    The parts of a `requests.Response` these scripts use,
+    for a response that may have come from the response cache.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        content: bytes,
+        encoding: str = "utf-8",
+        from_cache: bool = False
+    ):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.encoding = encoding or "utf-8"
+        self.from_cache = from_cache
+
+    @property
+    def text(self) -> str:
+        """ """
+        return self.content.decode(self.encoding, errors="replace")
+
+
+def get_response_encoding(response) -> str:
+    """
+    Given a response, return the encoding `response.text` decodes it with.
+    """
+    encoding = getattr(response, "encoding", None)
+    if encoding is None:
+        encoding = getattr(response, "apparent_encoding", None)
+    return encoding or "utf-8"
+
+
+def normalize_url(url: str) -> str:
+    """
+    Given a URL, return the form of it that is used as its cache key.
+
+    The scheme and host are lowercased,
+    a leading `www.` is dropped from the host,
+    the query parameters are sorted,
+    and any fragment is removed.
+
+    Parameters
+    ----------
+    `url` (str, mandatory):
+        The URL you want to normalize.
+
+    Returns
+    ----------
+    The normalized URL.
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port:
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit(
+        (parts.scheme.lower(), host, parts.path or "/", query, "")
+    )
+
+
+def _url_key(url: str) -> str:
+    """ """
+    return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+
+
+def _url_path(url_key: str) -> str:
+    """ """
+    return os.path.join(CACHE_DIR, "urls", url_key[:2], f"{url_key}.json")
+
+
+def _body_path(body_hash: str) -> str:
+    """ """
+    return os.path.join(
+        CACHE_DIR,
+        "bodies",
+        body_hash[:2],
+        f"{body_hash}.gz"
+    )
+
+
+def _write_atomic(path: str, data: bytes):
+    """
+    Write `data` to `path`, so that a reader never sees a partial file.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def get_cached_response(url: str, ttl: float = DEFAULT_TTL) -> CachedResponse:
+    """
+    Given a URL, return its cached response,
+    if there is one that can still be used.
+
+    Parameters
+    ----------
+    `url` (str, mandatory):
+        The URL you want the cached response of.
+
+    `ttl` (float, optional):
+        How old (in seconds) a cached response that is not final
+        can be before it is no longer used.
+
+    Returns
+    ----------
+    A `CachedResponse`, or `None` if the cache has no usable response.
+    """
+    try:
+        with open(_url_path(_url_key(url)), "r", encoding="utf-8") as f:
+            metadata = json.load(f)
+        with open(_body_path(metadata["body_sha256"]), "rb") as f:
+            content = gzip.decompress(f.read())
+    except (OSError, ValueError, KeyError) as e:
+        if not isinstance(e, FileNotFoundError):
+            logging.warning(
+                f"Ignoring unreadable cache entry for `{url}`: {e}"
+            )
+        return None
+
+    if not metadata["final"] and time.time() - metadata["fetched_at"] > ttl:
+        return None
+
+    return CachedResponse(
+        url=metadata["url"],
+        status_code=metadata["status_code"],
+        content=content,
+        encoding=metadata["encoding"],
+        from_cache=True
+    )
+
+
+def cache_response(url: str, response, final: bool = False):
+    """
+    Store a response in the response cache.
+
+    Parameters
+    ----------
+    `url` (str, mandatory):
+        The URL that was downloaded.
+
+    `response` (requests.Response or CachedResponse, mandatory):
+        The response of `url`.
+
+    `final` (bool, optional):
+        If `True`, the data behind `url` will never change again
+        (for example, the game is final),
+        so this response will be used forever.
+    """
+    url_path = _url_path(_url_key(url))
+
+    content = response.content
+    body_hash = hashlib.sha256(content).hexdigest()
+    body_path = _body_path(body_hash)
+    if not os.path.exists(body_path):
+        _write_atomic(body_path, gzip.compress(content))
+
+    metadata = {
+        "url": url,
+        "normalized_url": normalize_url(url),
+        "status_code": response.status_code,
+        "encoding": get_response_encoding(response),
+        "body_sha256": body_hash,
+        "body_size": len(content),
+        "fetched_at": time.time(),
+        "fetched_at_iso": datetime.now(timezone.utc).isoformat(),
+        "final": final,
+    }
+    _write_atomic(url_path, json.dumps(metadata, indent=4).encode("utf-8"))
+
+
+def cached_http_get(
+    url: str,
+    final: bool = False,
+    ttl: float = DEFAULT_TTL,
+    refresh: bool = False
+) -> CachedResponse:
+    """
+    Download `url` through the response cache.
+
+    Parameters
+    ----------
+    `url` (str, mandatory):
+        The URL you want to download.
+
+    `final` (bool, optional):
+        If `True`, the data behind `url` will never change again,
+        so the response is cached forever.
+
+    `ttl` (float, optional):
+        How old (in seconds) a cached response that is not final
+        can be before `url` is downloaded again.
+
+    `refresh` (bool, optional):
+        If `True`, ignore any cached response and download `url` again.
+
+    Returns
+    ----------
+    A `CachedResponse` for `url`.
+    """
+    if not refresh:
+        response = get_cached_response(url, ttl=ttl)
+        if response is not None:
+            return response
+
+    response = http_get(url)
+    if response.status_code == 200:
+        cache_response(url, response, final=final)
+    return CachedResponse(
+        url=url,
+        status_code=response.status_code,
+        content=response.content,
+        encoding=get_response_encoding(response)
+    )
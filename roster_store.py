@@ -0,0 +1,198 @@
+import logging
+import os
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from get_cfl_rosters import get_stats_crew_cfl_rosters
+from parquet_io import write_parquet
+from schemas import STATS_CREW_ROSTERS_ARROW_SCHEMA, read_dataset
+
+ROSTER_SNAPSHOT_DIR = "cache/rosters"
+# How old (in seconds) the statscrew.com rosters of the current season
+# can be before `RosterStore.refresh_if_due()` downloads them again.
+# The rosters of past seasons are only downloaded once.
+ROSTER_REFRESH_INTERVAL = 7 * 24 * 60 * 60
+
+
+class RosterStore:
+    """
+    Keeps the statscrew.com rosters of every season that was asked for
+    in memory, so they are only read once per process.
+
+    Rosters are read from a Parquet snapshot in `snapshot_dir`,
+    or, if there is none yet, from the rosters saved by
+    `get_cfl_rosters.get_stats_crew_cfl_rosters()`.
+    `get()` never downloads anything,
+    so asking for the rosters of a season never stalls a scraper;
+    they are only downloaded by `refresh()`,
+    or `refresh_if_due()`, which is called before a season is parsed
+    (`get_cfl_pbp.get_cfl_season_pbp_data()`) or watched.
+
+    Parameters
+    ----------
+    `snapshot_dir` (str, optional):
+        Where to save roster snapshots.
+
+    `refresh_interval` (float, optional):
+        How old (in seconds) the rosters of the current season can be
+        before `refresh_if_due()` downloads them again.
+    """
+
+    def __init__(
+        self,
+        snapshot_dir: str = ROSTER_SNAPSHOT_DIR,
+        refresh_interval: float = ROSTER_REFRESH_INTERVAL
+    ):
+        self.snapshot_dir = snapshot_dir
+        self.refresh_interval = refresh_interval
+        # season -> the rosters of that season
+        # (`None` if there are no saved rosters of that season)
+        self._rosters = {}
+
+    def _get_snapshot_path(self, season: int) -> str:
+        """ """
+        return f"{self.snapshot_dir}/{season}_stats_crew_cfl_rosters.parquet"
+
+    def _save_snapshot(self, season: int, roster_df: pd.DataFrame):
+        """ """
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        write_parquet(
+            roster_df,
+            self._get_snapshot_path(season),
+            STATS_CREW_ROSTERS_ARROW_SCHEMA
+        )
+
+    def _load(self, season: int) -> pd.DataFrame:
+        """
+        Load the rosters of a season from disk,
+        or return `None` if they were never saved.
+        """
+        file_paths_arr = [
+            self._get_snapshot_path(season),
+            f"rosters/{season}_stats_crew_cfl_rosters.parquet",
+            f"rosters/{season}_stats_crew_cfl_rosters.csv",
+        ]
+        for file_path in file_paths_arr:
+            try:
+                roster_df = read_dataset(
+                    file_path,
+                    STATS_CREW_ROSTERS_ARROW_SCHEMA
+                )
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError) as e:
+                logging.warning(
+                    f"Ignoring the unreadable rosters `{file_path}`: {e}"
+                )
+                continue
+
+            if file_path != file_paths_arr[0]:
+                # The snapshot is as old as the rosters it was made from.
+                self._save_snapshot(season, roster_df)
+                saved_at = os.path.getmtime(file_path)
+                os.utime(
+                    self._get_snapshot_path(season),
+                    (saved_at, saved_at)
+                )
+            return roster_df
+        return None
+
+    def get(self, season: int) -> pd.DataFrame:
+        """
+        Given a season, return its statscrew.com rosters,
+        or `None` if they were never downloaded
+        (see `refresh()`).
+
+        Every caller gets the same `DataFrame`,
+        so it must not be modified in place.
+        """
+        if season not in self._rosters:
+            self._rosters[season] = self._load(season)
+        return self._rosters[season]
+
+    def get_age(self, season: int) -> float:
+        """
+        Given a season, return how old (in seconds)
+        the snapshot of its rosters is,
+        or `None` if there is no snapshot of that season.
+        """
+        try:
+            return time.time() - os.path.getmtime(
+                self._get_snapshot_path(season)
+            )
+        except FileNotFoundError:
+            return None
+
+    def is_due(self, season: int) -> bool:
+        """
+        Given a season, return `True` if its rosters
+        should be downloaded again:
+        if they were never downloaded, or if it is the current season,
+        and its rosters are older than `refresh_interval`.
+        """
+        if self.get(season) is None:
+            return True
+
+        now = datetime.now()
+        current_season = now.year
+        if now.month < 5:
+            current_season -= 1
+
+        age = self.get_age(season)
+        return season >= current_season and (
+            age is None or age > self.refresh_interval
+        )
+
+    def refresh(self, season: int) -> pd.DataFrame:
+        """
+        Download the statscrew.com rosters of a season,
+        and replace the rosters of that season kept in memory and on disk.
+        """
+        roster_df = get_stats_crew_cfl_rosters(season)
+        self._save_snapshot(season, roster_df)
+        self._rosters[season] = roster_df
+        return roster_df
+
+    def refresh_if_due(self, season: int) -> bool:
+        """
+        Download the statscrew.com rosters of a season again,
+        if `is_due()` says they should be.
+
+        A download that fails is logged,
+        and the rosters that were already saved are kept.
+
+        Returns
+        ----------
+        `True` if the rosters of that season were downloaded.
+        """
+        if not self.is_due(season):
+            return False
+        try:
+            self.refresh(season)
+        except Exception as e:
+            logging.warning(
+                f"Cannot download the {season} statscrew.com rosters, " +
+                f"the saved rosters are kept: {e}"
+            )
+            return False
+        return True
+
+    def clear(self):
+        """
+        Forget every roster kept in memory
+        (snapshots on disk are kept).
+        """
+        self._rosters = {}
+
+
+# The `RosterStore` shared by everything in this process.
+_roster_store = RosterStore()
+
+
+def get_roster_store() -> RosterStore:
+    """
+    Return the `RosterStore` shared by everything in this process.
+    """
+    return _roster_store
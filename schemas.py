@@ -0,0 +1,940 @@
+import logging
+
+import pandas as pd
+import pyarrow as pa
+
+# Fixed column layouts and types of the datasets built by this repository.
+# Every builder applies the schema of its dataset once,
+# right before it is returned or saved (see `apply_schema()`),
+# and every reader loads a dataset with it (see `read_dataset()`).
+
+# Every play parsed by `get_cfl_pbp.parser()` produces exactly one value for
+# each of these columns, in this order.
+PBP_COLUMNS = (
+    "play_id",
+    "game_id",
+    "home_team",
+    "away_team",
+    "season_type",
+    "week",
+    "posteam",
+    "posteam_type",
+    "defteam",
+    "side_of_field",
+    "yardline_100",
+    "game_date",
+    "quarter_seconds_remaining",
+    "half_seconds_remaining",
+    "game_seconds_remaining",
+    "game_half",
+    "quarter_end",
+    "drive",
+    "sp",
+    "qtr",
+    "down",
+    "goal_to_go",
+    "time",
+    "yrdln",
+    "yds_to_go",
+    "yds_net",
+    "desc",
+    "play_type",
+    "yards_gained",
+    "shotgun",
+    "no_huddle",
+    "qb_dropback",
+    "qb_kneel",
+    "qb_spike",
+    "qb_scramble",
+    "pass_length",
+    "pass_location",
+    "air_yards",
+    "yards_after_catch",
+    "run_location",
+    "run_gap",
+    "field_goal_result",
+    "kick_distance",
+    "extra_point_result",
+    "two_point_conv_result",
+    "home_timeouts_remaining",
+    "away_timeouts_remaining",
+    "timeout",
+    "timeout_team",
+    "td_team",
+    "td_player_name",
+    "td_player_id",
+    "posteam_timeouts_remaining",
+    "defteam_timeouts_remaining",
+    "total_home_score",
+    "total_away_score",
+    "posteam_score",
+    "defteam_score",
+    "score_differential",
+    "posteam_score_post",
+    "defteam_score_post",
+    "score_differential_post",
+    "punt_blocked",
+    "first_down_rush",
+    "first_down_pass",
+    "first_down_penalty",
+    "second_down_converted",
+    "second_down_failed",
+    "third_down_converted",
+    "third_down_failed",
+    "fourth_down_converted",
+    "fourth_down_failed",
+    "incomplete_pass",
+    "is_no_play",
+    "touchback",
+    "interception",
+    "punt_inside_twenty",
+    "punt_in_endzone",
+    "punt_out_of_bounds",
+    "punt_downed",
+    "punt_fair_catch",
+    "kickoff_inside_twenty",
+    "kickoff_in_endzone",
+    "kickoff_out_of_bounds",
+    "kickoff_downed",
+    "kickoff_fair_catch",
+    "fumble_forced",
+    "fumble_not_forced",
+    "fumble_out_of_bounds",
+    "solo_tackle",
+    "safety",
+    "penalty",
+    "tackled_for_loss",
+    "fumble_lost",
+    "own_kickoff_recovery",
+    "own_kickoff_recovery_td",
+    "qb_hit",
+    "rush_attempt",
+    "pass_attempt",
+    "is_rouge",
+    "sack",
+    "touchdown",
+    "pass_touchdown",
+    "rush_touchdown",
+    "return_touchdown",
+    "extra_point_attempt",
+    "two_point_attempt",
+    "field_goal_attempt",
+    "kickoff_attempt",
+    "punt_attempt",
+    "fumble",
+    "complete_pass",
+    "assist_tackle",
+    "lateral_reception",
+    "lateral_rush",
+    "lateral_return",
+    "lateral_recovery",
+    "passer_player_id",
+    "passer_player_name",
+    "passing_yards",
+    "receiver_player_id",
+    "receiver_player_name",
+    "receiving_yards",
+    "rusher_player_id",
+    "rusher_player_name",
+    "rushing_yards",
+    "lateral_receiver_player_id",
+    "lateral_receiver_player_name",
+    "lateral_receiving_yards",
+    "lateral_rusher_player_id",
+    "lateral_rusher_player_name",
+    "lateral_rushing_yards",
+    "lateral_return_yards",
+    "lateral_sack_player_id",
+    "lateral_sack_player_name",
+    "interception_player_id",
+    "interception_player_name",
+    "lateral_interception_player_id",
+    "lateral_interception_player_name",
+    "punt_returner_player_id",
+    "punt_returner_player_name",
+    "lateral_punt_returner_player_id",
+    "lateral_punt_returner_player_name",
+    "kickoff_returner_player_name",
+    "kickoff_returner_player_id",
+    "lateral_kickoff_returner_player_id",
+    "lateral_kickoff_returner_player_name",
+    "punter_player_id",
+    "punter_player_name",
+    "kicker_player_id",
+    "kicker_player_name",
+    "own_kickoff_recovery_player_id",
+    "own_kickoff_recovery_player_name",
+    "blocked_player_id",
+    "blocked_player_name",
+    "tackle_for_loss_1_player_id",
+    "tackle_for_loss_1_player_name",
+    "tackle_for_loss_2_player_id",
+    "tackle_for_loss_2_player_name",
+    "qb_hit_1_player_id",
+    "qb_hit_1_player_name",
+    "qb_hit_2_player_id",
+    "qb_hit_2_player_name",
+    "forced_fumble_player_1_team",
+    "forced_fumble_player_1_player_id",
+    "forced_fumble_player_1_player_name",
+    "forced_fumble_player_2_team",
+    "forced_fumble_player_2_player_id",
+    "forced_fumble_player_2_player_name",
+    "solo_tackle_1_team",
+    "solo_tackle_2_team",
+    "solo_tackle_1_player_id",
+    "solo_tackle_2_player_id",
+    "solo_tackle_1_player_name",
+    "solo_tackle_2_player_name",
+    "assist_tackle_1_player_id",
+    "assist_tackle_1_player_name",
+    "assist_tackle_1_team",
+    "assist_tackle_2_player_id",
+    "assist_tackle_2_player_name",
+    "assist_tackle_2_team",
+    "assist_tackle_3_player_id",
+    "assist_tackle_3_player_name",
+    "assist_tackle_3_team",
+    "assist_tackle_4_player_id",
+    "assist_tackle_4_player_name",
+    "assist_tackle_4_team",
+    "tackle_with_assist",
+    "tackle_with_assist_1_player_id",
+    "tackle_with_assist_1_player_name",
+    "tackle_with_assist_1_team",
+    "tackle_with_assist_2_player_id",
+    "tackle_with_assist_2_player_name",
+    "tackle_with_assist_2_team",
+    "pass_defense_1_player_id",
+    "pass_defense_1_player_name",
+    "pass_defense_2_player_id",
+    "pass_defense_2_player_name",
+    "fumbled_1_team",
+    "fumbled_1_player_id",
+    "fumbled_1_player_name",
+    "fumbled_2_player_id",
+    "fumbled_2_player_name",
+    "fumbled_2_team",
+    "fumble_recovery_1_team",
+    "fumble_recovery_1_yards",
+    "fumble_recovery_1_player_id",
+    "fumble_recovery_1_player_name",
+    "fumble_recovery_2_team",
+    "fumble_recovery_2_yards",
+    "fumble_recovery_2_player_id",
+    "fumble_recovery_2_player_name",
+    "lateral_fumble_recovery_team",
+    "lateral_fumble_recovery_player_id",
+    "lateral_fumble_recovery_player_name",
+    "sack_player_id",
+    "sack_player_name",
+    "half_sack_1_player_id",
+    "half_sack_1_player_name",
+    "half_sack_2_player_id",
+    "half_sack_2_player_name",
+    "missed_fg_return_team",
+    "missed_fg_return_player_id",
+    "missed_fg_return_player_name",
+    "missed_fg_return_yards",
+    "return_team",
+    "return_yards",
+    "penalty_team",
+    "penalty_player_id",
+    "penalty_player_name",
+    "penalty_yards",
+    "replay_or_challenge",
+    "replay_or_challenge_result",
+    "penalty_type",
+    "defensive_two_point_attempt",
+    "defensive_two_point_conv",
+    "defensive_extra_point_attempt",
+    "defensive_extra_point_conv",
+    "safety_player_name",
+    "safety_player_id",
+    "season",
+    "order_sequence",
+    "game_play_num",
+    "start_time",
+    "time_of_day",
+    "stadium",
+    "weather",
+    "play_clock",
+    "special_teams_play",
+    "st_play_type",
+    "end_clock_time",
+    "end_yard_line",
+    "fixed_drive",
+    "away_score",
+    "home_score",
+    "location",
+    "result",
+    "total",
+    "spread_line",
+    "total_line",
+    "div_game",
+    "roof",
+    "surface",
+    "temp",
+    "wind",
+    "home_coach",
+    "away_coach",
+    "stadium_id",
+    "game_stadium",
+    "aborted_play",
+    "success",
+    "pass",
+    "rush",
+    "first_down",
+    "special",
+    "play",
+    "out_of_bounds",
+    "home_opening_kickoff",
+)
+
+# Strings with only a handful of distinct values (team abbreviations,
+# play types, positions, etc.) are dictionary-encoded.
+DICTIONARY_STRING = pa.dictionary(pa.int16(), pa.string())
+
+PBP_BOOL_COLUMNS = (
+    "sp",
+    "quarter_end",
+    "goal_to_go",
+    "shotgun",
+    "no_huddle",
+    "qb_dropback",
+    "qb_kneel",
+    "qb_spike",
+    "qb_scramble",
+    "timeout",
+    "punt_blocked",
+    "first_down_rush",
+    "first_down_pass",
+    "first_down_penalty",
+    "second_down_converted",
+    "second_down_failed",
+    "third_down_converted",
+    "third_down_failed",
+    "fourth_down_converted",
+    "fourth_down_failed",
+    "incomplete_pass",
+    "is_no_play",
+    "touchback",
+    "interception",
+    "punt_inside_twenty",
+    "punt_in_endzone",
+    "punt_out_of_bounds",
+    "punt_downed",
+    "punt_fair_catch",
+    "kickoff_inside_twenty",
+    "kickoff_in_endzone",
+    "kickoff_out_of_bounds",
+    "kickoff_downed",
+    "kickoff_fair_catch",
+    "fumble_forced",
+    "fumble_not_forced",
+    "fumble_out_of_bounds",
+    "solo_tackle",
+    "safety",
+    "penalty",
+    "tackled_for_loss",
+    "fumble_lost",
+    "own_kickoff_recovery",
+    "own_kickoff_recovery_td",
+    "qb_hit",
+    "rush_attempt",
+    "pass_attempt",
+    "is_rouge",
+    "sack",
+    "touchdown",
+    "pass_touchdown",
+    "rush_touchdown",
+    "return_touchdown",
+    "extra_point_attempt",
+    "two_point_attempt",
+    "field_goal_attempt",
+    "kickoff_attempt",
+    "punt_attempt",
+    "fumble",
+    "complete_pass",
+    "assist_tackle",
+    "lateral_reception",
+    "lateral_rush",
+    "lateral_return",
+    "lateral_recovery",
+    "tackle_with_assist",
+    "replay_or_challenge",
+    "defensive_two_point_attempt",
+    "defensive_two_point_conv",
+    "defensive_extra_point_attempt",
+    "defensive_extra_point_conv",
+    "special_teams_play",
+    "div_game",
+    "aborted_play",
+    "success",
+    "pass",
+    "rush",
+    "first_down",
+    "special",
+    "play",
+    "out_of_bounds",
+    "home_opening_kickoff",
+)
+
+PBP_INT8_COLUMNS = (
+    "week",
+    "qtr",
+    "down",
+    "home_timeouts_remaining",
+    "away_timeouts_remaining",
+    "posteam_timeouts_remaining",
+    "defteam_timeouts_remaining",
+    "play_clock",
+)
+
+# Yards, scores, seconds, and drive numbers.
+PBP_INT16_COLUMNS = (
+    "game_play_num",
+    "yardline_100",
+    "quarter_seconds_remaining",
+    "half_seconds_remaining",
+    "game_seconds_remaining",
+    "drive",
+    "yds_to_go",
+    "yds_net",
+    "yards_gained",
+    "air_yards",
+    "yards_after_catch",
+    "kick_distance",
+    "total_home_score",
+    "total_away_score",
+    "posteam_score",
+    "defteam_score",
+    "score_differential",
+    "posteam_score_post",
+    "defteam_score_post",
+    "score_differential_post",
+    "passing_yards",
+    "receiving_yards",
+    "rushing_yards",
+    "lateral_receiving_yards",
+    "lateral_rushing_yards",
+    "lateral_return_yards",
+    "fumble_recovery_1_yards",
+    "fumble_recovery_2_yards",
+    "missed_fg_return_yards",
+    "return_yards",
+    "penalty_yards",
+    "season",
+    "fixed_drive",
+    "away_score",
+    "home_score",
+    "result",
+    "total",
+    "temp",
+    "wind",
+)
+
+PBP_INT64_COLUMNS = (
+    "play_id",
+    "game_id",
+    "order_sequence",
+)
+
+PBP_FLOAT_COLUMNS = (
+    "spread_line",
+    "total_line",
+)
+
+PBP_DICTIONARY_COLUMNS = (
+    "home_team",
+    "away_team",
+    "season_type",
+    "posteam",
+    "posteam_type",
+    "defteam",
+    "side_of_field",
+    "game_half",
+    "play_type",
+    "pass_length",
+    "pass_location",
+    "run_location",
+    "run_gap",
+    "field_goal_result",
+    "extra_point_result",
+    "two_point_conv_result",
+    "timeout_team",
+    "td_team",
+    "forced_fumble_player_1_team",
+    "forced_fumble_player_2_team",
+    "solo_tackle_1_team",
+    "solo_tackle_2_team",
+    "assist_tackle_1_team",
+    "assist_tackle_2_team",
+    "assist_tackle_3_team",
+    "assist_tackle_4_team",
+    "tackle_with_assist_1_team",
+    "tackle_with_assist_2_team",
+    "fumbled_1_team",
+    "fumbled_2_team",
+    "fumble_recovery_1_team",
+    "fumble_recovery_2_team",
+    "lateral_fumble_recovery_team",
+    "missed_fg_return_team",
+    "return_team",
+    "penalty_team",
+    "replay_or_challenge_result",
+    "penalty_type",
+    "stadium",
+    "st_play_type",
+    "location",
+    "roof",
+    "surface",
+    "home_coach",
+    "away_coach",
+    "game_stadium",
+)
+
+# Every play has a value in these columns.
+PBP_REQUIRED_COLUMNS = (
+    "play_id",
+    "game_id",
+    "season",
+    "order_sequence",
+    "game_play_num",
+)
+
+# Every other play-by-play column (player names and IDs, descriptions,
+# clocks, and dates) is a plain string.
+PBP_ARROW_TYPES = {
+    **dict.fromkeys(PBP_BOOL_COLUMNS, pa.bool_()),
+    **dict.fromkeys(PBP_INT8_COLUMNS, pa.int8()),
+    **dict.fromkeys(PBP_INT16_COLUMNS, pa.int16()),
+    **dict.fromkeys(PBP_INT64_COLUMNS, pa.int64()),
+    **dict.fromkeys(PBP_FLOAT_COLUMNS, pa.float64()),
+    **dict.fromkeys(PBP_DICTIONARY_COLUMNS, DICTIONARY_STRING),
+}
+PBP_ARROW_SCHEMA = pa.schema(
+    [
+        pa.field(
+            column,
+            PBP_ARROW_TYPES.get(column, pa.string()),
+            nullable=column not in PBP_REQUIRED_COLUMNS
+        )
+        for column in PBP_COLUMNS
+    ]
+)
+
+PLAYER_GAME_STATS_ARROW_SCHEMA = pa.schema(
+    [
+        ("competitor_id", pa.int64()),
+        ("player_jersey_number", pa.uint8()),
+        ("player_full_name", pa.string()),
+        ("player_abv_name", pa.string()),
+        ("player_position", DICTIONARY_STRING),
+        ("player_status", DICTIONARY_STRING),
+        # Passing
+        ("passing_COMP", pa.int16()),
+        ("passing_ATT", pa.int16()),
+        ("passing_COMP%", pa.float64()),
+        ("passing_YDS", pa.int16()),
+        ("passing_TD", pa.int16()),
+        ("passing_INT", pa.int16()),
+        ("passing_LONG", pa.int16()),
+        ("passing_YDS/ATT", pa.float64()),
+        ("passing_AY/A", pa.float64()),
+        # Rushing
+        ("rushing_ATT", pa.int16()),
+        ("rushing_YDS", pa.int16()),
+        ("rushing_TD", pa.int16()),
+        ("rushing_LONG", pa.int16()),
+        ("rushing_AVG", pa.float64()),
+        # Receiving
+        ("receiving_TGT", pa.int16()),
+        ("receiving_REC", pa.int16()),
+        ("receiving_YDS", pa.int16()),
+        ("receiving_YAC", pa.int16()),
+        ("receiving_TD", pa.int16()),
+        ("receiving_LONG", pa.int16()),
+        ("receiving_AVG", pa.float64()),
+        ("receiving_YDS/TGT", pa.float64()),
+        ("receiving_CATCH%", pa.float64()),
+        # Defense
+        ("defense_SOLO", pa.int16()),
+        ("defense_SACKS", pa.float64()),
+        ("defense_TFL", pa.float64()),
+        ("defense_INT", pa.int16()),
+        ("defense_FF", pa.int16()),
+        ("defense_FR", pa.int16()),
+        ("defense_ST_TAK", pa.int16()),
+        # Kicking
+        ("kicking_FGM", pa.int16()),
+        ("kicking_FGA", pa.int16()),
+        ("kicking_FG%", pa.float64()),
+        ("kicking_FG_LONG", pa.int16()),
+        ("kicking_XP", pa.int16()),
+        ("kicking_ROUGE", pa.int16()),
+        ("kickoffs_NUM", pa.int16()),
+        ("kickoffs_YDS", pa.int16()),
+        ("kickoffs_LONG", pa.int16()),
+        # Punting
+        ("punting_NO", pa.int16()),
+        ("punting_GROSS_YDS", pa.int16()),
+        ("punting_GROSS_AVG", pa.float64()),
+        ("punting_LONG", pa.int16()),
+        ("punting_IN_10", pa.int16()),
+        # Returns
+        ("kick_return_NUM", pa.int16()),
+        ("kick_return_YDS", pa.int16()),
+        ("kick_return_LONG", pa.int16()),
+        ("kick_return_AVG", pa.float64()),
+        ("punt_return_NUM", pa.int16()),
+        ("punt_return_YDS", pa.int16()),
+        ("punt_return_LONG", pa.int16()),
+        ("punt_return_AVG", pa.float64()),
+        # Added to every player
+        pa.field("game_id", pa.int32(), nullable=False),
+        ("team_id", pa.string()),
+        ("team_abv", DICTIONARY_STRING),
+        ("team_name", DICTIONARY_STRING),
+        ("season_type", DICTIONARY_STRING),
+        ("last_updated", pa.string()),
+        pa.field("season", pa.int16(), nullable=False),
+    ]
+)
+
+TEAM_GAME_STATS_ARROW_SCHEMA = pa.schema(
+    [
+        pa.field("team_id", pa.int64(), nullable=False),
+        ("team_abv", DICTIONARY_STRING),
+        ("team_name", DICTIONARY_STRING),
+        ("points_scored", pa.int16()),
+        ("points_allowed", pa.int16()),
+        ("team_time_of_possession", pa.string()),
+        ("penalties_NUM", pa.int16()),
+        ("penalties_YDS", pa.int16()),
+        ("offense_PLAYS", pa.int16()),
+        ("offense_YDS", pa.int16()),
+        ("offense_YDS/PLAY", pa.float64()),
+        ("offense_first_downs_passing", pa.int16()),
+        ("offense_first_downs_rushing", pa.int16()),
+        ("offense_first_downs_penalty", pa.int16()),
+        ("offense_turnovers", pa.int16()),
+        ("second_downs_ATT", pa.int16()),
+        ("second_downs_MADE", pa.int16()),
+        ("third_downs_ATT", pa.int16()),
+        ("third_downs_MADE", pa.int16()),
+        ("red_zone_OPP", pa.int16()),
+        ("red_zone_TD", pa.int16()),
+        ("second_downs_PCT", pa.float64()),
+        ("passing_ATT", pa.int16()),
+        ("passing_YDS", pa.int16()),
+        ("passing_INT", pa.int16()),
+        ("passing_YDS/ATT", pa.float64()),
+        ("rushing_ATT", pa.int16()),
+        ("rushing_YDS", pa.int16()),
+        ("rushing_YDS/ATT", pa.float64()),
+        ("fumbles_NUM", pa.int16()),
+        ("fumbles_LOST", pa.int16()),
+        ("fumbles_FR", pa.int16()),
+        ("fumbles_FR_YDS", pa.int16()),
+        ("defense_TFL", pa.float64()),
+        ("defense_SACKS", pa.float64()),
+        ("defense_SACK_YDS", pa.int16()),
+        ("defense_BLK", pa.int16()),
+        ("defense_INT", pa.int16()),
+        ("defense_INT_YDS", pa.int16()),
+        ("kicking_FGM", pa.int16()),
+        ("kicking_FGA", pa.int16()),
+        ("kicking_FG_LONG", pa.int16()),
+        ("punting_NUM", pa.int16()),
+        ("punting_GROSS_YDS", pa.int16()),
+        ("punting_GROSS_AVG", pa.float64()),
+        ("punt_return_NUM", pa.int16()),
+        ("punt_return_YDS", pa.int16()),
+        ("punt_return_AVG", pa.float64()),
+        ("kick_return_NUM", pa.int16()),
+        ("kick_return_YDS", pa.int16()),
+        ("kick_return_AVG", pa.float64()),
+        ("missed_fg_return_NUM", pa.int16()),
+        ("missed_fg_return_YDS", pa.int16()),
+        pa.field("season", pa.int16(), nullable=False),
+        pa.field("game_id", pa.int32(), nullable=False),
+        pa.field("fixture_id", pa.int64(), nullable=False),
+        ("season_type", DICTIONARY_STRING),
+        ("last_updated", pa.string()),
+    ]
+)
+
+# The schedule is flattened from JSON,
+# so only the columns these scripts rely on are declared here.
+# Every other column keeps the type Arrow infers for it.
+SCHEDULE_ARROW_SCHEMA = pa.schema(
+    [
+        pa.field("eventId", pa.int32(), nullable=False),
+        ("fixtureId", pa.int64()),
+        ("startDate", pa.timestamp("us", tz="UTC")),
+        ("eventTypeId", pa.int8()),
+        ("eventTypeName", DICTIONARY_STRING),
+        ("eventStatus_eventStatusId", pa.int8()),
+        ("eventStatus_name", DICTIONARY_STRING),
+        ("eventStatus_period", pa.int8()),
+        ("week", pa.int8()),
+        ("team_1_score", pa.int16()),
+        ("team_2_score", pa.int16()),
+        ("day_of_week", DICTIONARY_STRING),
+    ]
+)
+
+TRANSACTIONS_ARROW_SCHEMA = pa.schema(
+    [
+        ("date", pa.string()),
+        ("team_id", DICTIONARY_STRING),
+        ("position", DICTIONARY_STRING),
+        ("status", DICTIONARY_STRING),
+        ("college", pa.string()),
+        ("transaction_id", pa.string()),
+        ("transaction_desc", DICTIONARY_STRING),
+        ("player_id", pa.string()),
+        ("player_name", pa.string()),
+    ]
+)
+
+# `rosters/cfl_players`, `rosters/{season}_cfl_rosters`,
+# and the weekly rosters.
+ROSTERS_ARROW_SCHEMA = pa.schema(
+    [
+        ("jersey_num", pa.uint8()),
+        ("player_name", pa.string()),
+        ("current_team_abv", DICTIONARY_STRING),
+        ("position", DICTIONARY_STRING),
+        ("import_status", DICTIONARY_STRING),
+        ("height", pa.string()),
+        ("weight", pa.int16()),
+        ("age", pa.int8()),
+        ("college", pa.string()),
+        ("player_url", pa.string()),
+        pa.field("player_id", pa.int64(), nullable=False),
+        ("last_updated", pa.string()),
+        ("season", pa.int16()),
+        ("week", pa.int8()),
+    ]
+)
+
+# The roster tables on statscrew.com can have more columns than these,
+# which keep the type Arrow infers for them.
+STATS_CREW_ROSTERS_ARROW_SCHEMA = pa.schema(
+    [
+        ("player_jersey_num", pa.uint8()),
+        ("player_full_name", pa.string()),
+        ("player_position", DICTIONARY_STRING),
+        ("player_birthday", pa.string()),
+        ("player_height", pa.string()),
+        ("player_weight", pa.int16()),
+        ("player_college", pa.string()),
+        ("player_hometown", pa.string()),
+        ("stats_crew_player_id", pa.string()),
+        ("team_id", DICTIONARY_STRING),
+        ("player_first_name", pa.string()),
+        ("player_last_name", pa.string()),
+    ]
+)
+
+# `rosters/cfl_player_crosswalk`, one row per player, season, and team.
+# A player keeps the same `person_id`, and the same ID from every source,
+# in every one of their rows.
+PLAYER_CROSSWALK_ARROW_SCHEMA = pa.schema(
+    [
+        pa.field("person_id", pa.int64(), nullable=False),
+        ("cfl_player_id", pa.int64()),
+        ("competitor_id", pa.int64()),
+        ("stats_crew_player_id", pa.string()),
+        ("player_full_name", pa.string()),
+        ("player_abv_name", pa.string()),
+        ("season", pa.int16()),
+        ("team_abv", DICTIONARY_STRING),
+        ("last_updated", pa.string()),
+    ]
+)
+
+NEGOTIATION_LISTS_ARROW_SCHEMA = pa.schema(
+    [
+        ("team_abv", DICTIONARY_STRING),
+        ("player_full_name", pa.string()),
+        ("player_position", DICTIONARY_STRING),
+        ("player_college", pa.string()),
+        ("last_update", pa.string()),
+        ("update_date", pa.string()),
+    ]
+)
+
+# Every dataset built by this repository, and its schema.
+DATASET_SCHEMAS = {
+    "pbp": PBP_ARROW_SCHEMA,
+    "player_game_stats": PLAYER_GAME_STATS_ARROW_SCHEMA,
+    "team_game_stats": TEAM_GAME_STATS_ARROW_SCHEMA,
+    "schedule": SCHEDULE_ARROW_SCHEMA,
+    "transactions": TRANSACTIONS_ARROW_SCHEMA,
+    "rosters": ROSTERS_ARROW_SCHEMA,
+    "stats_crew_rosters": STATS_CREW_ROSTERS_ARROW_SCHEMA,
+    "negotiation_lists": NEGOTIATION_LISTS_ARROW_SCHEMA,
+    "player_crosswalk": PLAYER_CROSSWALK_ARROW_SCHEMA,
+}
+
+# The pandas dtypes of integer columns that can have missing values.
+NULLABLE_INT_DTYPES = {
+    pa.int8(): "Int8",
+    pa.int16(): "Int16",
+    pa.int32(): "Int32",
+    pa.int64(): "Int64",
+    pa.uint8(): "UInt8",
+    pa.uint16(): "UInt16",
+    pa.uint32(): "UInt32",
+    pa.uint64(): "UInt64",
+}
+
+
+def get_pandas_dtype(field: pa.Field):
+    """
+    Given a field of one of the schemas above,
+    return the pandas dtype of that column.
+
+    Parameters
+    ----------
+    `field` (pyarrow.Field, mandatory):
+        The field you want the pandas dtype of.
+
+    Returns
+    ----------
+    A pandas dtype. Integer and boolean columns that can have missing
+    values get the matching nullable dtype (`Int16`, `boolean`, etc.),
+    dictionary-encoded strings are `category`,
+    and every other string is `string`.
+    """
+    arrow_type = field.type
+
+    if pa.types.is_dictionary(arrow_type):
+        return "category"
+    elif pa.types.is_string(arrow_type) or pa.types.is_large_string(
+        arrow_type
+    ):
+        return "string"
+    elif pa.types.is_boolean(arrow_type):
+        return "boolean" if field.nullable else "bool"
+    elif pa.types.is_integer(arrow_type) and field.nullable:
+        return NULLABLE_INT_DTYPES[arrow_type]
+    elif pa.types.is_timestamp(arrow_type) and arrow_type.tz is not None:
+        return pd.DatetimeTZDtype(unit=arrow_type.unit, tz=arrow_type.tz)
+    return arrow_type.to_pandas_dtype()
+
+
+def _is_numeric_field(field: pa.Field) -> bool:
+    """ """
+    return pa.types.is_integer(field.type) or pa.types.is_floating(
+        field.type
+    )
+
+
+def _cast_column(column: str, values: pd.Series, field: pa.Field):
+    """
+    Convert one column of a `DataFrame` to the pandas dtype of `field`.
+    """
+    if not field.nullable and values.isna().any():
+        logging.warning(
+            f"`{column}` should never be missing, but it is in " +
+            f"{values.isna().sum()} rows."
+        )
+        field = field.with_nullable(True)
+    dtype = get_pandas_dtype(field)
+
+    try:
+        return values.astype(dtype)
+    except (TypeError, ValueError) as e:
+        error = e
+
+    try:
+        if _is_numeric_field(field):
+            # Numbers that were scraped as text, with blanks for zero rows.
+            return pd.to_numeric(
+                values.map(
+                    lambda x: None
+                    if isinstance(x, str) and len(x.strip()) == 0
+                    else x
+                )
+            ).astype(dtype)
+        elif pa.types.is_timestamp(field.type):
+            return pd.to_datetime(values, utc=True).astype(dtype)
+    except (TypeError, ValueError) as e:
+        error = e
+
+    logging.warning(
+        f"`{column}` could not be converted to `{dtype}`, " +
+        f"and was left as `{values.dtype}`: {error}"
+    )
+    return values
+
+
+def apply_schema(df: pd.DataFrame, schema: pa.Schema) -> pd.DataFrame:
+    """
+    Given a pandas `DataFrame` and the schema of its dataset,
+    return it with the pandas dtype of every column the schema declares.
+
+    Parameters
+    ----------
+    `df` (pandas.DataFrame, mandatory):
+        The data you want to convert.
+
+    `schema` (pyarrow.Schema, mandatory):
+        One of the schemas in `DATASET_SCHEMAS`.
+        Columns of `df` that `schema` does not declare are left as they are.
+
+    Returns
+    ----------
+    A pandas `DataFrame` with the same columns as `df`, in the same order.
+    """
+    return df.assign(
+        **{
+            str(column): _cast_column(
+                column,
+                df[column],
+                schema.field(column)
+            )
+            for column in df.columns
+            if column in schema.names
+        }
+    )
+
+
+def read_dataset(path: str, schema: pa.Schema, **kwargs) -> pd.DataFrame:
+    """
+    Load a dataset saved by this repository, with the dtypes of its schema.
+
+    Parameters
+    ----------
+    `path` (str, mandatory):
+        The `.csv` or `.parquet` file you want to load.
+
+    `schema` (pyarrow.Schema, mandatory):
+        One of the schemas in `DATASET_SCHEMAS`.
+
+    `**kwargs`:
+        Passed through to `pandas.read_csv()` or `pandas.read_parquet()`.
+
+    Returns
+    ----------
+    A pandas `DataFrame` with the contents of `path`.
+    """
+    if path.endswith(".parquet"):
+        return apply_schema(pd.read_parquet(path, **kwargs), schema)
+
+    # Columns are parsed straight into their dtypes,
+    # so pandas does not have to guess the type of each one first.
+    dtypes = {
+        field.name: get_pandas_dtype(field.with_nullable(True))
+        for field in schema
+        if not pa.types.is_timestamp(field.type)
+    }
+    try:
+        df = pd.read_csv(path, dtype=dtypes, **kwargs)
+    except (TypeError, ValueError):
+        df = pd.read_csv(path, low_memory=False, **kwargs)
+    return apply_schema(df, schema)
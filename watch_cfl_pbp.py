@@ -0,0 +1,312 @@
+import argparse
+import logging
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from fetch_engine import FetchEngine, fetch_all
+from get_cfl_pbp import (
+    fetch_cfl_pbp_json,
+    get_pbp_content_hash,
+    parse_cfl_pbp_json,
+)
+from get_schedules import (
+    IN_PROGRESS_EVENT_STATUSES,
+    PRE_GAME_EVENT_STATUS,
+    ScheduleProvider,
+)
+from pbp_dataset import PBP_SEASON_COLUMNS, write_pbp_game
+from player_ids import link_pbp_player_ids
+from roster_store import get_roster_store
+from schemas import PBP_ARROW_SCHEMA, apply_schema
+
+# How often (in seconds) the play-by-play data of a live game is polled.
+WATCH_POLL_INTERVAL = 20
+# How often (in seconds) the schedule is checked for games that started
+# or finished.
+WATCH_SCHEDULE_INTERVAL = 120
+# The longest (in seconds) watch mode sleeps when no game is live.
+WATCH_IDLE_INTERVAL = 900
+
+
+def get_live_games(schedule_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Given the schedule of a season, return every game in it
+    that is being played (see `IN_PROGRESS_EVENT_STATUSES`).
+    """
+    return schedule_df[
+        schedule_df["eventStatus_name"].isin(
+            IN_PROGRESS_EVENT_STATUSES
+        ).fillna(False)
+    ]
+
+
+def get_idle_sleep(
+    schedule_df: pd.DataFrame,
+    schedule_interval: float,
+    idle_interval: float
+) -> float:
+    """
+    Given the schedule of a season with no live games,
+    return how long (in seconds) to sleep before checking it again:
+    until the next game starts,
+    but never less than `schedule_interval`,
+    or more than `idle_interval`.
+    """
+    upcoming_df = schedule_df[
+        schedule_df["eventStatus_name"] == PRE_GAME_EVENT_STATUS
+    ]
+    if len(upcoming_df) == 0:
+        return idle_interval
+
+    next_start = upcoming_df["startDate"].min()
+    until_start = (next_start - pd.Timestamp.now(tz="UTC")).total_seconds()
+    return min(max(until_start, schedule_interval), idle_interval)
+
+
+async def fetch_live_cfl_pbp_json(
+    engine: FetchEngine,
+    fixture_id: int
+) -> list:
+    """
+    `fetch_cfl_pbp_json()` for a live game,
+    that returns `None` instead of raising if the game has no usable data,
+    so one game can not stop every other game from being polled.
+    """
+    try:
+        return await fetch_cfl_pbp_json(engine, fixture_id)
+    except Exception as e:
+        logging.warning(
+            f"\nUnhandled exception when downloading game ID {fixture_id} " +
+            f"`{e}`"
+        )
+        return None
+
+
+def poll_cfl_pbp_games(
+    season: int,
+    schedule_df: pd.DataFrame,
+    fixture_ids_arr: list,
+    engine: FetchEngine,
+    content_hashes: dict
+) -> int:
+    """
+    Download the play-by-play data of the given games,
+    and save every game that has new plays to the pbp dataset.
+
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The season of these games.
+
+    `schedule_df` (pandas.DataFrame, mandatory):
+        The schedule of this season.
+
+    `fixture_ids_arr` (list, mandatory):
+        The fixture ID of every game to poll.
+
+    `engine` (FetchEngine, mandatory):
+        The engine to download with.
+
+    `content_hashes` (dict, mandatory):
+        The content hash of the last download of each game,
+        keyed by fixture ID.
+        Games whose content did not change since then are not parsed,
+        and this `dict` is updated with every game that did.
+
+    Returns
+    ----------
+    How many games were saved.
+    """
+    schedule_df = schedule_df.set_index("fixtureId", drop=False)
+    written = 0
+
+    phases_json_arr = fetch_all(
+        fixture_ids_arr,
+        fetch_live_cfl_pbp_json,
+        engine
+    )
+
+    for fixture_id, phases_json in zip(fixture_ids_arr, phases_json_arr):
+        if phases_json is None:
+            continue
+        content_hash = get_pbp_content_hash(phases_json)
+        if content_hashes.get(fixture_id) == content_hash:
+            continue
+
+        game = schedule_df.loc[fixture_id]
+        try:
+            game_df = parse_cfl_pbp_json(phases_json, fixture_id)
+        except Exception as e:
+            logging.warning(
+                f"\nUnhandled exception when parsing game ID {fixture_id} " +
+                f"`{e}`"
+            )
+            continue
+
+        game_df["game_id"] = fixture_id
+        game_df["season_type"] = game["eventTypeName"]
+        game_df["week"] = game["week"]
+        game_df["season"] = season
+        # `order_sequence` is not saved to the pbp dataset
+        # (see `PBP_SEASON_COLUMNS`).
+        game_df = game_df.drop(columns=list(PBP_SEASON_COLUMNS))
+        game_df = link_pbp_player_ids(game_df, season)
+        game_df = apply_schema(game_df, PBP_ARROW_SCHEMA)
+
+        if write_pbp_game(game_df, season, game["week"], fixture_id):
+            written += 1
+            print(
+                f"Game ID {fixture_id} ({game['eventStatus_name']}): " +
+                f"{len(game_df)} plays saved."
+            )
+        content_hashes[fixture_id] = content_hash
+
+    return written
+
+
+def watch_cfl_pbp(
+    season: int,
+    poll_interval: float = WATCH_POLL_INTERVAL,
+    schedule_interval: float = WATCH_SCHEDULE_INTERVAL,
+    idle_interval: float = WATCH_IDLE_INTERVAL,
+    max_runtime: float = None
+) -> int:
+    """
+    Watch the games of a season as they are played,
+    and keep their play-by-play data in the pbp dataset up to date.
+
+    The schedule is checked every `schedule_interval` seconds,
+    and only the games whose `eventStatus_name` shows
+    that they are being played are polled, every `poll_interval` seconds.
+    A game is polled one last time once it is final.
+    When no game is being played,
+    nothing but the schedule is downloaded,
+    until the next game is about to start.
+
+    Live games are never read from or written to the response cache,
+    so every poll gets the latest plays.
+    The season play-by-play files are not updated;
+    the next run of `get_cfl_pbp.py` picks these games up.
+
+    Parameters
+    ----------
+    `season` (int, mandatory):
+        The season you want to watch.
+
+    `poll_interval` (float, optional):
+        How often (in seconds) the play-by-play data
+        of a live game is polled.
+
+    `schedule_interval` (float, optional):
+        How often (in seconds) the schedule is checked.
+
+    `idle_interval` (float, optional):
+        The longest (in seconds) to sleep when no game is live.
+
+    `max_runtime` (float, optional):
+        If set, stop after this many seconds.
+        If not set, watch until interrupted.
+
+    Returns
+    ----------
+    How many times a game was saved to the pbp dataset.
+    """
+    provider = ScheduleProvider(
+        ttl=schedule_interval,
+        memory_ttl=schedule_interval
+    )
+    engine = FetchEngine(use_cache=False)
+    content_hashes = {}
+    live_ids = set()
+    written = 0
+    started_at = time.time()
+
+    while max_runtime is None or time.time() - started_at < max_runtime:
+        schedule_df = provider.get(season)
+        now_live_ids = set(get_live_games(schedule_df)["fixtureId"].to_list())
+        # Games that finished since the last poll are polled one last time,
+        # so their final plays are saved too.
+        poll_ids_arr = sorted(now_live_ids | live_ids)
+        live_ids = now_live_ids
+
+        if len(poll_ids_arr) > 0:
+            logging.info(f"Polling {len(poll_ids_arr)} live games.")
+            written += poll_cfl_pbp_games(
+                season,
+                schedule_df,
+                poll_ids_arr,
+                engine,
+                content_hashes
+            )
+            sleep_time = poll_interval
+        else:
+            sleep_time = get_idle_sleep(
+                schedule_df,
+                schedule_interval,
+                idle_interval
+            )
+            logging.info(
+                f"No live games, checking again in {sleep_time:.0f} seconds."
+            )
+
+        if max_runtime is not None:
+            sleep_time = min(
+                sleep_time,
+                max_runtime - (time.time() - started_at)
+            )
+        time.sleep(max(sleep_time, 0))
+
+    return written
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(
+        description=(
+            "Keep the play-by-play data of live CFL games up to date, " +
+            "as they are played."
+        )
+    )
+    arg_parser.add_argument("--season", type=int, default=None)
+    arg_parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=WATCH_POLL_INTERVAL,
+        help="How often (in seconds) to poll each live game."
+    )
+    arg_parser.add_argument(
+        "--schedule-interval",
+        type=float,
+        default=WATCH_SCHEDULE_INTERVAL,
+        help="How often (in seconds) to check the schedule."
+    )
+    arg_parser.add_argument(
+        "--idle-interval",
+        type=float,
+        default=WATCH_IDLE_INTERVAL,
+        help="The longest (in seconds) to sleep when no game is live."
+    )
+    arg_parser.add_argument(
+        "--max-runtime",
+        type=float,
+        default=None,
+        help="Stop after this many seconds."
+    )
+    args = arg_parser.parse_args()
+
+    now = datetime.now()
+    season = now.year
+
+    if now.month < 5:
+        season -= 1
+
+    season = args.season or season
+    get_roster_store().refresh_if_due(season)
+    watch_cfl_pbp(
+        season=season,
+        poll_interval=args.poll_interval,
+        schedule_interval=args.schedule_interval,
+        idle_interval=args.idle_interval,
+        max_runtime=args.max_runtime
+    )